@@ -36,6 +36,44 @@ class ICNData(Iterable):
         'k',
     ]
 
+    _column_getters = {
+        'Name': 'CNData_Get_Name',
+        'idx': 'CNData_Get_idx',
+        'NormAmps': 'CNData_Get_NormAmps',
+        'EmergAmps': 'CNData_Get_EmergAmps',
+        'Rdc': 'CNData_Get_Rdc',
+        'Rac': 'CNData_Get_Rac',
+        'GMRac': 'CNData_Get_GMRac',
+        'Radius': 'CNData_Get_Radius',
+        'Diameter': 'CNData_Get_Diameter',
+        'EpsR': 'CNData_Get_EpsR',
+        'InsLayer': 'CNData_Get_InsLayer',
+        'DiaIns': 'CNData_Get_DiaIns',
+        'DiaCable': 'CNData_Get_DiaCable',
+        'DiaStrand': 'CNData_Get_DiaStrand',
+        'RStrand': 'CNData_Get_RStrand',
+        'k': 'CNData_Get_k',
+    }
+
+    _column_setters = {
+        'EmergAmps': 'CNData_Set_EmergAmps',
+        'NormAmps': 'CNData_Set_NormAmps',
+        'Rdc': 'CNData_Set_Rdc',
+        'Rac': 'CNData_Set_Rac',
+        'GMRac': 'CNData_Set_GMRac',
+        'GMRUnits': 'CNData_Set_GMRUnits',
+        'Radius': 'CNData_Set_Radius',
+        'Diameter': 'CNData_Set_Diameter',
+        'EpsR': 'CNData_Set_EpsR',
+        'InsLayer': 'CNData_Set_InsLayer',
+        'DiaIns': 'CNData_Set_DiaIns',
+        'DiaCable': 'CNData_Set_DiaCable',
+        'k': 'CNData_Set_k',
+        'DiaStrand': 'CNData_Set_DiaStrand',
+        'GmrStrand': 'CNData_Set_GmrStrand',
+        'RStrand': 'CNData_Set_RStrand',
+    }
+
     @property
     def EmergAmps(self) -> float:
         '''Emergency ampere rating'''
@@ -27,6 +27,37 @@ class ICapControls(Iterable):
         'ONSetting',
     ]
 
+    _column_getters = {
+        'Name': 'CapControls_Get_Name',
+        'idx': 'CapControls_Get_idx',
+        'Capacitor': 'CapControls_Get_Capacitor',
+        'CTratio': 'CapControls_Get_CTratio',
+        'PTratio': 'CapControls_Get_PTratio',
+        'DeadTime': 'CapControls_Get_DeadTime',
+        'Delay': 'CapControls_Get_Delay',
+        'DelayOff': 'CapControls_Get_DelayOff',
+        'Vmin': 'CapControls_Get_Vmin',
+        'Vmax': 'CapControls_Get_Vmax',
+        'UseVoltOverride': 'CapControls_Get_UseVoltOverride',
+        'MonitoredTerm': 'CapControls_Get_MonitoredTerm',
+        'OFFSetting': 'CapControls_Get_OFFSetting',
+        'ONSetting': 'CapControls_Get_ONSetting',
+    }
+
+    _column_setters = {
+        'CTratio': 'CapControls_Set_CTratio',
+        'DeadTime': 'CapControls_Set_DeadTime',
+        'Delay': 'CapControls_Set_Delay',
+        'DelayOff': 'CapControls_Set_DelayOff',
+        'MonitoredTerm': 'CapControls_Set_MonitoredTerm',
+        'OFFSetting': 'CapControls_Set_OFFSetting',
+        'ONSetting': 'CapControls_Set_ONSetting',
+        'PTratio': 'CapControls_Set_PTratio',
+        'UseVoltOverride': 'CapControls_Set_UseVoltOverride',
+        'Vmax': 'CapControls_Set_Vmax',
+        'Vmin': 'CapControls_Set_Vmin',
+    }
+
     def Reset(self):
         '''
         Force a reset of this CapControl.
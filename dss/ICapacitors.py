@@ -19,6 +19,22 @@ class ICapacitors(Iterable):
         'kvar',
     ]
 
+    _column_getters = {
+        'Name': 'Capacitors_Get_Name',
+        'idx': 'Capacitors_Get_idx',
+        'kV': 'Capacitors_Get_kV',
+        'NumSteps': 'Capacitors_Get_NumSteps',
+        'AvailableSteps': 'Capacitors_Get_AvailableSteps',
+        'IsDelta': 'Capacitors_Get_IsDelta',
+        'kvar': 'Capacitors_Get_kvar',
+    }
+
+    _column_setters = {
+        'IsDelta': 'Capacitors_Set_IsDelta',
+        'NumSteps': 'Capacitors_Set_NumSteps',
+        'kvar': 'Capacitors_Set_kvar',
+    }
+
     def AddStep(self) -> bool:
         return self._check_for_error(self._lib.Capacitors_AddStep()) != 0
 
@@ -1,9 +1,12 @@
 # A compatibility layer for DSS C-API that mimics the official OpenDSS COM interface.
 # Copyright (c) 2016-2024 Paulo Meira
 # Copyright (c) 2018-2024 DSS-Extensions contributors
-from typing import List, AnyStr, Union
+from typing import Any, Dict, Iterable, List, AnyStr, Mapping, Tuple, Union
 import json
-from ._cffi_api_util import Base
+import re
+from itertools import repeat
+import numpy as np
+from ._cffi_api_util import Base, LazyInterface, _not_odd, _setattr_existing
 
 from .IBus import IBus
 from .ICktElement import ICktElement
@@ -45,57 +48,19 @@ from .IParallel import IParallel
 from .IReduceCkt import IReduceCkt
 from .IStorages import IStorages
 from .IGICSources import IGICSources
+from .IText import IText
 
 from ._types import Float64Array, Int32Array, Float64ArrayOrComplexArray, Float64ArrayOrSimpleComplex
 from .enums import DSSJSONFlags, DSSSaveFlags
 
+# Characters that cannot be part of an object name in a `new` command
+_INVALID_NAME_RE = re.compile(r'[\s."\']')
+
 class ICircuit(Base):
     __slots__ = [
-        'Buses',
-        'CktElements',
-        'ActiveElement',
-        'Solution',
-        'ActiveBus',
-        'Generators',
-        'Meters',
-        'Monitors',
-        'Settings',
-        'Lines',
-        'CtrlQueue',
-        'Loads',
-        'ActiveCktElement',
-        'ActiveDSSElement',
-        'ActiveClass',
-        'CapControls',
-        'RegControls',
-        'SwtControls',
-        'Transformers',
-        'Capacitors',
-        'Topology',
-        'Sensors',
-        'XYCurves',
-        'PDElements',
-        'Reclosers',
-        'Relays',
-        'LoadShapes',
-        'Fuses',
-        'Isources',
-        'ISources',
-        'DSSim_Coms',
-        'PVSystems',
-        'Vsources',
-        'LineCodes',
-        'LineGeometries',
-        'LineSpacings',
-        'WireData',
-        'CNData',
-        'TSData',
-        'Reactors',
-        'Parallel',
-        'ReduceCkt',
-        'Storages',
-        'GICSources',
+        '__dict__', # for the sub-interfaces, see LazyInterface
     ]
+    __setattr__ = _setattr_existing
 
     _columns = [
         'Name',
@@ -123,106 +88,52 @@ class ICircuit(Base):
         'TotalPower',
     ]
    
-    Buses: IBus
-    CktElements: ICktElement
-    ActiveElement: ICktElement
-    Solution: ISolution
-    ActiveBus: IBus
-    Generators: IGenerators
-    Meters: IMeters
-    Monitors: IMonitors
-    Settings: ISettings
-    Lines: ILines
-    CtrlQueue: ICtrlQueue
-    Loads: ILoads
-    ActiveCktElement: ICktElement
-    ActiveDSSElement: IDSSElement
-    ActiveClass: IActiveClass
-    CapControls: ICapControls
-    RegControls: IRegControls
-    SwtControls: ISwtControls
-    Transformers: ITransformers
-    Capacitors: ICapacitors
-    Topology: ITopology
-    Sensors: ISensors
-    XYCurves: IXYCurves
-    PDElements: IPDElements
-    Reclosers: IReclosers
-    Relays: IRelays
-    LoadShapes: ILoadShapes
-    Fuses: IFuses
-    Isources: IISources
-    ISources: IISources
-    DSSim_Coms: IDSSimComs
-    PVSystems: IPVSystems
-    Vsources: IVsources
-    LineCodes: ILineCodes
-    LineGeometries: ILineGeometries
-    LineSpacings: ILineSpacings
-    WireData: IWireData
-    CNData: ICNData
-    TSData: ITSData
-    Reactors: IReactors
-    ReduceCkt: IReduceCkt
-    Storages: IStorages
-    GICSources: IGICSources
-    Parallel: IParallel
-
-    def __init__(self, api_util):
-        self.Buses = IBus(api_util)
-        self.CktElements = ICktElement(api_util)
-        self.ActiveElement = ICktElement(api_util)
-        self.Solution = ISolution(api_util)
-        self.ActiveBus = IBus(api_util)
-        self.Generators = IGenerators(api_util)
-        self.Meters = IMeters(api_util)
-        self.Monitors = IMonitors(api_util)
-        self.Settings = ISettings(api_util)
-        self.Lines = ILines(api_util)
-        self.CtrlQueue = ICtrlQueue(api_util)
-        self.Loads = ILoads(api_util)
-        self.ActiveCktElement = ICktElement(api_util)
-        self.ActiveDSSElement = IDSSElement(api_util)
-        self.ActiveClass = IActiveClass(api_util)
-        self.CapControls = ICapControls(api_util)
-        self.RegControls = IRegControls(api_util)
-        self.SwtControls = ISwtControls(api_util)
-        self.Transformers = ITransformers(api_util)
-        self.Capacitors = ICapacitors(api_util)
-        self.Topology = ITopology(api_util)
-        self.Sensors = ISensors(api_util)
-        self.XYCurves = IXYCurves(api_util)
-        self.PDElements = IPDElements(api_util)
-        self.Reclosers = IReclosers(api_util)
-        self.Relays = IRelays(api_util)
-        self.LoadShapes = ILoadShapes(api_util)
-        self.Fuses = IFuses(api_util)
-
-        Isources = IISources(api_util)
-        object.__setattr__(self, 'Isources', Isources)
-        object.__setattr__(self, 'ISources', Isources)
-
-        self.DSSim_Coms = IDSSimComs(api_util)
-        self.PVSystems = IPVSystems(api_util)
-        self.Vsources = IVsources(api_util)
-        self.LineCodes = ILineCodes(api_util)
-        self.LineGeometries = ILineGeometries(api_util) if not api_util._is_odd else None
-        self.LineSpacings = ILineSpacings(api_util) if not api_util._is_odd else None
-        self.WireData = IWireData(api_util) if not api_util._is_odd else None
-        self.CNData = ICNData(api_util) if not api_util._is_odd else None
-        self.TSData = ITSData(api_util) if not api_util._is_odd else None
-        self.Reactors = IReactors(api_util) if not api_util._is_odd else None
-        self.ReduceCkt = IReduceCkt(api_util) #: Circuit Reduction Interface
-        self.Storages = IStorages(api_util) if not api_util._is_odd else None
-        self.GICSources = IGICSources(api_util)
-
-        if hasattr(api_util.lib, 'Parallel_CreateActor'):
-            self.Parallel = IParallel(api_util)
-        else:
-            self.Parallel = None
-            
-        Base.__init__(self, api_util)
-            
+    Buses = LazyInterface(IBus)
+    CktElements = LazyInterface(ICktElement)
+    ActiveElement = LazyInterface(ICktElement)
+    Solution = LazyInterface(ISolution)
+    ActiveBus = LazyInterface(IBus)
+    Generators = LazyInterface(IGenerators)
+    Meters = LazyInterface(IMeters)
+    Monitors = LazyInterface(IMonitors)
+    Settings = LazyInterface(ISettings)
+    Lines = LazyInterface(ILines)
+    CtrlQueue = LazyInterface(ICtrlQueue)
+    Loads = LazyInterface(ILoads)
+    ActiveCktElement = LazyInterface(ICktElement)
+    ActiveDSSElement = LazyInterface(IDSSElement)
+    ActiveClass = LazyInterface(IActiveClass)
+    CapControls = LazyInterface(ICapControls)
+    RegControls = LazyInterface(IRegControls)
+    SwtControls = LazyInterface(ISwtControls)
+    Transformers = LazyInterface(ITransformers)
+    Capacitors = LazyInterface(ICapacitors)
+    Topology = LazyInterface(ITopology)
+    Sensors = LazyInterface(ISensors)
+    XYCurves = LazyInterface(IXYCurves)
+    PDElements = LazyInterface(IPDElements)
+    Reclosers = LazyInterface(IReclosers)
+    Relays = LazyInterface(IRelays)
+    LoadShapes = LazyInterface(ILoadShapes)
+    Fuses = LazyInterface(IFuses)
+    Isources = LazyInterface(IISources)
+    ISources = Isources
+    DSSim_Coms = LazyInterface(IDSSimComs)
+    PVSystems = LazyInterface(IPVSystems)
+    Vsources = LazyInterface(IVsources)
+    LineCodes = LazyInterface(ILineCodes)
+    LineGeometries = LazyInterface(ILineGeometries, _not_odd)
+    LineSpacings = LazyInterface(ILineSpacings, _not_odd)
+    WireData = LazyInterface(IWireData, _not_odd)
+    CNData = LazyInterface(ICNData, _not_odd)
+    TSData = LazyInterface(ITSData, _not_odd)
+    Reactors = LazyInterface(IReactors, _not_odd)
+    ReduceCkt = LazyInterface(IReduceCkt) #: Circuit Reduction Interface
+    Storages = LazyInterface(IStorages, _not_odd)
+    GICSources = LazyInterface(IGICSources)
+    Parallel = LazyInterface(IParallel, lambda api_util: hasattr(api_util.lib, 'Parallel_CreateActor'))
+    _text = LazyInterface(IText) # for bulk_new
+
     def Capacity(self, Start: float, Increment: float) -> float:
         '''
         Compute the maximum load the active circuit can serve in the PRESENT YEAR.
@@ -436,9 +347,11 @@ class ICircuit(Base):
         '''
         Array of strings containing names of all buses in circuit (see AllNodeNames).
 
+        If `CachedNameLists` is enabled, an immutable tuple is returned instead.
+
         Original COM help: https://opendss.epri.com/AllBusNames.html
         '''
-        return self._check_for_error(self._get_string_array(self._lib.Circuit_Get_AllBusNames))
+        return self._get_name_list('AllBusNames', self._lib.Circuit_Get_NumBuses, self._lib.Circuit_Get_AllBusNames)
 
     @property
     def AllBusVmag(self) -> Float64Array:
@@ -485,9 +398,11 @@ class ICircuit(Base):
         '''
         Array of strings containing Full Name of all elements.
 
+        If `CachedNameLists` is enabled, an immutable tuple is returned instead.
+
         Original COM help: https://opendss.epri.com/AllElementNames.html
         '''
-        return self._check_for_error(self._get_string_array(self._lib.Circuit_Get_AllElementNames))
+        return self._get_name_list('AllElementNames', self._lib.Circuit_Get_NumCktElements, self._lib.Circuit_Get_AllElementNames)
 
     @property
     def AllNodeDistances(self) -> Float64Array:
@@ -504,9 +419,11 @@ class ICircuit(Base):
         '''
         Array of strings containing full name of each node in system in same order as returned by AllBusVolts, etc.
 
+        If `CachedNameLists` is enabled, an immutable tuple is returned instead.
+
         Original COM help: https://opendss.epri.com/AllNodeNames.html
         '''
-        return self._check_for_error(self._get_string_array(self._lib.Circuit_Get_AllNodeNames))
+        return self._get_name_list('AllNodeNames', self._lib.Circuit_Get_NumNodes, self._lib.Circuit_Get_AllNodeNames)
 
     @property
     def LineLosses(self) -> Float64ArrayOrSimpleComplex:
@@ -616,9 +533,11 @@ class ICircuit(Base):
         '''
         Array of strings containing the names of the nodes in the same order as the Y matrix
 
+        If `CachedNameLists` is enabled, an immutable tuple is returned instead.
+
         Original COM help: https://opendss.epri.com/YNodeOrder.html
         '''
-        return self._check_for_error(self._get_string_array(self._lib.Circuit_Get_YNodeOrder))
+        return self._get_name_list('YNodeOrder', self._lib.Circuit_Get_NumNodes, self._lib.Circuit_Get_YNodeOrder)
 
     @property
     def YNodeVarray(self) -> Float64ArrayOrComplexArray:
@@ -630,6 +549,80 @@ class ICircuit(Base):
         self._check_for_error(self._lib.Circuit_Get_YNodeVarray_GR())
         return self._get_complex128_gr_array()
 
+    @staticmethod
+    def _build_element_lookup(names: List[str]) -> Dict[str, Tuple[str, int]]:
+        class_counts = {}
+        res = {}
+        for name in names:
+            cls_name = name.split('.', 1)[0]
+            idx = class_counts.get(cls_name, 0) + 1
+            class_counts[cls_name] = idx
+            res[name.lower()] = (cls_name, idx)
+
+        return res
+
+    @property
+    def BusNameToIndex(self) -> Mapping[str, int]:
+        '''
+        Read-only mapping of the bus names to the bus indices (0-based), compatible with `AllBusNames`,
+        `AllBusDistances`, `SetActiveBusi` and the `Buses` collection.
+
+        The mapping is built on first use and reused until the circuit is cleared or the bus list is rebuilt.
+
+        **(API Extension)**
+        '''
+        return self._get_lookup(
+            'BusNameToIndex', 'AllBusNames', self._lib.Circuit_Get_NumBuses, self._lib.Circuit_Get_AllBusNames,
+            lambda names: {name: idx for idx, name in enumerate(names)}
+        )
+
+    @property
+    def NodeNameToIndex(self) -> Mapping[str, int]:
+        '''
+        Read-only mapping of the node names ("bus.node", lowercase) to the node indices (0-based), compatible with
+        `AllNodeNames`, `AllBusVmag`, `AllBusVmagPu`, `AllBusVolts` and `AllNodeDistances`.
+
+        The mapping is built on first use and reused until the circuit is cleared or the bus list is rebuilt.
+
+        **(API Extension)**
+        '''
+        return self._get_lookup(
+            'NodeNameToIndex', 'AllNodeNames', self._lib.Circuit_Get_NumNodes, self._lib.Circuit_Get_AllNodeNames,
+            lambda names: {name: idx for idx, name in enumerate(names)}
+        )
+
+    @property
+    def YNodeNameToIndex(self) -> Mapping[str, int]:
+        '''
+        Read-only mapping of the node names ("bus.node", lowercase) to the indices (0-based) in the system Y
+        matrix order, compatible with `YNodeOrder`, `YNodeVarray` and `YCurrents`.
+
+        The mapping is built on first use and reused until the circuit is cleared or the bus list is rebuilt.
+
+        **(API Extension)**
+        '''
+        return self._get_lookup(
+            'YNodeNameToIndex', 'YNodeOrder', self._lib.Circuit_Get_NumNodes, self._lib.Circuit_Get_YNodeOrder,
+            lambda names: {name.lower(): idx for idx, name in enumerate(names)}
+        )
+
+    @property
+    def ElementNameToIndex(self) -> Mapping[str, Tuple[str, int]]:
+        '''
+        Read-only mapping of the full names of the circuit elements ("class.name", lowercase) to tuples of
+        the class name and the element index in its class (1-based, compatible with the `idx` property 
+        of the element collections, e.g. `Loads.idx`).
+
+        The mapping is built on first use and reused until the circuit is cleared, the bus list is rebuilt,
+        or the number of circuit elements changes.
+
+        **(API Extension)**
+        '''
+        return self._get_lookup(
+            'ElementNameToIndex', 'AllElementNames', self._lib.Circuit_Get_NumCktElements, self._lib.Circuit_Get_AllElementNames,
+            self._build_element_lookup
+        )
+
     def ElementLosses(self, Value: Int32Array) -> Float64ArrayOrComplexArray:
         '''
         Array of total losses (complex) in a selection of elements.
@@ -655,6 +648,88 @@ class ICircuit(Base):
         '''
         return self._get_string(self._check_for_error(self._lib.Circuit_ToJSON(options)))
 
+    @staticmethod
+    def _format_dss_value(value: Any) -> str:
+        if isinstance(value, np.ndarray) and value.ndim == 0:
+            value = value.item()
+
+        if isinstance(value, str):
+            if not value or any(c in value for c in ' \t=,()[]{}"\''):
+                return f"'{value}'" if '"' in value else f'"{value}"'
+
+            return value
+
+        if isinstance(value, (bool, np.bool_)):
+            return 'true' if value else 'false'
+
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return '[' + ' '.join(ICircuit._format_dss_value(v) for v in (value.tolist() if isinstance(value, np.ndarray) else value)) + ']'
+
+        if isinstance(value, np.generic):
+            value = value.item()
+
+        return repr(value) if isinstance(value, float) else str(value)
+
+    def bulk_new(self, cls_name: str, names: Iterable[str], chunk_size: int = 5000, **props) -> int:
+        '''
+        Creates new DSS objects of the class `cls_name` (e.g. `"Load"`) in bulk, one for each
+        name in `names`, setting the DSS properties from `props`. Each property value can be
+        either a scalar, used for all objects, or a sequence/array (e.g. a list, NumPy array 
+        or pandas Series), with one value per object. A row value that is a list or array is
+        passed as a DSS array.
+
+        The DSS commands are generated column-wise and fed to the engine through 
+        `Text.CommandStream`, in chunks of `chunk_size` objects, instead of one API call
+        per object.
+
+            circ.bulk_new('Load', df['name'], bus1=df['bus'], kV=12.47, kW=df['kw'], kvar=df['kvar'])
+
+        Note that the properties are set in the order given, as in a `new` command.
+        Names are validated before any object is created: a ValueError is raised for empty
+        names and names containing whitespace, dots or quotes.
+
+        Returns the number of objects created.
+
+        **(API Extension)**
+        '''
+        if isinstance(names, str):
+            raise TypeError('names must be a sequence of strings')
+
+        names = [str(name) for name in names]
+        for name in names:
+            if not name or _INVALID_NAME_RE.search(name):
+                raise ValueError(f'Invalid object name: "{name}".')
+
+        num_objects = len(names)
+        prefix = f'new {cls_name}.'
+        columns = [[prefix + name for name in names]]
+        format_value = self._format_dss_value
+        for prop, value in props.items():
+            if isinstance(value, (str, bytes, int, float, bool, np.generic)):
+                if isinstance(value, bytes):
+                    value = value.decode(self._api_util.codec)
+
+                columns.append(repeat(f'{prop}={format_value(value)}', num_objects))
+                continue
+
+            if not isinstance(value, (list, tuple)):
+                value = np.asarray(value)
+                if value.ndim == 0:
+                    columns.append(repeat(f'{prop}={format_value(value)}', num_objects))
+                    continue
+
+            if len(value) != num_objects:
+                raise ValueError(f'Property "{prop}": expected {num_objects} values, got {len(value)}.')
+
+            key = prop + '='
+            if isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype.kind in 'iuf':
+                # Common case, numeric columns
+                columns.append([key + repr(v) for v in value.tolist()])
+            else:
+                columns.append([key + format_value(v) for v in value])
+
+        return self._text.CommandStream(map(' '.join, zip(*columns)), chunk_size=chunk_size)
+
     def FromJSON(self, data: Union[AnyStr, dict], options: DSSJSONFlags = 0):
         '''
         Replaces the circuit, if any, with the one provided from a JSON-encoded string.
@@ -2,10 +2,12 @@
 # Copyright (c) 2016-2024 Paulo Meira
 # Copyright (c) 2018-2024 DSS-Extensions contributors
 from __future__ import annotations
+import os
 import warnings
+from contextlib import contextmanager
 from weakref import WeakKeyDictionary
 from typing import Any, List, Union, AnyStr, TYPE_CHECKING
-from ._cffi_api_util import Base, CffiApiUtil, DSSException
+from ._cffi_api_util import Base, CffiApiUtil, DSSException, LazyInterface, _not_odd, _setattr_existing
 from .ICircuit import ICircuit
 from .IError import IError
 from .IText import IText
@@ -17,6 +19,8 @@ from .IParser import IParser
 from .IDSSimComs import IDSSimComs
 from .IYMatrix import IYMatrix
 from .IZIP import IZIP
+from .enums import DSSSaveFlags
+from . import _compile_cache
 
 if TYPE_CHECKING:
     try:
@@ -37,21 +41,11 @@ class IDSS(Base):
     This main class also includes some global settings. See more settings in `ActiveCircuit.Settings`.
     '''
     __slots__ = [
-        'ActiveCircuit',
-        'Circuits',
-        'Error',
-        'Text',
-        'DSSProgress',
-        'ActiveClass',
-        'Executive',
-        'Events',
-        'Parser',
-        'DSSim_Coms',
-        'YMatrix',
-        'ZIP',
+        '__dict__', # for the sub-interfaces, see LazyInterface
         '_version',
         '_altdss',
     ]
+    __setattr__ = _setattr_existing
     
     _columns = [
         'Version', 
@@ -66,18 +60,54 @@ class IDSS(Base):
 
     _ctx_to_dss = WeakKeyDictionary()
 
-    ActiveCircuit: ICircuit
-    Circuits: ICircuit
-    Error: IError
-    Text: IText
-    DSSProgress: IDSSProgress
-    ActiveClass: IActiveClass
-    Executive: IDSS_Executive
-    Events: IDSSEvents
-    Parser: IParser
-    DSSim_Coms: IDSSimComs
-    YMatrix: IYMatrix
-    ZIP: IZIP
+    #: Provides access to the circuit attributes and objects in general.
+    ActiveCircuit = LazyInterface(ICircuit)
+    
+    #: Kept for compatibility. Currently it is an alias to ActiveCircuit.
+    Circuits = ActiveCircuit
+    
+    #: The Error interface provides the current error state and messages. In DSS-Python
+    #: and DSS-Extensions in general, this is already mapped to exceptions, so the user
+    #: typically does not need to worry about this.
+    Error = LazyInterface(IError)
+    
+    #: Provides access to command
+    Text = LazyInterface(IText)
+
+    #: Kept for compatibility. Controls the progress dialog/output, if available.
+    DSSProgress = LazyInterface(IDSSProgress)
+
+    #: General information about the current active DSS class.
+    ActiveClass = LazyInterface(IActiveClass)
+    
+    #: Access to the list of available commands and options, including help text.
+    Executive = LazyInterface(IDSS_Executive)
+    
+    #: Kept for compatibility.
+    Events = LazyInterface(IDSSEvents, _not_odd)
+    
+    #: Kept for compatibility.
+    Parser = LazyInterface(IParser)
+    
+    #: Kept for compatibility. Apparently was used for DSSim-PC (now OpenDSS-G), a 
+    #: closed-source software developed by EPRI using LabView.
+    DSSim_Coms = LazyInterface(IDSSimComs, _not_odd)
+    
+    #: The YMatrix interface provides advanced access to the internals of
+    #: the DSS engine. The sparse admittance matrix of the system is also 
+    #: available here.
+    #: 
+    #: The original OpenDSSDirect.DLL had some `YMatrix_*` functions, but we 
+    #: add a lot more here.
+    #: 
+    #: **(API Extension)**
+    YMatrix = LazyInterface(IYMatrix)
+    
+    #: The ZIP interface provides functions to open compressed ZIP packages
+    #: and run scripts inside the ZIP, without creating extra files on disk.
+    #: 
+    #: **(API Extension)**
+    ZIP = LazyInterface(IZIP, _not_odd)
 
     @classmethod
     def _get_instance(cls: IDSS, api_util: CffiApiUtil = None, ctx=None) -> IDSS:
@@ -108,57 +138,7 @@ class IDSS(Base):
 
         self._version = None
 
-        #: Provides access to the circuit attributes and objects in general.
-        self.ActiveCircuit = ICircuit(api_util)
-        
-        #: Kept for compatibility. Currently it is an alias to ActiveCircuit.
-        self.Circuits = ICircuit(api_util)
-        
-        #: The Error interface provides the current error state and messages. In DSS-Python
-        #: and DSS-Extensions in general, this is already mapped to exceptions, so the user
-        #: typically does not need to worry about this.
-        self.Error = IError(api_util)
-        
-        #: Provides access to command
-        self.Text = IText(api_util)
-
-        # self.NewCircuit = ICircuit(api_util)
-
-        #: Kept for compatibility. Controls the progress dialog/output, if available.
-        self.DSSProgress = IDSSProgress(api_util)
-
-        #: General information about the current active DSS class.
-        self.ActiveClass = IActiveClass(api_util)
-        
-        #: Access to the list of available commands and options, including help text.
-        self.Executive = IDSS_Executive(api_util)
-        
-        #: Kept for compatibility.
-        self.Events = IDSSEvents(api_util) if not api_util._is_odd else None
-        
-        #: Kept for compatibility.
-        self.Parser = IParser(api_util)
-        
-        #: Kept for compatibility. Apparently was used for DSSim-PC (now OpenDSS-G), a 
-        #: closed-source software developed by EPRI using LabView.
-        self.DSSim_Coms = IDSSimComs(api_util) if not api_util._is_odd else None
-        
-        #: The YMatrix interface provides advanced access to the internals of
-        #: the DSS engine. The sparse admittance matrix of the system is also 
-        #: available here.
-        #: 
-        #: The original OpenDSSDirect.DLL had some `YMatrix_*` functions, but we 
-        #: add a lot more here.
-        #: 
-        #: **(API Extension)**
-        self.YMatrix = IYMatrix(api_util)
-        
-        #: The ZIP interface provides functions to open compressed ZIP packages
-        #: and run scripts inside the ZIP, without creating extra files on disk.
-        #: 
-        #: **(API Extension)**
-        self.ZIP = IZIP(api_util) if not api_util._is_odd else None
-
+        # The sub-interfaces (ActiveCircuit, Text, etc.) are created on first access
         Base.__init__(self, api_util)    
 
     @property
@@ -527,6 +507,182 @@ class IDSS(Base):
         self._check_for_error(self._lib.DSS_Set_EnableArrayDimensions(Value))
         self._api_util._allow_complex = bool(Value)
 
+    @property
+    def BorrowedGRArrays(self) -> bool:
+        '''
+        When enabled, the array getters based on the global result (GR) buffers, like `ActiveCircuit.AllBusVmagPu`,
+        `ActiveCircuit.YNodeVarray` or `PDElements.AllPowers`, return read-only NumPy views (`GRView`) over the 
+        GR buffers instead of copies. This avoids an allocation and a memory copy per call, which can be 
+        significant in tight loops on large circuits.
+
+        **The data of a view is only valid until the next GR call in the same DSS context.** The next call may 
+        overwrite or even reallocate the buffer. Check `GRView.valid` if unsure, and use `copy()` to keep the 
+        values. Getters that return lists or scalars are not affected.
+
+        This is a per DSS Context setting. See also `borrowed_gr_arrays()` to enable it only for a block of code.
+
+        *Defaults to **False**.*
+
+        **(API Extension)**
+        '''
+        return self._api_util._borrow_gr
+
+    @BorrowedGRArrays.setter
+    def BorrowedGRArrays(self, Value: bool):
+        self._api_util._borrow_gr = bool(Value)
+
+    @contextmanager
+    def borrowed_gr_arrays(self):
+        '''
+        Context manager that enables `BorrowedGRArrays` for the duration of the `with` block,
+        restoring the previous state afterwards.
+
+        Example:
+
+            voltages = np.empty((num_steps, DSS.ActiveCircuit.NumNodes))
+            with DSS.borrowed_gr_arrays():
+                for step in range(num_steps):
+                    DSS.ActiveCircuit.Solution.Solve()
+                    voltages[step] = DSS.ActiveCircuit.AllBusVmagPu
+
+        **(API Extension)**
+        '''
+        api_util = self._api_util
+        previous = api_util._borrow_gr
+        api_util._borrow_gr = True
+        try:
+            yield self
+        finally:
+            api_util._borrow_gr = previous
+
+    @contextmanager
+    def deferred_errors(self):
+        '''
+        Context manager that defers the error checks of this DSS Context to the end of the `with` block.
+        Inside the block, the API calls skip the usual check for errors from the DSS engine; when the
+        block exits, the error state is checked once and a `DSSException` is raised if any error happened.
+
+        This reduces the overhead of tight loops that call the API many times, e.g. reading properties of
+        many circuit elements. Since the loop is not interrupted, note that the values returned after an error
+        may be invalid. As in the engine, if more than one error happens, only the latest one is reported.
+
+        Example:
+
+            with DSS.deferred_errors():
+                for name in names:
+                    circ.SetActiveElement(name)
+                    results.append((elem.NumPhases, elem.Enabled, elem.Name))
+
+        Blocks can be nested; only the outermost block checks for errors.
+
+        **(API Extension)**
+        '''
+        api_util = self._api_util
+        if api_util._deferred_errors == 0:
+            # Interfaces created inside the block also pick this up, from `_check_ptr`
+            no_errors = [0]
+            api_util._check_ptr = no_errors
+            for obj in list(api_util._interfaces):
+                object.__setattr__(obj, '_errorPtr', no_errors)
+
+        api_util._deferred_errors += 1
+        try:
+            yield self
+        finally:
+            api_util._deferred_errors -= 1
+            if api_util._deferred_errors == 0:
+                errorPtr = api_util._check_ptr = api_util._errorPtr
+                for obj in list(api_util._interfaces):
+                    object.__setattr__(obj, '_errorPtr', errorPtr)
+
+        if api_util._deferred_errors == 0:
+            self._check_for_error()
+
+    #: Flags used by `compile_cached` to save the circuit snapshots
+    _compile_cache_flags = (
+        DSSSaveFlags.SingleFile | DSSSaveFlags.ToString | DSSSaveFlags.KeepOrder | DSSSaveFlags.IncludeOptions | 
+        DSSSaveFlags.SetVoltageBases | DSSSaveFlags.IncludeDisabled | DSSSaveFlags.IsOpen
+    )
+
+    def compile_cached(self, path: Union[str, os.PathLike], cache_dir: Union[str, os.PathLike, None] = None) -> bool:
+        '''
+        Compiles the DSS script at `path`, reusing a snapshot of the compiled circuit from a local cache
+        when the sources did not change.
+
+        The cache key is a hash of the contents of the master script, the scripts it runs through 
+        `redirect`/`compile` (recursively), the data files referenced by them (bus coordinates and 
+        `file=`-style property values, e.g. `mult=(file=shape.csv)`), and the engine version.
+        On a miss, the script is compiled as usual and a single-file snapshot of the circuit is saved
+        (`ActiveCircuit.Save`, with the loadshape and other data inlined). On a hit, the snapshot is
+        loaded instead, after changing the working folder to the folder of the script, as `compile` does.
+
+        Note that the snapshot contains the circuit definition and the options, but the actions from 
+        the scripts (e.g. `solve`, `export`, `show`) are not repeated on a hit. The dependencies are found
+        by scanning the scripts, so files referenced indirectly (e.g. through variables or `set datapath`) 
+        are not tracked.
+
+        `cache_dir` defaults to `dss_python/compiled` in the user cache folder (`$XDG_CACHE_HOME` or `~/.cache`).
+
+        Returns True if the circuit was loaded from the cache.
+
+        **(API Extension)**
+        '''
+        path = os.path.abspath(os.fspath(path))
+        if cache_dir is None:
+            cache_dir = _compile_cache.default_cache_dir()
+        else:
+            cache_dir = os.fspath(cache_dir)
+
+        files = _compile_cache.script_dependencies(path)
+        key = _compile_cache.source_hash(files, f'{self.Version}\n{int(self._compile_cache_flags)}')
+        prefix = _compile_cache.cache_file_prefix(path)
+        cache_fn = os.path.join(cache_dir, f'{prefix}{key[:32]}.dss')
+
+        snapshot = _compile_cache.read_entry(cache_fn)
+        if snapshot is not None:
+            self.Text.Command = f'cd "{os.path.dirname(path)}"'
+            self.Text.Commands(snapshot)
+            return True
+
+        self.Text.Command = f'compile "{path}"'
+        snapshot = self.ActiveCircuit.Save('', self._compile_cache_flags)
+        try:
+            _compile_cache.write_entry(cache_dir, prefix, cache_fn, snapshot)
+        except OSError as ex:
+            warnings.warn(f'Could not write to the compile cache ({ex})')
+
+        return False
+
+    @property
+    def CachedNameLists(self) -> bool:
+        '''
+        When enabled, the name lists `ActiveCircuit.AllBusNames`, `ActiveCircuit.AllNodeNames`, `ActiveCircuit.YNodeOrder`, 
+        `ActiveCircuit.AllElementNames` and the `AllNames` property of the element collections (e.g. `ActiveCircuit.Loads.AllNames`)
+        are returned as immutable tuples, which are cached and reused until the circuit changes. This avoids decoding 
+        the strings from the engine on every access.
+
+        The cache is invalidated when the circuit is cleared or its bus list is rebuilt, and whenever DSS commands
+        are run (through `Text`, `DSS(...)`, `ZIP.Redirect`) or elements are created with the `New` methods, since 
+        these may add, remove or rename objects. Each list is also refreshed if its number of items changes. 
+        Changes made through other means (e.g. directly through the DSS C-API functions) are not tracked; 
+        toggle `CachedNameLists` to discard the cache in that case.
+
+        This is a per DSS Context setting; it is not available for the official OpenDSS engine.
+
+        *Defaults to **False**.*
+
+        **(API Extension)**
+        '''
+        return self._api_util._cache_name_lists
+
+    @CachedNameLists.setter
+    def CachedNameLists(self, Value: bool):
+        if self._api_util._is_odd and Value:
+            raise NotImplementedError("CachedNameLists is not supported for the official OpenDSS engine.")
+
+        self._api_util._cache_name_lists = bool(Value)
+        self._api_util._name_lists.clear()
+
     @property
     def CompatFlags(self) -> int:
         '''
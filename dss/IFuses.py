@@ -24,6 +24,26 @@ class IFuses(Iterable):
         'NormalState',
     ]
 
+    _column_getters = {
+        'Name': 'Fuses_Get_Name',
+        'idx': 'Fuses_Get_idx',
+        'NumPhases': 'Fuses_Get_NumPhases',
+        'MonitoredObj': 'Fuses_Get_MonitoredObj',
+        'MonitoredTerm': 'Fuses_Get_MonitoredTerm',
+        'Delay': 'Fuses_Get_Delay',
+        'TCCcurve': 'Fuses_Get_TCCcurve',
+        'RatedCurrent': 'Fuses_Get_RatedCurrent',
+        'SwitchedObj': 'Fuses_Get_SwitchedObj',
+        'SwitchedTerm': 'Fuses_Get_SwitchedTerm',
+    }
+
+    _column_setters = {
+        'Delay': 'Fuses_Set_Delay',
+        'MonitoredTerm': 'Fuses_Set_MonitoredTerm',
+        'RatedCurrent': 'Fuses_Set_RatedCurrent',
+        'SwitchedTerm': 'Fuses_Set_SwitchedTerm',
+    }
+
 
     def Close(self):
         '''
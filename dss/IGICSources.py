@@ -22,6 +22,32 @@ class IGICSources(Iterable):
         'Volts',
     ]
 
+    _column_getters = {
+        'Name': 'GICSources_Get_Name',
+        'idx': 'GICSources_Get_idx',
+        'Phases': 'GICSources_Get_Phases',
+        'Bus1': 'GICSources_Get_Bus1',
+        'Bus2': 'GICSources_Get_Bus2',
+        'EN': 'GICSources_Get_EN',
+        'EE': 'GICSources_Get_EE',
+        'Lat1': 'GICSources_Get_Lat1',
+        'Lat2': 'GICSources_Get_Lat2',
+        'Lon1': 'GICSources_Get_Lon1',
+        'Lon2': 'GICSources_Get_Lon2',
+        'Volts': 'GICSources_Get_Volts',
+    }
+
+    _column_setters = {
+        'Phases': 'GICSources_Set_Phases',
+        'EN': 'GICSources_Set_EN',
+        'EE': 'GICSources_Set_EE',
+        'Lat1': 'GICSources_Set_Lat1',
+        'Lat2': 'GICSources_Set_Lat2',
+        'Lon1': 'GICSources_Set_Lon1',
+        'Lon2': 'GICSources_Set_Lon2',
+        'Volts': 'GICSources_Set_Volts',
+    }
+
     @property
     def Bus1(self) -> str:
         '''First bus name of GICSource (Created name)'''
@@ -35,6 +35,44 @@ class IGenerators(Iterable):
         'Yearly',
     ]
 
+    _column_getters = {
+        'Name': 'Generators_Get_Name',
+        'idx': 'Generators_Get_idx',
+        'ForcedON': 'Generators_Get_ForcedON',
+        'Model': 'Generators_Get_Model',
+        'Phases': 'Generators_Get_Phases',
+        'PF': 'Generators_Get_PF',
+        'kVArated': 'Generators_Get_kVArated',
+        'kV': 'Generators_Get_kV',
+        'kW': 'Generators_Get_kW',
+        'kvar': 'Generators_Get_kvar',
+        'Vminpu': 'Generators_Get_Vminpu',
+        'Vmaxpu': 'Generators_Get_Vmaxpu',
+        'Bus1': 'Generators_Get_Bus1',
+        'Class': 'Generators_Get_Class_',
+        'kva': 'Generators_Get_kva',
+        'IsDelta': 'Generators_Get_IsDelta',
+        'daily': 'Generators_Get_daily',
+        'duty': 'Generators_Get_duty',
+        'Yearly': 'Generators_Get_Yearly',
+    }
+
+    _column_setters = {
+        'ForcedON': 'Generators_Set_ForcedON',
+        'Model': 'Generators_Set_Model',
+        'PF': 'Generators_Set_PF',
+        'Phases': 'Generators_Set_Phases',
+        'Vmaxpu': 'Generators_Set_Vmaxpu',
+        'Vminpu': 'Generators_Set_Vminpu',
+        'kV': 'Generators_Set_kV',
+        'kVArated': 'Generators_Set_kVArated',
+        'kW': 'Generators_Set_kW',
+        'kvar': 'Generators_Set_kvar',
+        'IsDelta': 'Generators_Set_IsDelta',
+        'kva': 'Generators_Set_kva',
+        'Class': 'Generators_Set_Class_',
+    }
+
     @property
     def ForcedON(self) -> bool:
         '''
@@ -15,6 +15,20 @@ class IISources(Iterable):
         'Frequency',
     ]
 
+    _column_getters = {
+        'Name': 'ISources_Get_Name',
+        'idx': 'ISources_Get_idx',
+        'Amps': 'ISources_Get_Amps',
+        'AngleDeg': 'ISources_Get_AngleDeg',
+        'Frequency': 'ISources_Get_Frequency',
+    }
+
+    _column_setters = {
+        'Amps': 'ISources_Set_Amps',
+        'AngleDeg': 'ISources_Set_AngleDeg',
+        'Frequency': 'ISources_Set_Frequency',
+    }
+
     @property
     def Amps(self) -> float:
         '''
@@ -28,6 +28,29 @@ class ILineCodes(Iterable):
         'NormAmps',
     ]
 
+    _column_getters = {
+        'Name': 'LineCodes_Get_Name',
+        'idx': 'LineCodes_Get_idx',
+        'Phases': 'LineCodes_Get_Phases',
+        'IsZ1Z0': 'LineCodes_Get_IsZ1Z0',
+        'R0': 'LineCodes_Get_R0',
+        'R1': 'LineCodes_Get_R1',
+        'X0': 'LineCodes_Get_X0',
+        'X1': 'LineCodes_Get_X1',
+        'EmergAmps': 'LineCodes_Get_EmergAmps',
+        'NormAmps': 'LineCodes_Get_NormAmps',
+    }
+
+    _column_setters = {
+        'EmergAmps': 'LineCodes_Set_EmergAmps',
+        'NormAmps': 'LineCodes_Set_NormAmps',
+        'Phases': 'LineCodes_Set_Phases',
+        'R0': 'LineCodes_Set_R0',
+        'R1': 'LineCodes_Set_R1',
+        'X0': 'LineCodes_Set_X0',
+        'X1': 'LineCodes_Set_X1',
+    }
+
     @property
     def C0(self):
         '''
@@ -32,6 +32,26 @@ class ILineGeometries(Iterable):
         'NormAmps',
         'EmergAmps',
     ]
+
+    _column_getters = {
+        'Name': 'LineGeometries_Get_Name',
+        'idx': 'LineGeometries_Get_idx',
+        'Nconds': 'LineGeometries_Get_Nconds',
+        'Phases': 'LineGeometries_Get_Phases',
+        'RhoEarth': 'LineGeometries_Get_RhoEarth',
+        'Reduce': 'LineGeometries_Get_Reduce',
+        'NormAmps': 'LineGeometries_Get_NormAmps',
+        'EmergAmps': 'LineGeometries_Get_EmergAmps',
+    }
+
+    _column_setters = {
+        'EmergAmps': 'LineGeometries_Set_EmergAmps',
+        'NormAmps': 'LineGeometries_Set_NormAmps',
+        'RhoEarth': 'LineGeometries_Set_RhoEarth',
+        'Reduce': 'LineGeometries_Set_Reduce',
+        'Phases': 'LineGeometries_Set_Phases',
+        'Nconds': 'LineGeometries_Set_Nconds',
+    }
     
     @property
     def Conductors(self) -> List[str]:
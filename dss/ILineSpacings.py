@@ -25,6 +25,18 @@ class ILineSpacings(Iterable):
         'Ycoords',
     ]
 
+    _column_getters = {
+        'Name': 'LineSpacings_Get_Name',
+        'idx': 'LineSpacings_Get_idx',
+        'Nconds': 'LineSpacings_Get_Nconds',
+        'Phases': 'LineSpacings_Get_Phases',
+    }
+
+    _column_setters = {
+        'Phases': 'LineSpacings_Set_Phases',
+        'Nconds': 'LineSpacings_Set_Nconds',
+    }
+
     @property
     def Phases(self) -> int:
         '''Number of Phases'''
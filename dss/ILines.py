@@ -42,10 +42,55 @@ class ILines(Iterable):
         'Units', 
     ]
 
+    _column_getters = {
+        'Name': 'Lines_Get_Name',
+        'idx': 'Lines_Get_idx',
+        'Phases': 'Lines_Get_Phases',
+        'Bus1': 'Lines_Get_Bus1',
+        'Bus2': 'Lines_Get_Bus2',
+        'LineCode': 'Lines_Get_LineCode',
+        'Geometry': 'Lines_Get_Geometry',
+        'Length': 'Lines_Get_Length',
+        'IsSwitch': 'Lines_Get_IsSwitch',
+        'Spacing': 'Lines_Get_Spacing',
+        'EmergAmps': 'Lines_Get_EmergAmps',
+        'NormAmps': 'Lines_Get_NormAmps',
+        'SeasonRating': 'Lines_Get_SeasonRating',
+        'NumCust': 'Lines_Get_NumCust',
+        'TotalCust': 'Lines_Get_TotalCust',
+        'Rho': 'Lines_Get_Rho',
+        'R0': 'Lines_Get_R0',
+        'R1': 'Lines_Get_R1',
+        'X0': 'Lines_Get_X0',
+        'X1': 'Lines_Get_X1',
+        'Rg': 'Lines_Get_Rg',
+        'Xg': 'Lines_Get_Xg',
+        'C0': 'Lines_Get_C0',
+        'C1': 'Lines_Get_C1',
+    }
+
+    _column_setters = {
+        'C0': 'Lines_Set_C0',
+        'C1': 'Lines_Set_C1',
+        'EmergAmps': 'Lines_Set_EmergAmps',
+        'Length': 'Lines_Set_Length',
+        'NormAmps': 'Lines_Set_NormAmps',
+        'Phases': 'Lines_Set_Phases',
+        'R0': 'Lines_Set_R0',
+        'R1': 'Lines_Set_R1',
+        'Rg': 'Lines_Set_Rg',
+        'Rho': 'Lines_Set_Rho',
+        'X0': 'Lines_Set_X0',
+        'X1': 'Lines_Set_X1',
+        'Xg': 'Lines_Set_Xg',
+        'IsSwitch': 'Lines_Set_IsSwitch',
+    }
+
     def New(self, Name):
         if not isinstance(Name, bytes):
             Name = Name.encode(self._api_util.codec)
 
+        self._api_util.invalidate_name_lists()
         return self._check_for_error(self._lib.Lines_New(Name))
 
     @property
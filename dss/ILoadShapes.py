@@ -23,11 +23,38 @@ class ILoadShapes(Iterable):
         'TimeArray',
     ]
 
+    _column_getters = {
+        'Name': 'LoadShapes_Get_Name',
+        'idx': 'LoadShapes_Get_idx',
+        'UseActual': 'LoadShapes_Get_UseActual',
+        'Npts': 'LoadShapes_Get_Npts',
+        'HrInterval': 'LoadShapes_Get_HrInterval',
+        'MinInterval': 'LoadShapes_Get_MinInterval',
+        'sInterval': 'LoadShapes_Get_SInterval',
+        'PBase': 'LoadShapes_Get_PBase',
+        'QBase': 'LoadShapes_Get_Qbase',
+    }
+
+    _column_setters = {
+        'HrInterval': 'LoadShapes_Set_HrInterval',
+        'MinInterval': 'LoadShapes_Set_MinInterval',
+        'Npts': 'LoadShapes_Set_Npts',
+        'PBase': 'LoadShapes_Set_PBase',
+        'QBase': 'LoadShapes_Set_Qbase',
+        'UseActual': 'LoadShapes_Set_UseActual',
+        'sInterval': 'LoadShapes_Set_SInterval',
+        'Pbase': 'LoadShapes_Set_PBase',
+        'Qbase': 'LoadShapes_Set_Qbase',
+        'SInterval': 'LoadShapes_Set_SInterval',
+        'Sinterval': 'LoadShapes_Set_SInterval',
+    }
+
     def New(self, Name: AnyStr):
         '''Create a new LoadShape, with default parameters'''
         if not isinstance(Name, bytes):
             Name = Name.encode(self._api_util.codec)
 
+        self._api_util.invalidate_name_lists()
         return self._check_for_error(self._lib.LoadShapes_New(Name))
 
     def Normalize(self):
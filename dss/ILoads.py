@@ -51,6 +51,73 @@ class ILoads(Iterable):
         'Sensor',
     ]
 
+    _column_getters = {
+        'Name': 'Loads_Get_Name',
+        'idx': 'Loads_Get_idx',
+        'Phases': 'Loads_Get_Phases',
+        'Class': 'Loads_Get_Class_',
+        'NumCust': 'Loads_Get_NumCust',
+        'IsDelta': 'Loads_Get_IsDelta',
+        'Rneut': 'Loads_Get_Rneut',
+        'Xneut': 'Loads_Get_Xneut',
+        'PF': 'Loads_Get_PF',
+        'CVRcurve': 'Loads_Get_CVRcurve',
+        'CVRvars': 'Loads_Get_CVRvars',
+        'CVRwatts': 'Loads_Get_CVRwatts',
+        'Cfactor': 'Loads_Get_Cfactor',
+        'Growth': 'Loads_Get_Growth',
+        'daily': 'Loads_Get_daily',
+        'duty': 'Loads_Get_duty',
+        'Yearly': 'Loads_Get_Yearly',
+        'PctMean': 'Loads_Get_PctMean',
+        'PctStdDev': 'Loads_Get_PctStdDev',
+        'RelWeight': 'Loads_Get_RelWeight',
+        'Spectrum': 'Loads_Get_Spectrum',
+        'Vminnorm': 'Loads_Get_Vminnorm',
+        'Vminemerg': 'Loads_Get_Vminemerg',
+        'Vminpu': 'Loads_Get_Vminpu',
+        'Vmaxpu': 'Loads_Get_Vmaxpu',
+        'kV': 'Loads_Get_kV',
+        'kW': 'Loads_Get_kW',
+        'kva': 'Loads_Get_kva',
+        'kvar': 'Loads_Get_kvar',
+        'kwh': 'Loads_Get_kwh',
+        'kwhdays': 'Loads_Get_kwhdays',
+        'AllocationFactor': 'Loads_Get_AllocationFactor',
+        'xfkVA': 'Loads_Get_xfkVA',
+        'pctSeriesRL': 'Loads_Get_pctSeriesRL',
+        'Sensor': 'Loads_Get_Sensor',
+    }
+
+    _column_setters = {
+        'AllocationFactor': 'Loads_Set_AllocationFactor',
+        'CVRvars': 'Loads_Set_CVRvars',
+        'CVRwatts': 'Loads_Set_CVRwatts',
+        'Cfactor': 'Loads_Set_Cfactor',
+        'Class': 'Loads_Set_Class_',
+        'IsDelta': 'Loads_Set_IsDelta',
+        'NumCust': 'Loads_Set_NumCust',
+        'PF': 'Loads_Set_PF',
+        'PctMean': 'Loads_Set_PctMean',
+        'PctStdDev': 'Loads_Set_PctStdDev',
+        'RelWeight': 'Loads_Set_RelWeight',
+        'Rneut': 'Loads_Set_Rneut',
+        'Vmaxpu': 'Loads_Set_Vmaxpu',
+        'Vminemerg': 'Loads_Set_Vminemerg',
+        'Vminnorm': 'Loads_Set_Vminnorm',
+        'Vminpu': 'Loads_Set_Vminpu',
+        'Xneut': 'Loads_Set_Xneut',
+        'kV': 'Loads_Set_kV',
+        'kW': 'Loads_Set_kW',
+        'kva': 'Loads_Set_kva',
+        'kvar': 'Loads_Set_kvar',
+        'kwh': 'Loads_Set_kwh',
+        'kwhdays': 'Loads_Set_kwhdays',
+        'pctSeriesRL': 'Loads_Set_pctSeriesRL',
+        'xfkVA': 'Loads_Set_xfkVA',
+        'Phases': 'Loads_Set_Phases',
+    }
+
     @property
     def AllocationFactor(self) -> float:
         '''
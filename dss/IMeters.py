@@ -41,6 +41,33 @@ class IMeters(Iterable):
         'NumSectionBranches'
     ]
 
+    _column_getters = {
+        'Name': 'Meters_Get_Name',
+        'MeteredTerminal': 'Meters_Get_MeteredTerminal',
+        'SeqListSize': 'Meters_Get_SeqListSize',
+        'MeteredElement': 'Meters_Get_MeteredElement',
+        'SAIFIKW': 'Meters_Get_SAIFIKW',
+        'CountEndElements': 'Meters_Get_CountEndElements',
+        'SAIDI': 'Meters_Get_SAIDI',
+        'TotalCustomers': 'Meters_Get_TotalCustomers',
+        'SAIFI': 'Meters_Get_SAIFI',
+        'CustInterrupts': 'Meters_Get_CustInterrupts',
+        'CountBranches': 'Meters_Get_CountBranches',
+        'NumSections': 'Meters_Get_NumSections',
+        'NumSectionCustomers': 'Meters_Get_NumSectionCustomers',
+        'SectSeqIdx': 'Meters_Get_SectSeqIdx',
+        'SumBranchFltRates': 'Meters_Get_SumBranchFltRates',
+        'AvgRepairTime': 'Meters_Get_AvgRepairTime',
+        'SectTotalCust': 'Meters_Get_SectTotalCust',
+        'FaultRateXRepairHrs': 'Meters_Get_FaultRateXRepairHrs',
+        'NumSectionBranches': 'Meters_Get_NumSectionBranches',
+    }
+
+    _column_setters = {
+        'MeteredTerminal': 'Meters_Set_MeteredTerminal',
+        'SequenceIndex': 'Meters_Set_SequenceIndex',
+    }
+
     def CloseAllDIFiles(self):
         '''
         Close All Demand Interval Files. Users are required to close the DI files at the end of a run.
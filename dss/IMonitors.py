@@ -1,9 +1,10 @@
 # A compatibility layer for DSS C-API that mimics the official OpenDSS COM interface.
 # Copyright (c) 2016-2024 Paulo Meira
 # Copyright (c) 2018-2024 DSS-Extensions contributors
+import os
 from ._cffi_api_util import DSSException, Iterable
 import numpy as np
-from typing import List, AnyStr
+from typing import Dict, List, AnyStr, Tuple, Union
 from ._types import Float64Array, Float32Array, Int8Array
 
 class IMonitors(Iterable):
@@ -25,6 +26,23 @@ class IMonitors(Iterable):
         'SampleCount',
     ]
 
+    _column_getters = {
+        'Name': 'Monitors_Get_Name',
+        'FileVersion': 'Monitors_Get_FileVersion',
+        'NumChannels': 'Monitors_Get_NumChannels',
+        'RecordSize': 'Monitors_Get_RecordSize',
+        'Mode': 'Monitors_Get_Mode',
+        'FileName': 'Monitors_Get_FileName',
+        'Element': 'Monitors_Get_Element',
+        'Terminal': 'Monitors_Get_Terminal',
+        'SampleCount': 'Monitors_Get_SampleCount',
+    }
+
+    _column_setters = {
+        'Mode': 'Monitors_Set_Mode',
+        'Terminal': 'Monitors_Set_Terminal',
+    }
+
     def Channel(self, Index: int) -> Float32Array:
         '''
         (read-only) Array of float32 for the specified channel (usage: MyArray = DSSMonitor.Channel(i)).
@@ -76,6 +94,77 @@ class IMonitors(Iterable):
         data = data.reshape((len(data) // record_size, record_size)).copy()
         return data
 
+    def export_all(self, path: Union[AnyStr, os.PathLike, None] = None) -> Tuple[Union[Float32Array, Dict[str, Float32Array]], Dict[str, List[str]]]:
+        '''
+        Exports the data of all monitors in a single pass. Returns a tuple `(data, headers)`:
+
+        - `data`: if all monitors have the same number of samples and channels, a 3D float32 array 
+          with the matrix of each monitor (as in `AsMatrix`: hour, seconds and the channels), in the
+          order of `AllNames`. Otherwise, a dict of the matrices, keyed by the monitor name.
+        - `headers`: dict of the column names of each monitor (`hour`, `t(sec)` and the channel names).
+
+        The data of each monitor is copied directly from the engine buffer to the result. If `path` is
+        provided, the 3D array is created as a memory-mapped `.npy` file at that path (see `numpy.lib.format.open_memmap`)
+        and returned; in this case, the shapes must be uniform.
+
+        **(API Extension)**
+        '''
+        lib = self._lib
+        api_util = self._api_util
+        ffi = api_util.ffi
+
+        # First pass: names, headers and shapes
+        headers = {}
+        shapes = []
+        idx = lib.Monitors_Get_First()
+        while idx > 0:
+            name = self._get_string(lib.Monitors_Get_Name())
+            header = self._get_string_array(lib.Monitors_Get_Header)
+            headers[name] = ['hour', 't(sec)'] + header
+            shapes.append((lib.Monitors_Get_SampleCount(), len(header) + 2))
+            idx = lib.Monitors_Get_Next()
+
+        self._check_for_error()
+
+        uniform = len(set(shapes)) <= 1
+        if uniform:
+            shape = (len(shapes), *(shapes[0] if shapes else (0, 2)))
+            if path is not None:
+                data = np.lib.format.open_memmap(os.fspath(path), mode='w+', dtype=np.float32, shape=shape)
+            else:
+                data = np.empty(shape, dtype=np.float32)
+
+            dest = data
+        elif path is not None:
+            raise ValueError('Monitors.export_all: the monitors have different shapes, cannot write to a single array.')
+        else:
+            data = {name: np.empty(shape, dtype=np.float32) for name, shape in zip(headers.keys(), shapes)}
+            dest = list(data.values())
+
+        # Second pass: copy the data of each monitor
+        index = 0
+        idx = lib.Monitors_Get_First()
+        while idx > 0:
+            lib.Monitors_Get_ByteStream_GR()
+            ptr, cnt = api_util.gr_int8_pointers
+            api_util.invalidate_gr_views()
+            num_samples, record_size = shapes[index]
+            if cnt[0] > 272:
+                src = np.frombuffer(ffi.buffer(ptr[0], cnt[0]), dtype=np.float32, offset=272)
+                if src.size != num_samples * record_size:
+                    raise DSSException(0, f'Monitors.export_all: unexpected data size for monitor "{list(headers.keys())[index]}".')
+
+                dest[index][...] = src.reshape((num_samples, record_size))
+
+            index += 1
+            idx = lib.Monitors_Get_Next()
+
+        self._check_for_error()
+        if path is not None:
+            data.flush()
+
+        return data, headers
+
     def Process(self):
         '''
         Post-process monitor samples taken so far, e.g., Pst for mode=4.
@@ -3,7 +3,8 @@
 # Copyright (c) 2018-2024 DSS-Extensions contributors
 from __future__ import annotations
 from ._cffi_api_util import Base
-from typing import List, AnyStr, Iterator
+import numpy as np
+from typing import Any, AnyStr, Dict, Iterator, List, Optional, Union
 from ._types import Float64Array, Int32Array, Float64ArrayOrComplexArray
 
 class IPDElements(Base):
@@ -25,6 +26,22 @@ class IPDElements(Base):
         'Lambda',
     ]
 
+    _column_getters = {
+        'Name': 'PDElements_Get_Name',
+        'AccumulatedL': 'PDElements_Get_AccumulatedL',
+        'ParentPDElement': 'PDElements_Get_ParentPDElement',
+        'FromTerminal': 'PDElements_Get_FromTerminal',
+        'IsShunt': 'PDElements_Get_IsShunt',
+        'Numcustomers': 'PDElements_Get_Numcustomers',
+        'SectionID': 'PDElements_Get_SectionID',
+        'FaultRate': 'PDElements_Get_FaultRate',
+        'RepairTime': 'PDElements_Get_RepairTime',
+        'TotalMiles': 'PDElements_Get_TotalMiles',
+        'Totalcustomers': 'PDElements_Get_Totalcustomers',
+        'pctPermanent': 'PDElements_Get_pctPermanent',
+        'Lambda': 'PDElements_Get_Lambda',
+    }
+
     @property
     def AccumulatedL(self) -> float:
         '''
@@ -207,6 +224,16 @@ class IPDElements(Base):
             yield self
             idx = self.Next
 
+    def to_columns(self, props: Optional[List[str]] = None) -> Dict[str, Union[np.ndarray, List[Any]]]:
+        '''
+        Reads the properties `props` for all PD elements in a single pass, returning a dict of columns.
+        See `Iterable.to_columns` for details.
+
+        **(API Extension)**
+        '''
+        lib = self._lib
+        return self._to_columns(props, lib.PDElements_Get_First, lib.PDElements_Get_Next, self._check_for_error(lib.PDElements_Get_Count()))
+
     @property
     def AllNames(self) -> List[str]:
         '''
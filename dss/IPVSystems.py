@@ -30,6 +30,33 @@ class IPVSystems(Iterable):
         'Sensor',
     ]
 
+    _column_getters = {
+        'Name': 'PVSystems_Get_Name',
+        'idx': 'PVSystems_Get_idx',
+        'PF': 'PVSystems_Get_PF',
+        'Irradiance': 'PVSystems_Get_Irradiance',
+        'IrradianceNow': 'PVSystems_Get_IrradianceNow',
+        'Pmpp': 'PVSystems_Get_Pmpp',
+        'kVArated': 'PVSystems_Get_kVArated',
+        'kW': 'PVSystems_Get_kW',
+        'kvar': 'PVSystems_Get_kvar',
+        'daily': 'PVSystems_Get_daily',
+        'duty': 'PVSystems_Get_duty',
+        'yearly': 'PVSystems_Get_yearly',
+        'Tdaily': 'PVSystems_Get_Tdaily',
+        'Tduty': 'PVSystems_Get_Tduty',
+        'Tyearly': 'PVSystems_Get_Tyearly',
+        'Sensor': 'PVSystems_Get_Sensor',
+    }
+
+    _column_setters = {
+        'Irradiance': 'PVSystems_Set_Irradiance',
+        'PF': 'PVSystems_Set_PF',
+        'kVArated': 'PVSystems_Set_kVArated',
+        'kvar': 'PVSystems_Set_kvar',
+        'Pmpp': 'PVSystems_Set_Pmpp',
+    }
+
     @property
     def Irradiance(self) -> float:
         '''
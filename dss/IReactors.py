@@ -39,6 +39,36 @@ class IReactors(Iterable):
         'Xmatrix',
     ]
 
+    _column_getters = {
+        'Name': 'Reactors_Get_Name',
+        'idx': 'Reactors_Get_idx',
+        'Phases': 'Reactors_Get_Phases',
+        'Bus1': 'Reactors_Get_Bus1',
+        'Bus2': 'Reactors_Get_Bus2',
+        'SpecType': 'Reactors_Get_SpecType',
+        'kV': 'Reactors_Get_kV',
+        'kvar': 'Reactors_Get_kvar',
+        'IsDelta': 'Reactors_Get_IsDelta',
+        'Parallel': 'Reactors_Get_Parallel',
+        'LCurve': 'Reactors_Get_LCurve',
+        'RCurve': 'Reactors_Get_RCurve',
+        'R': 'Reactors_Get_R',
+        'Rp': 'Reactors_Get_Rp',
+        'X': 'Reactors_Get_X',
+    }
+
+    _column_setters = {
+        'IsDelta': 'Reactors_Set_IsDelta',
+        'Parallel': 'Reactors_Set_Parallel',
+        'LmH': 'Reactors_Set_LmH',
+        'kV': 'Reactors_Set_kV',
+        'kvar': 'Reactors_Set_kvar',
+        'Phases': 'Reactors_Set_Phases',
+        'R': 'Reactors_Set_R',
+        'X': 'Reactors_Set_X',
+        'Rp': 'Reactors_Set_Rp',
+    }
+
     @property
     def SpecType(self) -> int:
         '''
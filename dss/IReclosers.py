@@ -27,6 +27,36 @@ class IReclosers(Iterable):
         'NormalState',
     ]
 
+    _column_getters = {
+        'Name': 'Reclosers_Get_Name',
+        'idx': 'Reclosers_Get_idx',
+        'GroundInst': 'Reclosers_Get_GroundInst',
+        'GroundTrip': 'Reclosers_Get_GroundTrip',
+        'MonitoredObj': 'Reclosers_Get_MonitoredObj',
+        'MonitoredTerm': 'Reclosers_Get_MonitoredTerm',
+        'SwitchedObj': 'Reclosers_Get_SwitchedObj',
+        'SwitchedTerm': 'Reclosers_Get_SwitchedTerm',
+        'NumFast': 'Reclosers_Get_NumFast',
+        'PhaseInst': 'Reclosers_Get_PhaseInst',
+        'PhaseTrip': 'Reclosers_Get_PhaseTrip',
+        'Shots': 'Reclosers_Get_Shots',
+        'State': 'Reclosers_Get_State',
+        'NormalState': 'Reclosers_Get_NormalState',
+    }
+
+    _column_setters = {
+        'GroundInst': 'Reclosers_Set_GroundInst',
+        'GroundTrip': 'Reclosers_Set_GroundTrip',
+        'MonitoredTerm': 'Reclosers_Set_MonitoredTerm',
+        'NumFast': 'Reclosers_Set_NumFast',
+        'PhaseInst': 'Reclosers_Set_PhaseInst',
+        'PhaseTrip': 'Reclosers_Set_PhaseTrip',
+        'Shots': 'Reclosers_Set_Shots',
+        'SwitchedTerm': 'Reclosers_Set_SwitchedTerm',
+        'State': 'Reclosers_Set_State',
+        'NormalState': 'Reclosers_Set_NormalState',
+    }
+
     def Close(self):
         self._check_for_error(self._lib.Reclosers_Close())
 
@@ -34,6 +34,54 @@ class IRegControls(Iterable):
         'ReverseVreg',
     ]
 
+    _column_getters = {
+        'Name': 'RegControls_Get_Name',
+        'idx': 'RegControls_Get_idx',
+        'Transformer': 'RegControls_Get_Transformer',
+        'Winding': 'RegControls_Get_Winding',
+        'MonitoredBus': 'RegControls_Get_MonitoredBus',
+        'CTPrimary': 'RegControls_Get_CTPrimary',
+        'PTratio': 'RegControls_Get_PTratio',
+        'Delay': 'RegControls_Get_Delay',
+        'IsInverseTime': 'RegControls_Get_IsInverseTime',
+        'IsReversible': 'RegControls_Get_IsReversible',
+        'MaxTapChange': 'RegControls_Get_MaxTapChange',
+        'TapDelay': 'RegControls_Get_TapDelay',
+        'TapNumber': 'RegControls_Get_TapNumber',
+        'TapWinding': 'RegControls_Get_TapWinding',
+        'VoltageLimit': 'RegControls_Get_VoltageLimit',
+        'ForwardBand': 'RegControls_Get_ForwardBand',
+        'ForwardR': 'RegControls_Get_ForwardR',
+        'ForwardX': 'RegControls_Get_ForwardX',
+        'ForwardVreg': 'RegControls_Get_ForwardVreg',
+        'ReverseBand': 'RegControls_Get_ReverseBand',
+        'ReverseR': 'RegControls_Get_ReverseR',
+        'ReverseX': 'RegControls_Get_ReverseX',
+        'ReverseVreg': 'RegControls_Get_ReverseVreg',
+    }
+
+    _column_setters = {
+        'CTPrimary': 'RegControls_Set_CTPrimary',
+        'Delay': 'RegControls_Set_Delay',
+        'ForwardBand': 'RegControls_Set_ForwardBand',
+        'ForwardR': 'RegControls_Set_ForwardR',
+        'ForwardVreg': 'RegControls_Set_ForwardVreg',
+        'ForwardX': 'RegControls_Set_ForwardX',
+        'IsInverseTime': 'RegControls_Set_IsInverseTime',
+        'IsReversible': 'RegControls_Set_IsReversible',
+        'MaxTapChange': 'RegControls_Set_MaxTapChange',
+        'PTratio': 'RegControls_Set_PTratio',
+        'ReverseBand': 'RegControls_Set_ReverseBand',
+        'ReverseR': 'RegControls_Set_ReverseR',
+        'ReverseVreg': 'RegControls_Set_ReverseVreg',
+        'ReverseX': 'RegControls_Set_ReverseX',
+        'TapDelay': 'RegControls_Set_TapDelay',
+        'TapNumber': 'RegControls_Set_TapNumber',
+        'TapWinding': 'RegControls_Set_TapWinding',
+        'VoltageLimit': 'RegControls_Set_VoltageLimit',
+        'Winding': 'RegControls_Set_Winding',
+    }
+
     def Reset(self):
         self._check_for_error(self._lib.RegControls_Reset())
 
@@ -19,6 +19,24 @@ class IRelays(Iterable):
         'NormalState'
     ]
 
+    _column_getters = {
+        'Name': 'Relays_Get_Name',
+        'idx': 'Relays_Get_idx',
+        'MonitoredObj': 'Relays_Get_MonitoredObj',
+        'MonitoredTerm': 'Relays_Get_MonitoredTerm',
+        'SwitchedObj': 'Relays_Get_SwitchedObj',
+        'SwitchedTerm': 'Relays_Get_SwitchedTerm',
+        'State': 'Relays_Get_State',
+        'NormalState': 'Relays_Get_NormalState',
+    }
+
+    _column_setters = {
+        'MonitoredTerm': 'Relays_Set_MonitoredTerm',
+        'SwitchedTerm': 'Relays_Set_SwitchedTerm',
+        'State': 'Relays_Set_State',
+        'NormalState': 'Relays_Set_NormalState',
+    }
+
     @property
     def MonitoredObj(self) -> str:
         '''
@@ -26,6 +26,27 @@ class ISensors(Iterable):
         'AllocationFactor',
     ]
 
+    _column_getters = {
+        'Name': 'Sensors_Get_Name',
+        'idx': 'Sensors_Get_idx',
+        'MeteredElement': 'Sensors_Get_MeteredElement',
+        'MeteredTerminal': 'Sensors_Get_MeteredTerminal',
+        'IsDelta': 'Sensors_Get_IsDelta',
+        'ReverseDelta': 'Sensors_Get_ReverseDelta',
+        'PctError': 'Sensors_Get_PctError',
+        'Weight': 'Sensors_Get_Weight',
+        'kVbase': 'Sensors_Get_kVbase',
+    }
+
+    _column_setters = {
+        'IsDelta': 'Sensors_Set_IsDelta',
+        'MeteredTerminal': 'Sensors_Set_MeteredTerminal',
+        'PctError': 'Sensors_Set_PctError',
+        'ReverseDelta': 'Sensors_Set_ReverseDelta',
+        'Weight': 'Sensors_Set_Weight',
+        'kVbase': 'Sensors_Set_kVbase',
+    }
+
     def Reset(self):
         self._check_for_error(self._lib.Sensors_Reset())
 
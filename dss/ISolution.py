@@ -3,11 +3,30 @@
 # Copyright (c) 2018-2024 DSS-Extensions contributors
 from ._cffi_api_util import Base
 from ._types import Int32Array
-from typing import Union, AnyStr, List
+from typing import Any, Union, AnyStr, List, NamedTuple, Optional
 from .enums import SolveModes, ControlModes, SolutionAlgorithms
+from .IYMatrix import _YChangeTracker
+
+
+class TopologyMatrix(NamedTuple):
+    '''
+    A sparse topology matrix (`scipy.sparse.csr_matrix`) with the names of its rows and columns.
+    `bus_levels` has the level of each bus (column), when available. See `ISolution.incidence_matrix`.
+    '''
+    matrix: Any
+    rows: List[str]
+    cols: List[str]
+    bus_levels: Optional[Int32Array]
+
 
 class ISolution(Base):
-    __slots__ = []
+    __slots__ = [
+        '_topology_cache',
+    ]
+
+    def __init__(self, api_util):
+        Base.__init__(self, api_util)
+        self._topology_cache = {}
 
     _columns = [
         'MinIterations',
@@ -625,9 +644,10 @@ class ISolution(Base):
         in the array by 3 the user can obtain the number of rows in case of wanting to sort 
         the vector values within a matrix.
 
+        For a sparse matrix with the names of the rows and columns, see `incidence_matrix`.
+
         Original COM help: https://opendss.epri.com/IncMatrix.html
         '''
-        #TODO: expose as sparse matrix
         self._check_for_error(self._lib.Solution_Get_IncMatrix_GR())
         return self._get_int32_gr_array()
 
@@ -661,12 +681,74 @@ class ISolution(Base):
         the vector values within a matrix. The tables for the columns and rows are the same
         as the columns for the B2N columns (square matrix).        
 
+        For a sparse matrix with the names of the rows and columns, see `laplacian`.
+
         Original COM help: https://opendss.epri.com/Laplacian.html
         '''
-        #TODO: expose as sparse matrix
         self._check_for_error(self._lib.Solution_Get_Laplacian_GR())
         return self._get_int32_gr_array()
 
+    def _sparse_triplets(self, triplets: Int32Array, shape) -> Any:
+        try:
+            import scipy.sparse as sp
+        except ImportError:
+            raise ImportError("SciPy is required for the sparse topology matrices.") from None
+
+        # The engine arrays have a trailing element after the (row, column, value) triplets
+        triplets = triplets[:(len(triplets) // 3) * 3].reshape((-1, 3))
+        return sp.csr_matrix((triplets[:, 2], (triplets[:, 0], triplets[:, 1])), shape=shape)
+
+    def _topology(self, kind: str, ordered: bool) -> TopologyMatrix:
+        generation = _YChangeTracker.get(self._api_util).generation
+        key = (kind, ordered)
+        cached = self._topology_cache.get(key)
+        if cached is not None and cached[0] == generation and not self._lib.YMatrix_Get_SystemYChanged():
+            return cached[1]
+
+        self._check_for_error(self._lib.Text_Set_Command(b'CalcIncMatrix_O' if ordered else b'CalcIncMatrix'))
+        rows = self.IncMatrixRows
+        cols = self.IncMatrixCols
+        bus_levels = None
+        if ordered:
+            bus_levels = self.BusLevels.copy()
+            if len(bus_levels) != len(cols):
+                bus_levels = None
+
+        if kind == 'laplacian':
+            self._check_for_error(self._lib.Text_Set_Command(b'CalcLaplacian'))
+            result = TopologyMatrix(self._sparse_triplets(self.Laplacian, (len(cols), len(cols))), cols, cols, bus_levels)
+        else:
+            result = TopologyMatrix(self._sparse_triplets(self.IncMatrix, (len(rows), len(cols))), rows, cols, bus_levels)
+
+        self._topology_cache[key] = (_YChangeTracker.get(self._api_util).generation, result)
+        return result
+
+    def incidence_matrix(self, ordered: bool = True) -> TopologyMatrix:
+        '''
+        Computes the incidence branch-to-node (B2N) matrix of the circuit (like the `CalcIncMatrix_O`
+        command, or `CalcIncMatrix` if `ordered` is false), returning it as a `scipy.sparse.csr_matrix`
+        with the names of the rows (branches, `IncMatrixRows`) and columns (buses, `IncMatrixCols`),
+        plus the `BusLevels` when ordered.
+
+        The result is cached until the topology may have changed, i.e. until the Y matrix is rebuilt
+        (see `YMatrix.generation`) or while `YMatrix.SystemYChanged` is true. Do not modify the matrix.
+
+        Requires SciPy. This is not supported for the official OpenDSS engine.
+
+        **(API Extension)**
+        '''
+        return self._topology('incidence', ordered)
+
+    def laplacian(self, ordered: bool = True) -> TopologyMatrix:
+        '''
+        Computes the Laplacian matrix of the circuit from the incidence matrix (like the `CalcLaplacian`
+        command), returning it as a `scipy.sparse.csr_matrix` with the bus names as the rows and columns.
+        See `incidence_matrix` for the other details.
+
+        **(API Extension)**
+        '''
+        return self._topology('laplacian', ordered)
+
     def SolveAll(self):
         '''
         Solves all the circuits (Actors) loaded into memory by the user.
@@ -21,6 +21,16 @@ class IStorages(Iterable):
         'State',
     ]
 
+    _column_getters = {
+        'Name': 'Storages_Get_Name',
+        'idx': 'Storages_Get_idx',
+        'puSOC': 'Storages_Get_puSOC',
+    }
+
+    _column_setters = {
+        'puSOC': 'Storages_Set_puSOC',
+    }
+
 
     @property
     def puSOC(self) -> float:
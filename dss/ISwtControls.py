@@ -21,6 +21,25 @@ class ISwtControls(Iterable):
         'SwitchedTerm',
     ]
 
+    _column_getters = {
+        'Name': 'SwtControls_Get_Name',
+        'idx': 'SwtControls_Get_idx',
+        'Action': 'SwtControls_Get_Action',
+        'Delay': 'SwtControls_Get_Delay',
+        'IsLocked': 'SwtControls_Get_IsLocked',
+        'State': 'SwtControls_Get_State',
+        'SwitchedObj': 'SwtControls_Get_SwitchedObj',
+        'SwitchedTerm': 'SwtControls_Get_SwitchedTerm',
+    }
+
+    _column_setters = {
+        'Action': 'SwtControls_Set_Action',
+        'Delay': 'SwtControls_Set_Delay',
+        'IsLocked': 'SwtControls_Set_IsLocked',
+        'State': 'SwtControls_Set_State',
+        'SwitchedTerm': 'SwtControls_Set_SwitchedTerm',
+    }
+
     def Reset(self):
         self._check_for_error(self._lib.SwtControls_Reset())
 
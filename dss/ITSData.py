@@ -34,6 +34,48 @@ class ITSData(Iterable):
         'EpsR',
     ]
 
+    _column_getters = {
+        'Name': 'TSData_Get_Name',
+        'idx': 'TSData_Get_idx',
+        'NormAmps': 'TSData_Get_NormAmps',
+        'EmergAmps': 'TSData_Get_EmergAmps',
+        'Rdc': 'TSData_Get_Rdc',
+        'Rac': 'TSData_Get_Rac',
+        'GMRac': 'TSData_Get_GMRac',
+        'GMRUnits': 'TSData_Get_GMRUnits',
+        'Radius': 'TSData_Get_Radius',
+        'RadiusUnits': 'TSData_Get_RadiusUnits',
+        'ResistanceUnits': 'TSData_Get_ResistanceUnits',
+        'Diameter': 'TSData_Get_Diameter',
+        'TapeLayer': 'TSData_Get_TapeLayer',
+        'TapeLap': 'TSData_Get_TapeLap',
+        'DiaShield': 'TSData_Get_DiaShield',
+        'DiaCable': 'TSData_Get_DiaCable',
+        'DiaIns': 'TSData_Get_DiaIns',
+        'InsLayer': 'TSData_Get_InsLayer',
+        'EpsR': 'TSData_Get_EpsR',
+    }
+
+    _column_setters = {
+        'EmergAmps': 'TSData_Set_EmergAmps',
+        'NormAmps': 'TSData_Set_NormAmps',
+        'Rdc': 'TSData_Set_Rdc',
+        'Rac': 'TSData_Set_Rac',
+        'GMRac': 'TSData_Set_GMRac',
+        'GMRUnits': 'TSData_Set_GMRUnits',
+        'Radius': 'TSData_Set_Radius',
+        'RadiusUnits': 'TSData_Set_RadiusUnits',
+        'ResistanceUnits': 'TSData_Set_ResistanceUnits',
+        'Diameter': 'TSData_Set_Diameter',
+        'EpsR': 'TSData_Set_EpsR',
+        'InsLayer': 'TSData_Set_InsLayer',
+        'DiaIns': 'TSData_Set_DiaIns',
+        'DiaCable': 'TSData_Set_DiaCable',
+        'DiaShield': 'TSData_Set_DiaShield',
+        'TapeLayer': 'TSData_Set_TapeLayer',
+        'TapeLap': 'TSData_Set_TapeLap',
+    }
+
     @property
     def EmergAmps(self) -> float:
         '''Emergency ampere rating'''
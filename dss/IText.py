@@ -1,8 +1,12 @@
 # A compatibility layer for DSS C-API that mimics the official OpenDSS COM interface.
 # Copyright (c) 2016-2024 Paulo Meira
 # Copyright (c) 2018-2024 DSS-Extensions contributors
-from ._cffi_api_util import Base
-from typing import AnyStr, List, Union
+import re
+from itertools import islice
+from ._cffi_api_util import Base, DSSException
+from typing import AnyStr, Iterable, List, Union
+
+_block_line_re = re.compile(r'\[file: "<user-provided string>", line: (\d+)\]\s*$')
 
 class IText(Base):
     __slots__ = []
@@ -21,6 +25,7 @@ class IText(Base):
         if not isinstance(Value, bytes):
             Value = Value.encode(self._api_util.codec)
 
+        self._api_util.invalidate_name_lists()
         self._check_for_error(self._lib.Text_Set_Command(Value))
 
     @property
@@ -41,6 +46,7 @@ class IText(Base):
 
         **(API Extension)**
         '''
+        self._api_util.invalidate_name_lists()
         if isinstance(Value, str) or isinstance(Value, bytes):
             if not isinstance(Value, bytes):
                 Value = Value.encode(self._api_util.codec)
@@ -49,3 +55,64 @@ class IText(Base):
         else:
             self._check_for_error(self._set_string_array(self._lib.Text_CommandArray, Value))
 
+    def CommandStream(self, Value: Iterable[AnyStr], chunk_size: int = 1000) -> int:
+        '''
+        Runs the commands from an iterable (e.g. a generator) directly in the DSS engine, 
+        in chunks of up to `chunk_size` commands. Intermediate results (from Text.Result) are ignored.
+
+        Only one chunk is kept in memory at a time, so large circuits can be built from Python
+        without materializing the whole script, and the generation of the commands is interleaved
+        with their execution.
+
+        As with `Commands`, the execution stops at the first error. The exception message is
+        complemented with the position of the command in the stream (1-based), as well as the
+        chunk and the position in the chunk.
+
+        Returns the number of commands executed.
+
+        **(API Extension)**
+        '''
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        codec = self._api_util.codec
+        command_block = self._lib.Text_CommandBlock
+        commands = iter(Value)
+        num_done = 0
+        chunk_index = 0
+        while True:
+            chunk = list(islice(commands, chunk_size))
+            if not chunk:
+                return num_done
+
+            self._api_util.invalidate_name_lists()
+            command_block(b'\n'.join(v if isinstance(v, bytes) else v.encode(codec) for v in chunk))
+            if self._errorPtr[0]:
+                try:
+                    self._check_for_error()
+                except DSSException as ex:
+                    raise self._stream_error(ex, chunk, chunk_index, num_done) from None
+
+                # Exceptions are disabled; the user is responsible for checking the error state
+                return num_done
+
+            num_done += len(chunk)
+            chunk_index += 1
+
+    @staticmethod
+    def _stream_error(ex: DSSException, chunk: List[AnyStr], chunk_index: int, num_done: int) -> DSSException:
+        error_num, description = ex.args
+        match = _block_line_re.search(description)
+        if match is None:
+            return DSSException(error_num, f'{description}\n[command stream: chunk {chunk_index + 1}, items {num_done + 1} to {num_done + len(chunk)}]')
+
+        # Map the line of the block to the item of the chunk, since an item may contain multiple lines
+        block_line = int(match.group(1))
+        line = 0
+        for item_index, item in enumerate(chunk):
+            line += item.count(b'\n' if isinstance(item, bytes) else '\n') + 1
+            if line >= block_line:
+                break
+
+        return DSSException(error_num, f'{description}\n[command stream: item {num_done + item_index + 1} (chunk {chunk_index + 1}, item {item_index + 1})]')
+
@@ -36,6 +36,48 @@ class ITransformers(Iterable):
         'LossesByType',
     ]
 
+    _column_getters = {
+        'Name': 'Transformers_Get_Name',
+        'idx': 'Transformers_Get_idx',
+        'XfmrCode': 'Transformers_Get_XfmrCode',
+        'IsDelta': 'Transformers_Get_IsDelta',
+        'NumWindings': 'Transformers_Get_NumWindings',
+        'Wdg': 'Transformers_Get_Wdg',
+        'NumTaps': 'Transformers_Get_NumTaps',
+        'MinTap': 'Transformers_Get_MinTap',
+        'MaxTap': 'Transformers_Get_MaxTap',
+        'Tap': 'Transformers_Get_Tap',
+        'kV': 'Transformers_Get_kV',
+        'kVA': 'Transformers_Get_kVA',
+        'R': 'Transformers_Get_R',
+        'Xhl': 'Transformers_Get_Xhl',
+        'Xht': 'Transformers_Get_Xht',
+        'Xlt': 'Transformers_Get_Xlt',
+        'Rneut': 'Transformers_Get_Rneut',
+        'Xneut': 'Transformers_Get_Xneut',
+        'RdcOhms': 'Transformers_Get_RdcOhms',
+    }
+
+    _column_setters = {
+        'IsDelta': 'Transformers_Set_IsDelta',
+        'MaxTap': 'Transformers_Set_MaxTap',
+        'MinTap': 'Transformers_Set_MinTap',
+        'NumTaps': 'Transformers_Set_NumTaps',
+        'NumWindings': 'Transformers_Set_NumWindings',
+        'R': 'Transformers_Set_R',
+        'Rneut': 'Transformers_Set_Rneut',
+        'Tap': 'Transformers_Set_Tap',
+        'Wdg': 'Transformers_Set_Wdg',
+        'Xhl': 'Transformers_Set_Xhl',
+        'Xht': 'Transformers_Set_Xht',
+        'Xlt': 'Transformers_Set_Xlt',
+        'Xneut': 'Transformers_Set_Xneut',
+        'kV': 'Transformers_Set_kV',
+        'kVA': 'Transformers_Set_kVA',
+        'RdcOhms': 'Transformers_Set_RdcOhms',
+        'kva': 'Transformers_Set_kVA',
+    }
+
     @property
     def IsDelta(self) -> bool:
         '''
@@ -17,6 +17,24 @@ class IVsources(Iterable):
         'pu',
     ]
 
+    _column_getters = {
+        'Name': 'Vsources_Get_Name',
+        'idx': 'Vsources_Get_idx',
+        'Phases': 'Vsources_Get_Phases',
+        'BasekV': 'Vsources_Get_BasekV',
+        'AngleDeg': 'Vsources_Get_AngleDeg',
+        'Frequency': 'Vsources_Get_Frequency',
+        'pu': 'Vsources_Get_pu',
+    }
+
+    _column_setters = {
+        'AngleDeg': 'Vsources_Set_AngleDeg',
+        'BasekV': 'Vsources_Set_BasekV',
+        'Frequency': 'Vsources_Set_Frequency',
+        'Phases': 'Vsources_Set_Phases',
+        'pu': 'Vsources_Set_pu',
+    }
+
     @property
     def AngleDeg(self) -> float:
         '''
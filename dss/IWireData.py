@@ -30,6 +30,32 @@ class IWireData(Iterable):
         'CapRadius',
     ]
 
+    _column_getters = {
+        'Name': 'WireData_Get_Name',
+        'idx': 'WireData_Get_idx',
+        'NormAmps': 'WireData_Get_NormAmps',
+        'EmergAmps': 'WireData_Get_EmergAmps',
+        'Rdc': 'WireData_Get_Rdc',
+        'Rac': 'WireData_Get_Rac',
+        'GMRac': 'WireData_Get_GMRac',
+        'Radius': 'WireData_Get_Radius',
+        'Diameter': 'WireData_Get_Diameter',
+        'RadiusUnits': 'WireData_Get_RadiusUnits',
+        'CapRadius': 'WireData_Get_CapRadius',
+    }
+
+    _column_setters = {
+        'EmergAmps': 'WireData_Set_EmergAmps',
+        'NormAmps': 'WireData_Set_NormAmps',
+        'Rdc': 'WireData_Set_Rdc',
+        'Rac': 'WireData_Set_Rac',
+        'GMRac': 'WireData_Set_GMRac',
+        'Radius': 'WireData_Set_Radius',
+        'RadiusUnits': 'WireData_Set_RadiusUnits',
+        'Diameter': 'WireData_Set_Diameter',
+        'CapRadius': 'WireData_Set_CapRadius',
+    }
+
     @property
     def EmergAmps(self) -> float:
         '''Emergency ampere rating'''
@@ -21,6 +21,28 @@ class IXYCurves(Iterable):
         'y',
     ]
 
+    _column_getters = {
+        'Name': 'XYCurves_Get_Name',
+        'idx': 'XYCurves_Get_idx',
+        'Npts': 'XYCurves_Get_Npts',
+        'Xscale': 'XYCurves_Get_Xscale',
+        'Xshift': 'XYCurves_Get_Xshift',
+        'Yscale': 'XYCurves_Get_Yscale',
+        'Yshift': 'XYCurves_Get_Yshift',
+        'x': 'XYCurves_Get_x',
+        'y': 'XYCurves_Get_y',
+    }
+
+    _column_setters = {
+        'Npts': 'XYCurves_Set_Npts',
+        'Xscale': 'XYCurves_Set_Xscale',
+        'Xshift': 'XYCurves_Set_Xshift',
+        'Yscale': 'XYCurves_Set_Yscale',
+        'Yshift': 'XYCurves_Set_Yshift',
+        'x': 'XYCurves_Set_x',
+        'y': 'XYCurves_Set_y',
+    }
+
     @property
     def Npts(self) -> int:
         '''
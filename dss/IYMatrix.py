@@ -4,7 +4,41 @@
 from ._cffi_api_util import Base
 import numpy as np
 from ._types import Int32Array, ComplexArray
-from typing import Tuple, List
+from .enums import AltDSSEvent
+from dss_python_backend.events import get_manager_for_ctx
+from typing import Any, Tuple, List, Optional
+
+# Events that (may) change the system Y matrix
+_y_events = (AltDSSEvent.BuildSystemY, AltDSSEvent.ReprocessBuses, AltDSSEvent.Clear)
+
+
+class _YChangeTracker:
+    '''
+    Counts the events that may change the system Y matrix (and the topology) of a DSS context.
+    There is one tracker per context, created on first use, shared by the interfaces.
+    '''
+    __slots__ = ('generation', '_handler')
+
+    def __init__(self, api_util):
+        if api_util._is_odd:
+            raise NotImplementedError('Tracking the changes of the Y matrix is not supported for the official OpenDSS engine.')
+
+        self.generation = 0
+        self._handler = self._on_event # keep the same bound method to unregister
+        manager = get_manager_for_ctx(api_util.ctx)
+        for evt in _y_events:
+            manager.register_func(evt, self._handler)
+
+    def _on_event(self, ctx, evt, step, ptr):
+        self.generation += 1
+
+    @staticmethod
+    def get(api_util) -> '_YChangeTracker':
+        tracker = getattr(api_util, '_y_tracker', None)
+        if tracker is None:
+            tracker = api_util._y_tracker = _YChangeTracker(api_util)
+
+        return tracker
 
 class IYMatrix(Base):
     '''
@@ -16,7 +50,21 @@ class IYMatrix(Base):
     (**API Extension**)
     '''
     
-    __slots__ = []
+    __slots__ = [
+        '_ptr',
+        '_V',
+        '_I',
+        '_csc',
+        '_csc_generation',
+    ]
+
+    def __init__(self, api_util):
+        Base.__init__(self, api_util)
+        self._ptr = api_util.ffi.new('double**')
+        self._V = None
+        self._I = None
+        self._csc = None
+        self._csc_generation = -1
 
     def GetCompressedYMatrix(self, factor: bool = True) -> Tuple[ComplexArray, Int32Array, Int32Array]:
         '''Return as (data, indices, indptr) that can fed into `scipy.sparse.csc_matrix`'''
@@ -52,6 +100,55 @@ class IYMatrix(Base):
 
         return res
 
+    @property
+    def generation(self) -> int:
+        '''
+        Counter of the changes of the system Y matrix, incremented every time the engine builds 
+        the Y matrix, reprocesses the buses, or clears the circuit. Results derived from the Y matrix
+        (e.g. factorizations, Thevenin equivalents) can be cached while this value does not change.
+
+        Changes are tracked from the first use of `generation` or `as_csc`.
+
+        This is not supported for the official OpenDSS engine.
+
+        **(API Extension)**
+        '''
+        return _YChangeTracker.get(self._api_util).generation
+
+    def as_csc(self, copy: bool = False) -> Any:
+        '''
+        Returns the system Y matrix as a `scipy.sparse.csc_matrix`, or None if there is no Y matrix.
+
+        The matrix is cached and reused while the Y matrix is not rebuilt (see `generation`). 
+        Use `copy=True` to get a copy that can be modified; otherwise, the shared cached object is
+        returned. Note that, like `GetCompressedYMatrix`, this returns the Y matrix as last built 
+        by the engine; if `SystemYChanged` is true, the circuit has changes that are not yet in it.
+
+        Requires SciPy. This is not supported for the official OpenDSS engine.
+
+        **(API Extension)**
+        '''
+        try:
+            import scipy.sparse as sp
+        except ImportError:
+            raise ImportError("SciPy is required to use YMatrix.as_csc.") from None
+
+        generation = _YChangeTracker.get(self._api_util).generation
+        if self._csc_generation != generation:
+            data = self.GetCompressedYMatrix()
+            if data is None:
+                self._csc = None
+            else:
+                num_nodes = len(data[2]) - 1
+                self._csc = sp.csc_matrix(data, shape=(num_nodes, num_nodes), copy=False)
+
+            self._csc_generation = generation
+
+        if copy and self._csc is not None:
+            return self._csc.copy()
+
+        return self._csc
+
     def ZeroInjCurr(self):
         self._check_for_error(self._lib.YMatrix_ZeroInjCurr())
 
@@ -79,6 +176,56 @@ class IYMatrix(Base):
         self._check_for_error(self._lib.YMatrix_getVpointer(VvectorPtr))
         return VvectorPtr[0]
 
+    def _vi_view(self, get_pointer, cached):
+        # The vectors are sized when the Y matrix is built; while a rebuild is pending
+        # (e.g. after adding buses), NumNodes may not match the allocation anymore
+        if self._check_for_error(self._lib.YMatrix_Get_SystemYChanged()):
+            return None, None
+
+        ptr = self._ptr
+        ptr[0] = self._api_util.ffi.NULL
+        self._check_for_error(get_pointer(ptr))
+        count = self._check_for_error(self._lib.Circuit_Get_NumNodes()) + 1
+        if ptr[0] == self._api_util.ffi.NULL:
+            return None, None
+
+        key = (int(self._api_util.ffi.cast('uintptr_t', ptr[0])), count)
+        if cached is not None and cached[0] == key:
+            return cached, cached[1]
+
+        view = np.frombuffer(self._api_util.ffi.buffer(ptr[0], count * 16), dtype=np.complex128)
+        return (key, view), view
+
+    @property
+    def V(self) -> Optional[ComplexArray]:
+        '''
+        NumPy view (complex128, without copying) of the internal voltage vector of the solver.
+        Index 0 is the ground/reference node, followed by the nodes of the circuit (`NumNodes + 1` items).
+        
+        The view is reused while the vector is not reallocated (e.g. when the Y matrix is rebuilt or
+        by `BuildYMatrixD(..., AllocateVI=True)`), so it is cheap to get this for every step. Do not keep
+        the view across steps that may reallocate the vector; get it again instead.
+
+        Returns None if the vector is not allocated, or if the system Y matrix is pending a rebuild
+        (`SystemYChanged`), since the circuit may not match the vector anymore; solve (or build the
+        Y matrix) first.
+
+        **(API Extension)**
+        '''
+        self._V, view = self._vi_view(self._lib.YMatrix_getVpointer, self._V)
+        return view
+
+    @property
+    def I(self) -> Optional[ComplexArray]:
+        '''
+        NumPy view (complex128, without copying) of the internal current (injection) vector of the solver.
+        See `V` for the details.
+
+        **(API Extension)**
+        '''
+        self._I, view = self._vi_view(self._lib.YMatrix_getIpointer, self._I)
+        return view
+
     def SolveSystem(self, NodeV=None) -> int:
         if NodeV is not None and type(NodeV) is not np.ndarray:
             NodeV = np.array(NodeV)
@@ -53,6 +53,7 @@ class IZIP(Base):
         if not isinstance(FileInZip, bytes):
             FileInZip = FileInZip.encode(self._api_util.codec)
 
+        self._api_util.invalidate_name_lists()
         self._check_for_error(self._lib.ZIP_Redirect(FileInZip))
 
     def Extract(self, FileName: AnyStr) -> bytes:
@@ -10,38 +10,62 @@ In January 2024, the code based on our new low-level API extensions, Obj and Alt
 '''
 
 import os
+from threading import Lock
 from .patch_dss_com import patch_dss_com
 from dss_python_backend import ffi, lib
 _properties_mo = os.path.join(os.path.dirname(__file__), 'messages', 'properties-en-US.mo')
 if os.path.exists(_properties_mo):
     lib.DSS_SetPropertiesMO(_properties_mo.encode())
 
-from ._cffi_api_util import CffiApiUtil, DSSException, set_case_insensitive_attributes
+from ._cffi_api_util import CffiApiUtil, DSSException, GRView, set_case_insensitive_attributes
 from .IDSS import IDSS
 from .Oddie import IOddieDSS, OddieOptions
 from .enums import *
 
 DssException = DSSException
 
-if not hasattr(lib, 'ctx_New'):
-    # Module was built without the context API
-    api_util: CffiApiUtil = CffiApiUtil(ffi, lib) #: API utility functions and low-level access to the classic API
-    prime_api_util = None
-    DSS_GR: IDSS = IDSS(api_util) #: GR (Global Result) interface
-else:
-    api_util = prime_api_util = CffiApiUtil(ffi, lib, lib.ctx_Get_Prime()) #: API utility functions and low-level access for DSSContext API
-    DSS_GR: IDSS = IDSS(prime_api_util) #: GR (Global Result) interface using the new DSSContext API
-    
-DSS_IR: IDSS = DSS_GR #: IR was removed in DSS-Python v0.13.x, we'll keep mapping it to DSS_GR for this version
+api_util: CffiApiUtil #: API utility functions and low-level access to the classic API or the DSSContext API
+prime_api_util: CffiApiUtil #: Same as `api_util` when using the DSSContext API, None otherwise
+DSS_GR: IDSS #: GR (Global Result) interface
+DSS_IR: IDSS #: IR was removed in DSS-Python v0.13.x, we'll keep mapping it to DSS_GR for this version
 
 # Added "dss" for v0.12+ (feedback from some users)
 dss: IDSS
-DSS: IDSS
-dss = DSS = DSS_GR #: Same as DSS_GR
+DSS: IDSS #: Same as DSS_GR
+
+# The instances above are only created on first use (through the module `__getattr__`), 
+# so that importing DSS-Python is cheaper, e.g. for processes that only create new contexts.
+_prime_names = frozenset(('api_util', 'prime_api_util', 'DSS_GR', 'DSS_IR', 'dss', 'DSS'))
+_prime_lock = Lock()
+
+def _init_prime():
+    global api_util, prime_api_util, DSS_GR, DSS_IR, dss, DSS
+    with _prime_lock:
+        if 'DSS' in globals():
+            return
+
+        if not hasattr(lib, 'ctx_New'):
+            # Module was built without the context API
+            _api_util = CffiApiUtil(ffi, lib)
+            prime_api_util = None
+        else:
+            _api_util = prime_api_util = CffiApiUtil(ffi, lib, lib.ctx_Get_Prime())
+
+        api_util = _api_util
+        DSS_GR = DSS_IR = dss = DSS = IDSS(_api_util)
+
+
+def __getattr__(name):
+    if name in _prime_names:
+        _init_prime()
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 try:
     from ._version import __version__
 except:
     __version__ = '0.0dev'
 
-__all__ = ['dss', 'DSS', 'DSS_GR', 'prime_api_util', 'api_util', 'DSSException', 'patch_dss_com', 'set_case_insensitive_attributes', 'enums', 'IOddieDSS', 'OddieOptions']
\ No newline at end of file
+__all__ = ['dss', 'DSS', 'DSS_GR', 'prime_api_util', 'api_util', 'DSSException', 'GRView', 'patch_dss_com', 'set_case_insensitive_attributes', 'enums', 'IOddieDSS', 'OddieOptions']
\ No newline at end of file
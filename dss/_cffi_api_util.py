@@ -1,10 +1,11 @@
 from __future__ import annotations
 import warnings
 from functools import partial
-from weakref import ref, WeakKeyDictionary
+from weakref import ref, WeakKeyDictionary, WeakSet
 import numpy as np
 from ._types import Float64Array, Int32Array, Int8Array, ComplexArray, Float64ArrayOrComplexArray, Float64ArrayOrSimpleComplex
-from typing import Any, AnyStr, Callable, List, Union, Iterator
+from types import MappingProxyType
+from typing import Any, AnyStr, Callable, Dict, Generic, List, Mapping, Optional, Tuple, Type, TypeVar, Union, Iterator
 from .enums import AltDSSEvent
 from dss_python_backend.events import get_manager_for_ctx
 
@@ -13,9 +14,56 @@ codec = 'UTF8'
 
 interface_classes = set()
 
+# For `to_columns`: (class, property name) -> (name, dtype name, raw function name, getter), or None if not readable
+_column_plans = {}
+_column_dtypes = {'float': np.float64, 'int': np.int32, 'bool': np.bool_}
+
+# For `set_all`: (class, property name) -> (dtype name, raw function name, setter)
+_setter_plans = {}
+
 warn_wrong_case = False
+use_case_aliases = False
+
+def _find_class_attribute(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+
+    return None
+
+
+def _add_case_alias(cls, alias: str, name: str) -> bool:
+    '''
+    Adds `alias` to `cls` as a copy of the class attribute (property, method or slot descriptor) `name`,
+    if that doesn't shadow an existing attribute.
+    '''
+    if _find_class_attribute(cls, alias) is not None:
+        return False
+
+    value = _find_class_attribute(cls, name)
+    if value is None:
+        return False
+
+    setattr(cls, alias, value)
+    cls._dss_aliases.add(alias)
+    return True
+
+
+def _add_case_aliases(cls):
+    for name in cls._dss_original_attributes:
+        for alias in (name.lower(), name.upper(), name[0].upper() + name[1:].lower(), name[0].lower() + name[1:]):
+            if alias != name:
+                _add_case_alias(cls, alias, name)
+
+
+def _remove_case_aliases(cls):
+    for alias in cls._dss_aliases:
+        delattr(cls, alias)
+
+    cls._dss_aliases.clear()
+
 
-def set_case_insensitive_attributes(use: bool = True, warn: bool = False):
+def set_case_insensitive_attributes(use: bool = True, warn: bool = False, fallback: bool = True):
     '''
     This function is provided to allow easier migration from `win32com.client`.
     
@@ -23,9 +71,18 @@ def set_case_insensitive_attributes(use: bool = True, warn: bool = False):
     any of the COM-related items. When migrating or testing with DSS-Python,
     users can then use this function to continue using the same code, optionally
     emitting warnings when the canonical casing is different from the one used.
-    Note that there is a small overhead for allowing case-insensitive names,
-    thus is not recommended to continue using it after migration/adjustments to
-    the user code.
+
+    Without warnings, this is implemented by adding aliases to the classes for the 
+    common capitalizations of each name (e.g. for `AllowForms`: `allowforms`, `ALLOWFORMS`, 
+    `Allowforms` and `allowForms`), so there is no overhead for attribute accesses or
+    assignments. With `fallback` (default), other capitalizations are resolved on reads 
+    through a `__getattr__` hook, which only runs for names not found otherwise, and added 
+    as aliases when first used. Assignments are only resolved through the aliases, i.e. 
+    other capitalizations can be assigned after they are read once. Disable the fallback 
+    to support only the capitalizations listed above.
+
+    When warnings are enabled, every attribute access and assignment is checked, 
+    which has a small performance overhead. 
 
     Currently, this also affects all Python packages from DSS-Extensions:
     
@@ -35,27 +92,45 @@ def set_case_insensitive_attributes(use: bool = True, warn: bool = False):
 
     - AltDSS-Python (`altdss` package): done to allow users to employ the 
       case-insensitive mechanism to address DSS properties in Python code.
-
-    Since there is a small performance overhead, users are recommended to use this
-    mechanism as a transition before adjusting the code.
     '''
+    global warn_wrong_case, use_case_aliases
     if use:
-        global warn_wrong_case
         warn_wrong_case = warn
         if warn_wrong_case:
+            use_case_aliases = False
+            for cls in interface_classes:
+                _remove_case_aliases(cls)
+
             Base.__getattr__ = Base._getattr_case_check
             Base.__setattr__ = Base._setattr_case_check
         else:
-            Base.__getattr__ = Base._getattr
-            Base.__setattr__ = Base._setattr
+            use_case_aliases = True
+            for cls in interface_classes:
+                _add_case_aliases(cls)
+
+            if fallback:
+                Base.__getattr__ = Base._getattr
+            elif '__getattr__' in Base.__dict__:
+                del Base.__getattr__
+
+            if '__setattr__' in Base.__dict__:
+                del Base.__setattr__
+
+        return
 
-    elif getattr(Base, '__getattr__', None) == Base._getattr or getattr(Base, '__getattr__', None) == Base._getattr_case_check:
+    use_case_aliases = False
+    for cls in interface_classes:
+        _remove_case_aliases(cls)
+
+    if '__setattr__' in Base.__dict__:
         del Base.__setattr__
+
+    if '__getattr__' in Base.__dict__:
         del Base.__getattr__
 
 
 def _is_case_insensitive() -> bool:
-    return (getattr(Base, '__getattr__', None) == Base._getattr or getattr(Base, '__getattr__', None) == Base._getattr_case_check)
+    return use_case_aliases or getattr(Base, '__getattr__', None) == Base._getattr_case_check
 
 
 class DSSException(Exception):
@@ -67,6 +142,107 @@ class DSSException(Exception):
 DssException = DSSException
 use_com_compat = set_case_insensitive_attributes
 
+
+class GRView(np.ndarray):
+    '''
+    Read-only NumPy array borrowing the memory of the global result (GR) buffers of a DSS context.
+
+    The data is only valid until the next GR call in the same DSS context, which may overwrite
+    or even reallocate the buffer. Use `valid` to check if the data is still current, and
+    `copy()` (which returns a plain `numpy.ndarray`) to keep the values.
+
+    See `IDSS.BorrowedGRArrays`.
+
+    **(API Extension)**
+    '''
+
+    def __array_finalize__(self, obj):
+        self._gr_util = getattr(obj, '_gr_util', None)
+        self._gr_generation = getattr(obj, '_gr_generation', -1)
+
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        # Results from ufuncs own their memory, so there is nothing to track
+        arr = arr.view(np.ndarray)
+        if return_scalar:
+            return arr[()]
+
+        return arr
+
+    @property
+    def valid(self) -> bool:
+        '''False if a GR call was issued after this view was created, i.e. the data is stale.'''
+        util = self._gr_util
+        return util is not None and util._gr_generation == self._gr_generation
+
+    def copy(self, order='C') -> np.ndarray:
+        return np.array(self, order=order, copy=True, subok=False)
+
+
+_T = TypeVar('_T')
+
+class LazyInterface(Generic[_T]):
+    '''
+    Descriptor for the sub-interfaces (e.g. `ICircuit.Loads`), creating the interface object
+    on first access. The object is then stored in the instance `__dict__`, under the attribute
+    name and its aliases (the same descriptor under other names, e.g. `ICircuit.ISources`), so
+    next accesses don't go through the descriptor. The owner class should use `_setattr_existing`
+    to avoid new attributes in the `__dict__` on assignments.
+
+    If `available` is provided, it is called with the `CffiApiUtil` instance; the attribute
+    is None if it returns False (e.g. for interfaces not available on Oddie).
+    '''
+    __slots__ = ('cls', 'available', 'names')
+
+    def __init__(self, cls: Type[_T], available: Optional[Callable] = None):
+        self.cls = cls
+        self.available = available
+        self.names = []
+
+    def __set_name__(self, owner, name: str):
+        self.names.append(name)
+
+    def __get__(self, obj, objtype=None) -> _T:
+        if obj is None:
+            return self
+
+        attrs = obj.__dict__
+        name = self.names[0]
+        if name in attrs:
+            return attrs[name]
+
+        value = None
+        api_util = obj._api_util
+        if self.available is None or self.available(api_util):
+            value = self.cls(api_util)
+
+        for name in self.names:
+            attrs[name] = value
+
+        return value
+
+
+def _setattr_existing(self, name: str, value):
+    '''
+    `__setattr__` for the interfaces with a `LazyInterface`, whose instances have a `__dict__`:
+    only existing attributes can be assigned, so that typos (e.g. `DSS.AllowFormz = False`) are
+    not silently accepted. With the case-insensitive hooks (see `set_case_insensitive_attributes`),
+    the name is checked after resolving its capitalization.
+    '''
+    cls = type(self)
+    resolved = name
+    if '__setattr__' in Base.__dict__:
+        resolved = cls._dss_attributes.get(name.lower(), name)
+
+    if not hasattr(cls, resolved) or isinstance(getattr(cls, resolved), LazyInterface):
+        raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+
+    Base.__setattr__(self, name, value)
+
+
+def _not_odd(api_util) -> bool:
+    return not api_util._is_odd
+
+
 class CtxLib:
     '''
     Exposes a CFFI Lib object pre-binding the DSSContext (`ctx`) object to the
@@ -87,15 +263,26 @@ class CtxLib:
             
         return result
 
-    def __init__(self, ctx, ffi, lib):
-        self._ctx = ctx
-        self._ffi = ffi
-        self._errorPtr = _errorPtr = lib.ctx_Error_Get_NumberPtr(ctx)
+    # For each CFFI lib, the list of (name, value, binding mode), shared by all contexts
+    _bind_tables = {}
+
+    _BIND_NONE = 0
+    _BIND_CTX = 1
+    _BIND_CTX_CHECKED = 2
+    _BIND_CHECKED = 3
 
+    @staticmethod
+    def _get_bind_table(lib) -> List[Tuple[str, Any, int]]:
+        cached = CtxLib._bind_tables.get(id(lib))
+        if cached is not None and cached[0] is lib:
+            return cached[1]
+
+        table = []
         done = set()
+        lib_items = vars(lib).items()
 
         # First, process all `ctx_*`` functions
-        for name, value in vars(lib).items():
+        for name, value in lib_items:
             is_ctx = name.startswith('ctx_')
             if not is_ctx and not name.startswith(('Batch_Create', 'Batch_Filter', )):
                 continue
@@ -104,41 +291,62 @@ class CtxLib:
             if name in {'ctx_New', 'ctx_Dispose', 'ctx_Get_Prime', 'ctx_Set_Prime', 'ctx_Error_Set_Description'}:
                 if name == 'ctx_Error_Set_Description':
                     name = name[4:]
-                    setattr(self, name, partial(value, ctx))
+                    table.append((name, value, CtxLib._BIND_CTX))
                 else:
-                    setattr(self, name, value)
+                    table.append((name, value, CtxLib._BIND_NONE))
             elif is_ctx:
                 name = name[4:]
-                setattr(self, name, partial(value, ctx))
-                # setattr(self, name, partial(self._error_checked, _errorPtr, partial(value, ctx)))
+                table.append((name, value, CtxLib._BIND_CTX))
+                # table.append((name, value, CtxLib._BIND_CTX_CHECKED))
             else:
-                setattr(self, name, partial(value, ctx))
-                # setattr(self, name, partial(self._error_checked, _errorPtr, partial(value, ctx)))
+                table.append((name, value, CtxLib._BIND_CTX))
+                # table.append((name, value, CtxLib._BIND_CTX_CHECKED))
 
             done.add(name)
 
         # Then the new Alt_* family
-        for name, value in vars(lib).items():
+        for name, value in lib_items:
             if (not name.startswith('Alt_')) or name in done:
                 continue
 
             if name.startswith('Alt_Bus'):
-                setattr(self, name, partial(self._error_checked, _errorPtr, partial(value, ctx)))
+                table.append((name, value, CtxLib._BIND_CTX_CHECKED))
             else:
-                setattr(self, name, partial(self._error_checked, _errorPtr, value))
+                table.append((name, value, CtxLib._BIND_CHECKED))
 
             done.add(name)
 
         # Finally the remaining fields
-        for name, value in vars(lib).items():
+        for name, value in lib_items:
             if name.startswith('ctx_') or name in done:
                 continue
 
-            setattr(self, name, value)
+            table.append((name, value, CtxLib._BIND_NONE))
             # if isinstance(value, int):
-            #     setattr(self, name, value)
+            #     table.append((name, value, CtxLib._BIND_NONE))
             # else:
-            #     setattr(self, name, partial(self._error_checked, _errorPtr, value))
+            #     table.append((name, value, CtxLib._BIND_CHECKED))
+
+        CtxLib._bind_tables[id(lib)] = (lib, table)
+        return table
+
+    def __init__(self, ctx, ffi, lib):
+        self._ctx = ctx
+        self._ffi = ffi
+        self._errorPtr = _errorPtr = lib.ctx_Error_Get_NumberPtr(ctx)
+
+        # The classification of the lib functions is done only once, here we just bind them
+        attrs = self.__dict__
+        error_checked = self._error_checked
+        for name, value, mode in CtxLib._get_bind_table(lib):
+            if mode == CtxLib._BIND_CTX:
+                attrs[name] = partial(value, ctx)
+            elif mode == CtxLib._BIND_NONE:
+                attrs[name] = value
+            elif mode == CtxLib._BIND_CTX_CHECKED:
+                attrs[name] = partial(error_checked, _errorPtr, partial(value, ctx))
+            else:
+                attrs[name] = partial(error_checked, _errorPtr, value)
 
 
 class Base:
@@ -169,64 +377,41 @@ class Base:
         '_prepare_complex128_simple',
         '_errorPtr',
         '_frozen_attrs',
+        '__weakref__',
     ]
 
     _use_exceptions = True
 
+    # Property name -> DSS C-API function, called directly by `to_columns` and `set_all`. Only for
+    # properties that return/pass the value as is (float, int, bool, or str for getters); the other
+    # properties are read/written through their Python implementation.
+    _column_getters = {}
+    _column_setters = {}
+
     def __init__(self, api_util, prefer_lists=False):
         object.__setattr__(self, '_frozen_attrs', False)
         self._lib = api_util.lib
         self._api_util = api_util
-        self._get_string = api_util.get_string
-
-        self._get_fcomplex128_gr_array = api_util.get_fcomplex128_gr_array
-        self._get_fcomplex128_array = api_util.get_fcomplex128_array
-        self._get_fcomplex128_simple = api_util.get_fcomplex128_simple
-        self._get_fcomplex128_gr_simple = api_util.get_fcomplex128_gr_simple
-        if not prefer_lists:
-            # Use NumPy arrays for most functions
-            self._get_float64_array = api_util.get_float64_array
-            self._get_float64_gr_array = api_util.get_float64_gr_array
-            self._get_int32_array = api_util.get_int32_array
-            self._get_int32_gr_array = api_util.get_int32_gr_array
-            self._get_int8_array = api_util.get_int8_array
-            self._get_int8_gr_array = api_util.get_int8_gr_array
-            self._get_string_array = api_util.get_string_array
-            
-            self._get_complex128_array = api_util.get_complex128_array
-            self._get_complex128_simple = api_util.get_complex128_simple
-            self._get_complex128_gr_array = api_util.get_complex128_gr_array
-            self._get_complex128_gr_simple = api_util.get_complex128_gr_simple
-        else:
-            # Classic OpenDSSDirect.py style, using mostly lists
-            self._get_float64_array = api_util.get_float64_array2
-            self._get_float64_gr_array = api_util.get_float64_gr_array2
-            self._get_int32_array = api_util.get_int32_array2
-            self._get_int32_gr_array = api_util.get_int32_gr_array2
-            self._get_int8_array = api_util.get_int8_array2
-            self._get_int8_gr_array = api_util.get_int8_gr_array2
-            self._get_string_array = api_util.get_string_array2
-            
-            self._get_complex128_array = api_util.get_complex128_array2
-            self._get_complex128_simple = api_util.get_complex128_simple2
-            self._get_complex128_gr_array = api_util.get_complex128_gr_array2
-            self._get_complex128_gr_simple = api_util.get_complex128_gr_simple2
-
-        self._prepare_complex128_array = api_util.prepare_complex128_array
-        self._prepare_complex128_simple = api_util.prepare_complex128_simple
-        self._set_string_array = api_util.set_string_array
-        self._prepare_float64_array = api_util.prepare_float64_array
-        self._prepare_int32_array = api_util.prepare_int32_array
-        self._prepare_string_array = api_util.prepare_string_array
-        self._errorPtr = self._lib.Error_Get_NumberPtr()
+        # The bound methods are shared by all interfaces of the same DSS Context
+        for name, value in api_util.get_interface_table(bool(prefer_lists)):
+            object.__setattr__(self, name, value)
 
+        self._errorPtr = api_util._check_ptr # not the engine pointer inside IDSS.deferred_errors
+        api_util._interfaces.add(self) # for IDSS.deferred_errors
 
         cls = type(self)
         if cls not in interface_classes:
             interface_classes.add(cls)
-            cls._dss_original_attributes = {a for a in dir(self) if not a.startswith('_')}
+            aliases = set()
+            for klass in cls.__mro__:
+                aliases.update(klass.__dict__.get('_dss_aliases', ()))
+
+            cls._dss_aliases = set()
+            cls._dss_original_attributes = {a for a in dir(self) if not a.startswith('_')} - aliases
             lowercase_map = {a.lower(): a for a in cls._dss_original_attributes}
             cls._dss_attributes = lowercase_map
+            if use_case_aliases:
+                _add_case_aliases(cls)
 
 
     @staticmethod
@@ -268,12 +453,211 @@ class Base:
             
         return result
 
+    def _get_name_list(self, key, count_func: Callable, func: Callable) -> Union[List[str], Tuple[str, ...]]:
+        '''
+        Returns the string list from `func`, or the cached tuple from `CffiApiUtil.get_name_list`
+        if `CachedNameLists` is enabled for the DSS Context.
+        '''
+        api_util = self._api_util
+        if not api_util._cache_name_lists:
+            return self._check_for_error(self._get_string_array(func))
+
+        return api_util.get_name_list(key, self._check_for_error(count_func()), self._get_string_array, func)
+
+    def _get_lookup(self, key: str, names_key: str, count_func: Callable, func: Callable, build: Callable) -> Mapping:
+        '''
+        Returns a read-only mapping built from a name list, cached in the same storage used 
+        for `CachedNameLists` (and hence invalidated by the same events).
+        '''
+        api_util = self._api_util
+        count = self._check_for_error(count_func())
+        if api_util._is_odd:
+            # No events to invalidate the cache, so always rebuild the mapping
+            return MappingProxyType(build(self._check_for_error(self._get_string_array(func))))
+
+        cached = api_util._name_lists.get(key)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+
+        names = api_util.get_name_list(names_key, count, self._get_string_array, func)
+        mapping = MappingProxyType(build(names))
+        api_util._name_lists[key] = (count, mapping)
+        return mapping
+
+    def read_into(self, name: str, out: np.ndarray, *args) -> np.ndarray:
+        '''
+        Method form of the array getters based on the global result (GR) buffers, copying
+        the result directly into the caller-owned array `out` instead of allocating a new one.
+        The number of elements of `out` must match the result. Returns `out`.
+
+        `name` is the name of the property (e.g. `"AllBusVmagPu"`) or method (e.g. `"AllMaxCurrents"`);
+        for methods, extra positional arguments are passed through `args`.
+
+        This is especially useful for time-series simulations, filling rows of a preallocated matrix:
+
+            circ = DSS.ActiveCircuit
+            vmag = np.empty((num_steps, circ.NumNodes))
+            for step in range(num_steps):
+                circ.Solution.Solve()
+                circ.read_into('AllBusVmagPu', vmag[step])
+
+        Complex results (e.g. `AllBusVolts`) can be copied into either complex or float64 arrays.
+
+        **(API Extension)**
+        '''
+        api_util = self._api_util
+        api_util._gr_out = out
+        try:
+            res = getattr(self, name)
+            if callable(res):
+                res = res(*args)
+        finally:
+            api_util._gr_out = None
+
+        if res is not out:
+            raise TypeError(f'"{type(self).__name__}.{name}" is not an array getter based on the GR buffers.')
+
+        return out
+
+    @staticmethod
+    def _annotation_name(kind) -> Optional[str]:
+        if not isinstance(kind, str):
+            kind = getattr(kind, '__name__', None)
+
+        return kind
+
+    @staticmethod
+    def _get_column_getter(cls, name: str) -> Optional[tuple]:
+        '''
+        Resolves the getter of a single property for `to_columns`. The properties listed in the
+        `_column_getters` table of the class are read directly from the DSS C-API function; the
+        others fall back to the Python property getter. Returns None if the property is not readable.
+        '''
+        key = (cls, name)
+        try:
+            return _column_plans[key]
+        except KeyError:
+            pass
+
+        fget = getattr(cls, name, None)
+        if isinstance(fget, property):
+            fget = fget.fget
+
+        if not callable(fget) or not hasattr(fget, '__code__') or fget.__code__.co_argcount != 1:
+            # Only properties and methods without arguments (e.g. `Fuses.IsBlown`) are supported
+            getter = None
+        else:
+            raw_name = cls._column_getters.get(name)
+            kind = Base._annotation_name(fget.__annotations__.get('return'))
+            if raw_name is not None and kind not in _column_dtypes and kind != 'str':
+                raise TypeError(f'"{cls.__name__}.{name}": unsupported type "{kind}" for a direct getter')
+
+            getter = (name, kind if raw_name is not None else None, raw_name, fget)
+
+        _column_plans[key] = getter
+        return getter
+
+    @staticmethod
+    def _get_column_plan(cls, props: Optional[Tuple[str, ...]]) -> list:
+        '''
+        Resolves the getters for `to_columns`, see `_get_column_getter`. When `props` is None, 
+        the representation columns are used, skipping methods that require arguments.
+        '''
+        if props is None:
+            return [getter for getter in map(partial(Base._get_column_getter, cls), cls._columns) if getter is not None]
+
+        plan = []
+        for name in props:
+            getter = Base._get_column_getter(cls, name)
+            if getter is None:
+                raise AttributeError(f'"{cls.__name__}" has no readable property "{name}"')
+
+            plan.append(getter)
+
+        return plan
+
+    @staticmethod
+    def _get_setter_plan(cls, prop: str) -> tuple:
+        '''
+        Resolves the setter for `set_all`. The properties listed in the `_column_setters` table
+        of the class are set directly through the DSS C-API function; the others fall back to 
+        the Python property setter.
+        '''
+        key = (cls, prop)
+        plan = _setter_plans.get(key)
+        if plan is not None:
+            return plan
+
+        fset = getattr(cls, prop, None)
+        if not isinstance(fset, property) or fset.fset is None:
+            raise AttributeError(f'"{cls.__name__}" has no writable property "{prop}"')
+
+        fset = fset.fset
+        raw_name = cls._column_setters.get(prop)
+        kind = Base._annotation_name(fset.__annotations__.get('Value'))
+        if raw_name is not None and kind not in _column_dtypes:
+            raise TypeError(f'"{cls.__name__}.{prop}": unsupported type "{kind}" for a direct setter')
+
+        plan = (kind if raw_name is not None else None, raw_name, fset)
+        _setter_plans[key] = plan
+        return plan
+
+    def _to_columns(self, props: Optional[List[str]], get_first: Callable, get_next: Callable, count: int) -> Dict[str, Union[np.ndarray, List[Any]]]:
+        plan = Base._get_column_plan(type(self), None if props is None else tuple(props))
+        lib = self._lib
+        get_string = self._get_string
+        result = {}
+        numeric_cols = []
+        string_cols = []
+        other_cols = []
+        for name, kind, raw_name, fget in plan:
+            if kind is None:
+                col = []
+                other_cols.append((col.append, fget))
+            elif kind == 'str':
+                col = []
+                string_cols.append((col.append, getattr(lib, raw_name)))
+            else:
+                col = np.empty(count, dtype=_column_dtypes[kind])
+                numeric_cols.append((col, getattr(lib, raw_name)))
+
+            result[name] = col
+
+        # Errors from the direct calls are only checked once, at the end; the
+        # fallback getters still check for errors as usual.
+        row = 0
+        idx = self._check_for_error(get_first())
+        while idx != 0 and row < count:
+            for col, func in numeric_cols:
+                col[row] = func()
+            for append, func in string_cols:
+                append(get_string(func()))
+            for append, fget in other_cols:
+                append(fget(self))
+
+            row += 1
+            idx = get_next()
+
+        self._check_for_error()
+        if row < count:
+            # Disabled elements are skipped, unless Settings.IterateDisabled is set
+            for name, col in result.items():
+                if isinstance(col, np.ndarray):
+                    result[name] = col[:row]
+
+        return result
+
     def _getattr(self, key):
+        # Only called for names without an alias, see set_case_insensitive_attributes
         if key[0] == '_':
             return object.__getattribute__(self, key)
 
-        key = self.__class__._dss_attributes.get(key.lower(), key)
-        return object.__getattribute__(self, key)
+        cls = self.__class__
+        correct_key = cls._dss_attributes.get(key.lower(), key)
+        if correct_key != key and use_case_aliases:
+            _add_case_alias(cls, key, correct_key)
+
+        return object.__getattribute__(self, correct_key)
 
     def _getattr_case_check(self, key):
         if key[0] == '_':
@@ -285,14 +669,6 @@ class Base:
 
         return object.__getattribute__(self, correct_key)
 
-    def _setattr(self, key, value):
-        if key[0] == '_':
-            object.__setattr__(self, key, value)
-            return
-
-        key = self.__class__._dss_attributes.get(key.lower(), key)
-        object.__setattr__(self, key, value)
-
     def _setattr_case_check(self, key, value):
         if key[0] == '_':
             object.__setattr__(self, key, value)
@@ -356,8 +732,17 @@ class CffiApiUtil(object):
         CffiApiUtil._ctx_to_util[ctx] = self
 
         self._allow_complex = False
+        self._borrow_gr = False
+        self._gr_generation = 0
+        self._gr_out = None
+        self._cache_name_lists = False
+        self._name_lists = {}
+        self._interfaces = WeakSet()
+        self._interface_tables = {}
+        self._deferred_errors = 0
         self.track_objects = True
         self.init_buffers()
+        self._check_ptr = self._errorPtr
         self.register_callbacks()
 
 
@@ -373,9 +758,9 @@ class CffiApiUtil(object):
         Note that, **in the future**, we may try showing a popup form like the official OpenDSS does on Windows
         if AllowForms is True. This behavior is not very portable though and not adequate for automated scripts.
         """
-        if self._errorPtr[0] and Base._use_exceptions:
-            error_num = self._errorPtr[0]
-            self._errorPtr[0] = 0
+        if self._check_ptr[0] and Base._use_exceptions:
+            error_num = self._check_ptr[0]
+            self._check_ptr[0] = 0
             raise DSSException(error_num, self.get_string(self.lib.Error_Get_Description()))
             
         return result
@@ -385,6 +770,7 @@ class CffiApiUtil(object):
         '''
         Used internally to remap buses to Python objects after the bus list is built.
         '''
+        self._name_lists.clear()
         if self._is_clearing:
             return
 
@@ -436,6 +822,7 @@ class CffiApiUtil(object):
 
 
     def clear_callback(self, step: int):
+        self._name_lists.clear()
         if step == 0:
             # Mark that we're clearing
             self._is_clearing = True
@@ -490,6 +877,7 @@ class CffiApiUtil(object):
         self.clear_callback(0)
         self.clear_callback(1)
         self.unregister_callbacks()
+        self.dispose_scratch_buffers()
 
     #     self.lib.DSSEvents_UnregisterAlt(AltDSSEvent.Clear, self.lib_unpatched.altdss_python_util_callback)
     #     self.lib.DSSEvents_UnregisterAlt(AltDSSEvent.ReprocessBuses, self.lib_unpatched.altdss_python_util_callback)
@@ -534,25 +922,91 @@ class CffiApiUtil(object):
         # also keep a casted version for complex floats
         self.gr_cfloat64_pointers = (self.ffi.cast('double _Complex**', tmp_float64_pointers[0][0]), tmp_float64_pointers[1][0])
 
+        # Persistent pointer/count cells for the non-GR getters, to avoid allocating new cells on 
+        # every call. The engine uses the second count as the current capacity, so the numeric 
+        # buffers are kept between calls and only reallocated when a larger array is required.
+        # The string arrays are still disposed after each call.
+        self.scratch_string_pointers = (self.ffi.new('char***'), self.ffi.new('int32_t[4]'))
+        self.scratch_float64_pointers = (self.ffi.new('double**'), self.ffi.new('int32_t[4]'))
+        self.scratch_int32_pointers = (self.ffi.new('int32_t**'), self.ffi.new('int32_t[4]'))
+        self.scratch_int8_pointers = (self.ffi.new('int8_t**'), self.ffi.new('int32_t[4]'))
+        self.scratch_ptr_pointers = (self.ffi.new('void***'), self.ffi.new('int32_t[4]'))
+
         self._errorPtr = self.lib.Error_Get_NumberPtr()
 
+    def dispose_scratch_buffers(self):
+        '''
+        Releases the memory kept by the scratch cells of the non-GR getters.
+        '''
+        lib = self.lib
+        lib.DSS_Dispose_PDouble(self.scratch_float64_pointers[0])
+        lib.DSS_Dispose_PInteger(self.scratch_int32_pointers[0])
+        lib.DSS_Dispose_PByte(self.scratch_int8_pointers[0])
+        lib.DSS_Dispose_PPointer(self.scratch_ptr_pointers[0])
+        for _, cnt in (self.scratch_float64_pointers, self.scratch_int32_pointers, self.scratch_int8_pointers, self.scratch_ptr_pointers):
+            cnt[0] = cnt[1] = cnt[2] = cnt[3] = 0
+
 
     def clear_buffers(self):
+        self._gr_generation += 1
+        self.dispose_scratch_buffers()
         self.lib.DSS_DisposeGRData()
         self.lib.DSS_ResetStringBuffer()
         self.init_buffers()
 
+    def _copy_gr_to_out(self, ptr, cnt, dtype):
+        '''
+        Copies the GR data to the destination array provided through `Base.read_into`, 
+        consuming it. Returns the destination array.
+
+        Complex results are handled as float64 pairs; they are reinterpreted as complex 
+        numbers if the destination array is complex.
+        '''
+        out = self._gr_out
+        self._gr_out = None
+        dtype = np.dtype(dtype)
+        src = np.frombuffer(self.ffi.buffer(ptr, cnt[0] * dtype.itemsize), dtype=dtype)
+        if dtype == np.float64 and out.dtype.kind == 'c':
+            src = src.view(complex)
+
+        if src.size != out.size:
+            raise ValueError(f'Destination array has {out.size} elements, but the result has {src.size} elements.')
+
+        if self._allow_complex and cnt[3] and out.ndim == 2 and src.size == cnt[2] * cnt[3]:
+            src = src.reshape((cnt[2], cnt[3]), order='F')
+        else:
+            src = src.reshape(out.shape)
+
+        np.copyto(out, src, casting='same_kind')
+        return out
+
+    def _borrow_gr_buffer(self, ptr, size: int, dtype) -> GRView:
+        '''
+        Wraps the GR data pointer in a read-only GRView, tagged with the current GR generation.
+        '''
+        res = np.frombuffer(self.ffi.buffer(ptr, size), dtype=dtype).view(GRView)
+        res.flags.writeable = False
+        res._gr_util = self
+        res._gr_generation = self._gr_generation
+        return res
+
+    def invalidate_gr_views(self):
+        '''
+        Marks the GR views borrowed so far as stale (see `GRView.valid`). The GR getters of this
+        class already do this; call it after using a GR function from the DSS C-API directly.
+        '''
+        self._gr_generation += 1
+
     def get_string(self, b) -> str:
         if b != self.ffi.NULL:
             return self.ffi.string(b).decode(self.codec)
         return u''
 
     def get_float64_array(self, func, *args) -> Float64Array:
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=np.float64).copy()
-        self.lib.DSS_Dispose_PDouble(ptr)
 
         if self._allow_complex and cnt[3]:
             # If the last element is filled, we have a matrix.  Otherwise, the 
@@ -566,11 +1020,10 @@ class CffiApiUtil(object):
             return self.get_float64_array(func, *args)
 
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=complex).copy()
-        self.lib.DSS_Dispose_PDouble(ptr)
 
         if cnt[3]:
             # If the last element is filled, we have a matrix.  Otherwise, the 
@@ -581,14 +1034,13 @@ class CffiApiUtil(object):
 
     def get_fcomplex128_array(self, func, *args) -> Union[ComplexArray, None]:
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         if cnt[0] == 1: # empty
             res = None
         else:
             res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=complex).copy()
-        self.lib.DSS_Dispose_PDouble(ptr)
 
         if cnt[3]:
             # If the last element is filled, we have a matrix.  Otherwise, the 
@@ -602,12 +1054,11 @@ class CffiApiUtil(object):
             return self.get_float64_array2(func, *args)
 
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         ptr = self.ffi.cast('double _Complex **', ptr)
         res = self.ffi.unpack(ptr[0], cnt[0] >> 1)
-        self.lib.DSS_Dispose_PDouble(ptr)
         return res
 
 
@@ -616,25 +1067,19 @@ class CffiApiUtil(object):
             return self.get_float64_array(func, *args)
 
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
-        try:
-            assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
-            return self.ffi.cast('double _Complex**', ptr)[0][0]
-        finally:
-            self.lib.DSS_Dispose_PDouble(ptr)
+        assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
+        return self.ffi.cast('double _Complex**', ptr)[0][0]
 
     def get_fcomplex128_simple(self, func, *args) -> Float64ArrayOrSimpleComplex:
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
-        try:
-            assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
-            return self.ffi.cast('double _Complex**', ptr)[0][0]
-        finally:
-            self.lib.DSS_Dispose_PDouble(ptr)
+        assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
+        return self.ffi.cast('double _Complex**', ptr)[0][0]
 
 
     def get_complex128_simple2(self, func, *args) -> List[Union[complex, float]]:
@@ -642,18 +1087,26 @@ class CffiApiUtil(object):
             return self.get_float64_array2(func, *args)
 
         # Currently we use the same as API as get_float64_array, may change later
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
-        try:
-            assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
-            return self.ffi.cast('double _Complex**', ptr)[0][0]
-        finally:
-            self.lib.DSS_Dispose_PDouble(ptr)
+        assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
+        return self.ffi.cast('double _Complex**', ptr)[0][0]
 
 
     def get_float64_gr_array(self) -> Float64Array:
         ptr, cnt = self.gr_float64_pointers
+        self._gr_generation += 1
+        if self._gr_out is not None:
+            return self._copy_gr_to_out(ptr[0], cnt, np.float64)
+
+        if self._borrow_gr:
+            res = self._borrow_gr_buffer(ptr[0], cnt[0] * 8, np.float64)
+            if self._allow_complex and cnt[3]:
+                return res.reshape((cnt[2], cnt[3]), order='F')
+
+            return res
+
         if self._allow_complex and cnt[3]:
             return np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=np.float64).copy().reshape((cnt[2], cnt[3]), order='F')
         
@@ -666,6 +1119,17 @@ class CffiApiUtil(object):
 
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_float64_pointers
+        self._gr_generation += 1
+        if self._gr_out is not None:
+            return self._copy_gr_to_out(ptr[0], cnt, np.float64)
+
+        if self._borrow_gr:
+            res = self._borrow_gr_buffer(ptr[0], cnt[0] * 8, complex)
+            if self._allow_complex and cnt[3]:
+                return res.reshape((cnt[2], cnt[3]), order='F')
+
+            return res
+
         if self._allow_complex and cnt[3]:
             return np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=complex).copy().reshape((cnt[2], cnt[3]), order='F')
         
@@ -675,6 +1139,17 @@ class CffiApiUtil(object):
     def get_fcomplex128_gr_array(self) -> ComplexArray:
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_float64_pointers
+        self._gr_generation += 1
+        if self._gr_out is not None:
+            return self._copy_gr_to_out(ptr[0], cnt, np.float64)
+
+        if self._borrow_gr:
+            res = self._borrow_gr_buffer(ptr[0], cnt[0] * 8, complex)
+            if self._allow_complex and cnt[3]:
+                return res.reshape((cnt[2], cnt[3]), order='F')
+
+            return res
+
         if self._allow_complex and cnt[3]:
             return np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 8), dtype=complex).copy().reshape((cnt[2], cnt[3]), order='F')
         
@@ -687,6 +1162,7 @@ class CffiApiUtil(object):
 
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_float64_pointers
+        self._gr_generation += 1
         ptr = self.ffi.cast('double _Complex **', ptr)
         return self.ffi.unpack(ptr[0], cnt[0] >> 1)
 
@@ -697,6 +1173,7 @@ class CffiApiUtil(object):
 
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_cfloat64_pointers
+        self._gr_generation += 1
         assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
         return ptr[0][0]
 
@@ -704,6 +1181,7 @@ class CffiApiUtil(object):
     def get_fcomplex128_gr_simple(self) -> complex:
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_cfloat64_pointers
+        self._gr_generation += 1
         assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
         return ptr[0][0]
 
@@ -714,16 +1192,16 @@ class CffiApiUtil(object):
 
         # Currently we use the same as API as get_float64_array, may change later
         ptr, cnt = self.gr_cfloat64_pointers
+        self._gr_generation += 1
         assert cnt[0] == 2, ('Unexpected number of elements returned by API', cnt[0])
         return ptr[0][0]
 
 
     def get_int32_array(self, func: Callable, *args) -> Int32Array:
-        ptr = self.ffi.new('int32_t**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_int32_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 4), dtype=np.int32).copy()
-        self.lib.DSS_Dispose_PInteger(ptr)
 
         if self._allow_complex and cnt[3]:
             # If the last element is filled, we have a matrix.  Otherwise, the 
@@ -734,16 +1212,26 @@ class CffiApiUtil(object):
 
 
     def get_ptr_array(self, func: Callable, *args):
-        ptr = self.ffi.new('void***')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_ptr_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * np.dtype(np.uintp).itemsize), dtype=np.uintp).copy()
-        self.lib.DSS_Dispose_PPointer(ptr)
         return res
 
 
     def get_int32_gr_array(self) -> Int32Array:
         ptr, cnt = self.gr_int32_pointers
+        self._gr_generation += 1
+        if self._gr_out is not None:
+            return self._copy_gr_to_out(ptr[0], cnt, np.int32)
+
+        if self._borrow_gr:
+            res = self._borrow_gr_buffer(ptr[0], cnt[0] * 4, np.int32)
+            if self._allow_complex and cnt[3]:
+                return res.reshape((cnt[2], cnt[3]))
+
+            return res
+
         if self._allow_complex and cnt[3]:
             return np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 4), dtype=np.int32).copy().reshape((cnt[2], cnt[3]))
 
@@ -751,11 +1239,10 @@ class CffiApiUtil(object):
 
 
     def get_int8_array(self, func: Callable, *args: Any) -> Int8Array:
-        ptr = self.ffi.new('int8_t**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_int8_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         res = np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 1), dtype=np.int8).copy()
-        self.lib.DSS_Dispose_PByte(ptr)
 
         if self._allow_complex and cnt[3]:
             # If the last element is filled, we have a matrix.  Otherwise, the 
@@ -767,6 +1254,17 @@ class CffiApiUtil(object):
 
     def get_int8_gr_array(self) -> Int8Array:
         ptr, cnt = self.gr_int8_pointers
+        self._gr_generation += 1
+        if self._gr_out is not None:
+            return self._copy_gr_to_out(ptr[0], cnt, np.int8)
+
+        if self._borrow_gr:
+            res = self._borrow_gr_buffer(ptr[0], cnt[0] * 1, np.int8)
+            if self._allow_complex and cnt[3]:
+                return res.reshape((cnt[2], cnt[3]), order='F')
+
+            return res
+
         if self._allow_complex and cnt[3]:
             return np.frombuffer(self.ffi.buffer(ptr[0], cnt[0] * 1), dtype=np.int8).copy().reshape((cnt[2], cnt[3]), order='F')
 
@@ -774,8 +1272,8 @@ class CffiApiUtil(object):
 
 
     def get_string_array(self, func: Callable, *args: Any) -> List[str]:
-        ptr = self.ffi.new('char***')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_string_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         if not cnt[0]:
             res = []
@@ -790,12 +1288,85 @@ class CffiApiUtil(object):
                 res = [(self.ffi.string(str_ptr).decode(codec) if (str_ptr != self.ffi.NULL) else u'') for str_ptr in str_ptrs]
 
         self.lib.DSS_Dispose_PPAnsiChar(ptr, cnt[1])
+        cnt[0] = cnt[1] = 0
         return res
 
 
+    def get_interface_table(self, prefer_lists: bool) -> Tuple[Tuple[str, Any], ...]:
+        '''
+        Returns the (attribute name, bound method) pairs used by `Base.__init__`, creating
+        them only once for this DSS Context.
+        '''
+        table = self._interface_tables.get(prefer_lists)
+        if table is not None:
+            return table
+
+        if not prefer_lists:
+            # Use NumPy arrays for most functions
+            suffix = ''
+        else:
+            # Classic OpenDSSDirect.py style, using mostly lists
+            suffix = '2'
+
+        table = tuple(
+            [
+                ('_get_string', self.get_string),
+                ('_get_fcomplex128_gr_array', self.get_fcomplex128_gr_array),
+                ('_get_fcomplex128_array', self.get_fcomplex128_array),
+                ('_get_fcomplex128_simple', self.get_fcomplex128_simple),
+                ('_get_fcomplex128_gr_simple', self.get_fcomplex128_gr_simple),
+            ] + [
+                (f'_{name}', getattr(self, name + suffix))
+                for name in (
+                    'get_float64_array',
+                    'get_float64_gr_array',
+                    'get_int32_array',
+                    'get_int32_gr_array',
+                    'get_int8_array',
+                    'get_int8_gr_array',
+                    'get_string_array',
+                    'get_complex128_array',
+                    'get_complex128_simple',
+                    'get_complex128_gr_array',
+                    'get_complex128_gr_simple',
+                )
+            ] + [
+                ('_prepare_complex128_array', self.prepare_complex128_array),
+                ('_prepare_complex128_simple', self.prepare_complex128_simple),
+                ('_set_string_array', self.set_string_array),
+                ('_prepare_float64_array', self.prepare_float64_array),
+                ('_prepare_int32_array', self.prepare_int32_array),
+                ('_prepare_string_array', self.prepare_string_array),
+            ]
+        )
+        self._interface_tables[prefer_lists] = table
+        return table
+
+    def invalidate_name_lists(self):
+        '''
+        Discards the cached name lists and lookups. Used after running commands, which may 
+        add, remove or rename objects without changing the number of items.
+        '''
+        self._name_lists.clear()
+
+    def get_name_list(self, key, count: int, get_string_array: Callable, func: Callable) -> Tuple[str, ...]:
+        '''
+        Returns the name list identified by `key` as an immutable tuple, reusing the cached
+        tuple while the number of items is still `count`. The whole cache is invalidated when 
+        the circuit is cleared, the bus list is rebuilt, or commands are run.
+        '''
+        cached = self._name_lists.get(key)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+
+        names = tuple(get_string_array(func))
+        self._check_for_error()
+        self._name_lists[key] = (count, names)
+        return names
+
     def get_string_array2(self, func, *args): # for compatibility with OpenDSSDirect.py
-        ptr = self.ffi.new('char***')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_string_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
 
         if not cnt[0]:
@@ -816,6 +1387,7 @@ class CffiApiUtil(object):
                 res = []
 
         self.lib.DSS_Dispose_PPAnsiChar(ptr, cnt[1])
+        cnt[0] = cnt[1] = 0
         return res
 
 
@@ -825,51 +1397,51 @@ class CffiApiUtil(object):
 
 
     def get_float64_array2(self, func, *args):
-        ptr = self.ffi.new('double**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_float64_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         if not cnt[0]:
             res = []
         else:
             res = self.ffi.unpack(ptr[0], cnt[0])
 
-        self.lib.DSS_Dispose_PDouble(ptr)
         return res
 
     def get_float64_gr_array2(self):
         ptr, cnt = self.gr_float64_pointers
+        self._gr_generation += 1
         return self.ffi.unpack(ptr[0], cnt[0])
 
     def get_int32_array2(self, func, *args):
-        ptr = self.ffi.new('int32_t**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_int32_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         if not cnt[0]:
             res = None
         else:
             res = self.ffi.unpack(ptr[0], cnt[0])
 
-        self.lib.DSS_Dispose_PInteger(ptr)
         return res
 
     def get_int32_gr_array2(self):
         ptr, cnt = self.gr_int32_pointers
+        self._gr_generation += 1
         return self.ffi.unpack(ptr[0], cnt[0])
 
     def get_int8_array2(self, func, *args):
-        ptr = self.ffi.new('int8_t**')
-        cnt = self.ffi.new('int32_t[4]')
+        ptr, cnt = self.scratch_int8_pointers
+        cnt[2] = cnt[3] = 0
         func(ptr, cnt, *args)
         if not cnt[0]:
             res = None
         else:
             res = self.ffi.unpack(ptr[0], cnt[0])
 
-        self.lib.DSS_Dispose_PByte(ptr)
         return res
 
     def get_int8_gr_array2(self):
         ptr, cnt = self.gr_int8_pointers
+        self._gr_generation += 1
         return self.ffi.unpack(ptr[0], cnt[0])
 
     def prepare_float64_array(self, value):
@@ -919,9 +1491,58 @@ class CffiApiUtil(object):
 
 
     def prepare_string_array(self, value: List[AnyStr]):
+        '''
+        Prepares a list of strings to be passed to the DSS C-API as a `char**` and count.
+
+        All strings are encoded into a single NUL-separated buffer, and the pointers are computed
+        from the offsets of the separators in that buffer, avoiding a CFFI object per string.
+        Items that are None are passed as NULL pointers.
+
+        Returns a tuple (objects to keep alive during the call, pointers, count).
+        '''
         if value is None:
             raise ValueError("Value cannot be None!")
 
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
+
+        count = len(value)
+        if count == 0:
+            return value, [], 0
+
+        codec = self.codec
+        try:
+            # Fast path, all str
+            data = '\0'.join(value).encode(codec) + b'\0'
+            null_idx = None
+        except TypeError:
+            null_idx = [i for i, v in enumerate(value) if v is None]
+            data = b'\0'.join(
+                v if isinstance(v, bytes) else (b'' if v is None else v.encode(codec))
+                for v in value
+            ) + b'\0'
+
+        ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 0)
+        if len(ends) != count:
+            # Some string contains NUL characters; handle each one separately
+            return self._prepare_string_array_each(value)
+
+        ffi = self.ffi
+        buffer = ffi.from_buffer(data)
+        addresses = np.empty(count, dtype=np.uintp)
+        addresses[0] = 0
+        addresses[1:] = ends[:-1]
+        addresses[1:] += 1
+        addresses += int(ffi.cast('uintptr_t', buffer))
+        if null_idx:
+            addresses[null_idx] = 0
+
+        ptrs = ffi.cast('char**', ffi.from_buffer(addresses))
+        # Need to keep reference to the buffers so they don't get
+        # garbage collected too early
+        return (data, buffer, addresses), ptrs, count
+
+    def _prepare_string_array_each(self, value: List[AnyStr]):
         ptrs = []
         value_enc = []
         codec = self.codec
@@ -1001,10 +1622,119 @@ class Iterable(Base):
             yield self
             idx = self._check_for_error(self._Get_Next())
 
+    def to_columns(self, props: Optional[List[str]] = None) -> Dict[str, Union[np.ndarray, List[Any]]]:
+        '''
+        Reads the properties `props` (by default, the same columns used in the representation of the
+        objects) for all objects of this type in a single pass, returning a dict of columns. 
+        Numeric and boolean properties are returned as NumPy arrays, while strings and other values
+        (arrays, enums) are returned as lists.
+
+        This is equivalent to, but much faster than, iterating the objects and reading each property
+        in Python:
+
+            loads = DSS.ActiveCircuit.Loads
+            cols = loads.to_columns(['Name', 'kW', 'kvar'])
+            # same as: {'kW': np.array([l.kW for l in loads]), ...}
+
+        Simple getters are called directly, with a single error check at the end.
+        As with iteration, disabled elements are skipped unless `Settings.IterateDisabled` is set.
+
+        **(API Extension)**
+        '''
+        return self._to_columns(props, self._Get_First, self._Get_Next, self._check_for_error(self._Get_Count()))
+
+    @staticmethod
+    def _build_lookup(names: List[str]) -> Dict[str, int]:
+        return {name.lower(): idx for idx, name in enumerate(names, start=1)}
+
+    def set_all(self, prop: str, values, elements=None):
+        '''
+        Sets the property `prop` for several objects of this type in a single pass.
+
+        `elements` can be a list of names or an array of (1-based) indices, as used by `idx`,
+        matching the size of `values`. If `elements` is not provided, all objects are
+        updated, in the same order as the iteration and `to_columns` (i.e., disabled 
+        elements are skipped unless `Settings.IterateDisabled` is set). A scalar value 
+        is applied to all the target elements.
+
+            loads = DSS.ActiveCircuit.Loads
+            loads.set_all('kW', kw_values)
+            loads.set_all('kvar', [100.0, 50.0], ['load1', 'load2'])
+
+        Simple setters are called directly, with a single error check at the end. Names,
+        indices and the number of values are validated before any value is changed.
+
+        **(API Extension)**
+        '''
+        kind, raw_name, fset = Base._get_setter_plan(type(self), prop)
+        if kind is not None:
+            func = getattr(self._lib, raw_name)
+            values = np.asarray(values, dtype=_column_dtypes[kind])
+        else:
+            func = partial(fset, self)
+            values = np.asarray(values, dtype=object)
+
+        if elements is None:
+            if not self._api_util._is_odd and self._lib.Settings_Get_IterateDisabled():
+                elements = range(1, self._check_for_error(self._Get_Count()) + 1)
+            else:
+                # Disabled elements are skipped by the iteration, so collect the indices of
+                # the iterated elements in a single pass, then set the values by index.
+                # Next returns the index of the new active element on DSS C-API; the first 
+                # element and OpenDSS COM (through Oddie) still require querying idx.
+                elements = []
+                append = elements.append
+                get_idx = self._Get_idx
+                get_next = self._Get_Next
+                if self._check_for_error(self._Get_First()) != 0:
+                    append(get_idx())
+                    if self._api_util._is_odd:
+                        while get_next() != 0:
+                            append(get_idx())
+                    else:
+                        idx = get_next()
+                        while idx != 0:
+                            append(idx)
+                            idx = get_next()
+
+                self._check_for_error()
+
+        elif len(elements) and isinstance(elements[0], (str, bytes)):
+            name_to_idx = self._get_lookup((type(self), 'NameToIdx'), type(self), self._Get_Count, self._Get_AllNames, Iterable._build_lookup)
+            try:
+                elements = [
+                    name_to_idx[(name.decode(self._api_util.codec) if isinstance(name, bytes) else name).lower()]
+                    for name in elements
+                ]
+            except KeyError as ex:
+                raise KeyError(f'{type(self).__name__[1:]}: element not found: {ex.args[0]}') from None
+        else:
+            elements = np.asarray(elements, dtype=np.int32)
+            if len(elements) and (elements.min() < 1 or elements.max() > self._check_for_error(self._Get_Count())):
+                raise IndexError('Element indices must be in the range [1, Count].')
+
+            elements = elements.tolist()
+
+        if values.ndim == 0:
+            values = np.broadcast_to(values, (len(elements),))
+        elif len(values) != len(elements):
+            raise ValueError(f'Number of values ({len(values)}) does not match the number of elements ({len(elements)}).')
+
+        set_idx = self._Set_idx
+        for idx, value in zip(elements, values.tolist()):
+            set_idx(idx)
+            func(value)
+
+        self._check_for_error()
+
     @property
     def AllNames(self) -> List[str]:
-        '''Array of all names of this object type'''
-        return self._check_for_error(self._get_string_array(self._Get_AllNames))
+        '''
+        Array of all names of this object type
+
+        If `CachedNameLists` is enabled, an immutable tuple is returned instead.
+        '''
+        return self._get_name_list(type(self), self._Get_Count, self._Get_AllNames)
 
     @property
     def Name(self) -> str:
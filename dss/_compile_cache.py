@@ -0,0 +1,154 @@
+"""
+Support functions for `IDSS.compile_cached`: dependency scanning of DSS scripts
+and management of the cache entries.
+"""
+import os
+import re
+import hashlib
+from typing import List, Optional
+
+# Commands that run other scripts; these are scanned recursively
+_script_cmd_re = re.compile(
+    r'^\s*(?:redirect|compile)\s+(?:file\s*=\s*)?("[^"]*"|\'[^\']*\'|\([^)]*\)|\[[^\]]*\]|\S+)',
+    re.IGNORECASE
+)
+
+# Commands that read a data file directly
+_data_cmd_re = re.compile(
+    r'^\s*(?:buscoords|latlongcoords)\s+(?:file\s*=\s*)?("[^"]*"|\'[^\']*\'|\([^)]*\)|\[[^\]]*\]|\S+)',
+    re.IGNORECASE
+)
+
+# Data files referenced in property values, e.g. `mult=(file=shape.csv)`
+_data_param_re = re.compile(
+    r'\b(?:file|sngfile|dblfile|csvfile)\s*=\s*("[^"]*"|\'[^\']*\'|[^\s)\]]+)',
+    re.IGNORECASE
+)
+
+_block_comment_re = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def _unquote(value: str) -> str:
+    if value[:1] in '"\'([' and len(value) > 1:
+        value = value[1:-1]
+
+    return value.strip()
+
+
+def _strip_comment(line: str) -> str:
+    for marker in ('!', '//'):
+        pos = line.find(marker)
+        if pos != -1:
+            line = line[:pos]
+
+    return line
+
+
+def script_dependencies(path: str) -> List[str]:
+    '''
+    Lists the files used by the DSS script at `path`: the script itself, the scripts
+    it runs through `redirect`/`compile` (recursively) and the data files it references
+    (bus coordinates and `file=`, `sngfile=`, `dblfile=`, `csvfile=` values).
+
+    Relative paths are resolved from the folder of the script that references them,
+    as the engine does. Missing files are kept in the list.
+    '''
+    path = os.path.abspath(path)
+    result = [path]
+    seen = {os.path.normcase(path)}
+    pending = [path]
+
+    def add(fn: str, base_dir: str, is_script: bool):
+        fn = os.path.abspath(os.path.join(base_dir, os.path.expanduser(fn)))
+        key = os.path.normcase(fn)
+        if key in seen:
+            return
+
+        seen.add(key)
+        result.append(fn)
+        if is_script:
+            pending.append(fn)
+
+    while pending:
+        script = pending.pop(0)
+        try:
+            with open(script, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            continue
+
+        base_dir = os.path.dirname(script)
+        for line in _block_comment_re.sub('', text).splitlines():
+            line = _strip_comment(line)
+            if not line.strip():
+                continue
+
+            m = _script_cmd_re.match(line)
+            if m is not None:
+                add(_unquote(m.group(1)), base_dir, True)
+                continue
+
+            m = _data_cmd_re.match(line)
+            if m is not None:
+                add(_unquote(m.group(1)), base_dir, False)
+                continue
+
+            for m in _data_param_re.finditer(line):
+                add(_unquote(m.group(1)), base_dir, False)
+
+    return result
+
+
+def source_hash(files: List[str], salt: str = '') -> str:
+    '''
+    Returns a SHA-256 hex digest of the paths and contents of `files`, plus `salt`.
+    '''
+    h = hashlib.sha256(salt.encode())
+    for fn in files:
+        h.update(b'\0' + os.path.normcase(fn).encode(errors='surrogateescape') + b'\0')
+        try:
+            with open(fn, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+        except OSError:
+            h.update(b'\1missing')
+
+    return h.hexdigest()
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'dss_python', 'compiled')
+
+
+def cache_file_prefix(path: str) -> str:
+    path = os.path.abspath(path)
+    name = re.sub(r'[^\w.-]', '_', os.path.splitext(os.path.basename(path))[0])
+    return f'{name}-{hashlib.sha256(os.path.normcase(path).encode(errors="surrogateescape")).hexdigest()[:12]}-'
+
+
+def read_entry(fn: str) -> Optional[str]:
+    try:
+        with open(fn, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_entry(cache_dir: str, prefix: str, fn: str, contents: str):
+    '''
+    Writes the cache entry atomically, removing older entries for the same script.
+    '''
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_fn = f'{fn}.{os.getpid()}.tmp'
+    with open(tmp_fn, 'w', encoding='utf-8') as f:
+        f.write(contents)
+
+    os.replace(tmp_fn, fn)
+    for other in os.listdir(cache_dir):
+        other = os.path.join(cache_dir, other)
+        if os.path.basename(other).startswith(prefix) and other.endswith('.dss') and other != fn:
+            try:
+                os.remove(other)
+            except OSError:
+                pass
@@ -0,0 +1,606 @@
+"""
+This module provides `map_scenarios`, a high-level runner for scenario sweeps, e.g. running
+the same circuit under several load multipliers, solution modes or edits, using multiple
+DSS Contexts in threads (default) or processes, and `run_time_sliced`, which splits a long
+time-series simulation (e.g. yearly) in time slices across DSS Contexts.
+
+Example:
+
+    from dss.parallel import map_scenarios
+
+    scenarios = [{'LoadMult': m} for m in np.linspace(0.5, 1.5, 101)]
+    res = map_scenarios('path/to/master.dss', scenarios, ['AllBusVmagPu', 'Losses'])
+    res['AllBusVmagPu'] # 2D array, one row per scenario
+
+**(API Extension)**
+"""
+import os
+from time import perf_counter
+from threading import Lock
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .IDSS import IDSS
+from .ISolution import ISolution
+from .enums import SolveModes
+from .pool import ContextPool, _capture_state, _restore_state, _disable_change_dir, _restore_change_dir
+
+Extractor = Union[str, Callable[[IDSS], Any], Tuple[str, Union[str, Callable[[IDSS], Any]]]]
+
+# Scenario keys handled by the runner; the other keys are Solution properties
+_special_keys = frozenset(('commands', 'solve'))
+
+
+class ScenarioResults:
+    '''
+    Results from `map_scenarios`.
+
+    - `results`: dict of NumPy arrays, one per extractor, with one row per scenario. Values that
+      are not numeric, or that change shape between scenarios, are kept in object arrays.
+    - `timings`: time, in seconds, to apply, solve and extract each scenario.
+    - `converged`: whether the solution of each scenario converged.
+    - `errors`: the exception raised by each scenario, or None.
+
+    The results can also be indexed directly by the extractor name, e.g. `res['AllBusVmagPu']`.
+    '''
+
+    def __init__(self, names: List[str], num_scenarios: int):
+        self.names = names
+        self.results: Dict[str, np.ndarray] = {}
+        self.timings = np.full(num_scenarios, np.nan)
+        self.converged = np.zeros(num_scenarios, dtype=bool)
+        self.errors: List[Optional[BaseException]] = [None] * num_scenarios
+        self._num_scenarios = num_scenarios
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.results[name]
+
+    def __len__(self) -> int:
+        return self._num_scenarios
+
+    def _store(self, index: int, values: List[Any]):
+        for name, value in zip(self.names, values):
+            self._store_value(index, name, value)
+
+    def _store_value(self, index: int, name: str, value: Any):
+        column = self.results.get(name)
+        if column is None:
+            column = self.results[name] = _new_column(value, self._num_scenarios)
+
+        if column.dtype != object:
+            value = np.asarray(value)
+            if value.shape == column.shape[1:] and np.can_cast(value.dtype, column.dtype, 'same_kind'):
+                column[index] = value
+                return
+
+            # Fall back to an object column
+            obj_column = np.empty(self._num_scenarios, dtype=object)
+            for i in range(self._num_scenarios):
+                obj_column[i] = column[i]
+
+            column = self.results[name] = obj_column
+
+        column[index] = value
+
+
+def _new_column(value: Any, num_scenarios: int) -> np.ndarray:
+    value = np.asarray(value)
+    if value.dtype.kind not in 'biufc':
+        return np.empty(num_scenarios, dtype=object)
+
+    if value.dtype.kind in 'fc':
+        return np.full((num_scenarios, *value.shape), np.nan, dtype=value.dtype)
+
+    return np.zeros((num_scenarios, *value.shape), dtype=value.dtype)
+
+
+def _extractor_names(extractors: Sequence[Extractor]) -> List[Tuple[str, Union[str, Callable[[IDSS], Any]]]]:
+    result = []
+    for extractor in extractors:
+        if isinstance(extractor, tuple):
+            name, extractor = extractor
+        elif isinstance(extractor, str):
+            name = extractor
+        elif callable(extractor):
+            name = getattr(extractor, '__name__', repr(extractor))
+        else:
+            raise TypeError(f'Invalid result extractor: {extractor!r}')
+
+        result.append((name, extractor))
+
+    names = [name for name, _ in result]
+    if len(set(names)) != len(names):
+        raise ValueError('The result extractors must have unique names.')
+
+    return result
+
+
+def _check_scenario(scenario: Dict[str, Any]):
+    for key in scenario:
+        if key in _special_keys:
+            continue
+
+        prop = getattr(ISolution, key, None)
+        if not isinstance(prop, property) or prop.fset is None:
+            raise ValueError(f'Invalid scenario key "{key}": expected "commands", "solve" or a writable Solution property.')
+
+
+def _extract(ctx: IDSS, extractor: Union[str, Callable[[IDSS], Any]]) -> Any:
+    if not isinstance(extractor, str):
+        return extractor(ctx)
+
+    obj = ctx.ActiveCircuit
+    for name in extractor.split('.'):
+        obj = getattr(obj, name)
+
+    return obj() if callable(obj) else obj
+
+
+def _run_scenario(ctx: IDSS, scenario: Dict[str, Any], extractors) -> Tuple[List[Any], bool, float]:
+    t0 = perf_counter()
+    sol = ctx.ActiveCircuit.Solution
+    if 'Mode' in scenario:
+        # Changing the mode also changes other settings, so it goes first
+        sol.Mode = scenario['Mode']
+
+    for key, value in scenario.items():
+        if key not in _special_keys and key != 'Mode':
+            setattr(sol, key, value)
+
+    commands = scenario.get('commands')
+    if commands:
+        ctx.Text.Commands(commands)
+
+    if scenario.get('solve', True):
+        sol.Solve()
+
+    converged = sol.Converged
+    values = [_extract(ctx, extractor) for _, extractor in extractors]
+    return values, converged, perf_counter() - t0
+
+
+def map_scenarios(
+    circuit: Union[str, os.PathLike, Callable[[IDSS], Any], ContextPool],
+    scenarios: Iterable[Dict[str, Any]],
+    extractors: Sequence[Extractor],
+    workers: Optional[int] = None,
+    backend: str = 'threads',
+    raise_errors: bool = True,
+) -> ScenarioResults:
+    '''
+    Runs a list of scenarios on copies of a circuit, in parallel, collecting the results into NumPy arrays.
+
+    `circuit` is the path of the DSS script to compile, a setup callable (which receives a DSS Context)
+    or, for the threads backend, an existing `dss.pool.ContextPool` to reuse.
+
+    Each scenario is a dict with:
+
+    - Solution properties to set, e.g. `{'LoadMult': 1.1, 'Mode': SolveModes.Daily, 'Number': 24}`;
+    - `commands`: optional DSS commands (string or list of strings) with edits to the circuit;
+    - `solve`: whether to call `Solution.Solve()`, defaults to True.
+
+    `extractors` lists the results to collect after each scenario. An extractor can be the name of
+    an `ActiveCircuit` property or method without arguments, including dotted names (e.g. `'AllBusVmagPu'`,
+    `'TotalPower'`, `'Solution.Iterations'`), a callable that receives the DSS Context, or a tuple
+    of `(name, extractor)`.
+
+    With `backend='threads'`, the scenarios run in a `ThreadPoolExecutor` with a `ContextPool` of `workers`
+    DSS Contexts. Each thread uses one context at a time, restored to the template state after each
+    scenario. Since the DSS engine releases the GIL, this scales with the number of threads, as long as
+    the extractors are light. Scenarios with `commands` rebuild the context afterwards, since edits to the
+    circuit elements are not tracked.
+
+    With `backend='processes'`, each process of a `ProcessPoolExecutor` compiles its own copy of the circuit,
+    for code paths that need to hold the GIL (e.g. heavy Python callables). The setup callable and extractors
+    must be picklable in this case (e.g. module-level functions).
+
+    With `backend='fork'` (only on platforms with the "fork" start method, e.g. Linux), the circuit is
+    compiled once in the parent process, which then forks the worker processes. The workers share the
+    compiled state of the engine (copy-on-write), and the callables do not need to be picklable. The 
+    numeric results are written directly into a `multiprocessing.shared_memory` block, allocated from
+    the results of the first scenario (run in the parent), instead of being pickled back. Other results
+    are pickled as usual.
+
+    If `raise_errors` is true, the first exception from a scenario is raised after all scenarios run.
+    Otherwise, the exceptions are available in `ScenarioResults.errors` and the rows of the failed
+    scenarios are left as NaN (floating point results) or zero.
+
+    **(API Extension)**
+    '''
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        _check_scenario(scenario)
+
+    extractors = _extractor_names(extractors)
+    results = ScenarioResults([name for name, _ in extractors], len(scenarios))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if backend == 'threads':
+        _map_threads(circuit, scenarios, extractors, workers, results)
+    elif backend == 'processes':
+        if isinstance(circuit, ContextPool):
+            raise TypeError('A ContextPool cannot be used with the processes backend.')
+
+        _map_processes(circuit, scenarios, extractors, workers, results)
+    elif backend == 'fork':
+        if isinstance(circuit, ContextPool):
+            raise TypeError('A ContextPool cannot be used with the fork backend.')
+
+        _map_fork(circuit, scenarios, extractors, workers, results)
+    else:
+        raise ValueError(f'Invalid backend "{backend}"; expected "threads", "processes" or "fork".')
+
+    if raise_errors:
+        for error in results.errors:
+            if error is not None:
+                raise error
+
+    return results
+
+
+def _map_threads(circuit, scenarios, extractors, workers: int, results: ScenarioResults):
+    pool = circuit if isinstance(circuit, ContextPool) else ContextPool(min(workers, max(len(scenarios), 1)), setup=circuit)
+    lock = Lock()
+
+    def run(index: int):
+        ctx = pool.acquire()
+        scenario = scenarios[index]
+        failed = True
+        try:
+            values, converged, elapsed = _run_scenario(ctx, scenario, extractors)
+            failed = False
+        except Exception as ex:
+            results.errors[index] = ex
+            return
+        finally:
+            pool.release(ctx, rebuild=failed or bool(scenario.get('commands')))
+
+        with lock:
+            results._store(index, values)
+
+        results.converged[index] = converged
+        results.timings[index] = elapsed
+
+    try:
+        with ThreadPoolExecutor(pool.size) as executor:
+            for future in [executor.submit(run, index) for index in range(len(scenarios))]:
+                future.result()
+    finally:
+        if pool is not circuit:
+            pool.close()
+
+
+# State of the worker processes
+_worker_ctx: Optional[IDSS] = None
+_worker_setup = None
+_worker_template = None
+
+
+def _process_init(setup):
+    global _worker_ctx, _worker_setup
+    from . import DSS
+    DSS.AllowChangeDir = False
+    _worker_ctx = DSS.NewContext()
+    _worker_setup = setup
+    _process_prepare()
+
+
+def _process_prepare():
+    global _worker_template
+    _worker_ctx.ClearAll()
+    if isinstance(_worker_setup, (str, os.PathLike)):
+        _worker_ctx.Text.Command = f'compile "{os.fspath(_worker_setup)}"'
+    elif _worker_setup is not None:
+        _worker_setup(_worker_ctx)
+
+    _worker_template = _capture_state(_worker_ctx)
+
+
+def _process_run(scenario: Dict[str, Any], extractors):
+    ctx = _worker_ctx
+    failed = True
+    try:
+        values, converged, elapsed = _run_scenario(ctx, scenario, extractors)
+        failed = False
+        return values, converged, elapsed, None
+    except Exception as ex:
+        return None, False, np.nan, ex
+    finally:
+        if failed or scenario.get('commands'):
+            _process_prepare()
+        else:
+            _restore_state(ctx, _worker_template)
+
+
+def _map_processes(circuit, scenarios, extractors, workers: int, results: ScenarioResults):
+    if isinstance(circuit, (str, os.PathLike)):
+        circuit = os.path.abspath(os.fspath(circuit))
+
+    num_workers = min(workers, max(len(scenarios), 1))
+    with ProcessPoolExecutor(num_workers, initializer=_process_init, initargs=(circuit,)) as executor:
+        futures = [executor.submit(_process_run, scenario, extractors) for scenario in scenarios]
+        for index, future in enumerate(futures):
+            values, converged, elapsed, error = future.result()
+            if error is not None:
+                results.errors[index] = error
+                continue
+
+            results._store(index, values)
+            results.converged[index] = converged
+            results.timings[index] = elapsed
+
+
+# State shared with the forked worker processes
+_fork_lock = Lock()
+_fork_scenarios = None
+_fork_extractors = None
+_fork_columns = None
+
+
+def _fork_run(index: int):
+    values, converged, elapsed, error = _process_run(_fork_scenarios[index], _fork_extractors)
+    if error is not None:
+        return index, None, None, False, elapsed, error
+
+    # Numeric results go directly to the shared memory; the others are returned
+    in_shm = []
+    for i, ((name, _), value) in enumerate(zip(_fork_extractors, values)):
+        column = _fork_columns.get(name)
+        if column is None:
+            in_shm.append(False)
+            continue
+
+        value = np.asarray(value)
+        if value.shape == column.shape[1:] and np.can_cast(value.dtype, column.dtype, 'same_kind'):
+            column[index] = value
+            values[i] = None
+            in_shm.append(True)
+        else:
+            in_shm.append(False)
+
+    return index, values, in_shm, converged, elapsed, None
+
+
+def _map_fork(circuit, scenarios, extractors, workers: int, results: ScenarioResults):
+    global _worker_setup, _worker_ctx, _worker_template, _fork_scenarios, _fork_extractors, _fork_columns
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise NotImplementedError('The fork backend requires the "fork" start method for processes.')
+
+    if isinstance(circuit, (str, os.PathLike)):
+        circuit = os.path.abspath(os.fspath(circuit))
+
+    from . import DSS
+    with _fork_lock:
+        # The workers inherit AllowChangeDir disabled from the parent, which is restored afterwards
+        # (shared with the context pools, which may be open at the same time)
+        _disable_change_dir(DSS)
+        try:
+            _process_init(circuit)
+            _run_fork_workers(scenarios, extractors, workers, results)
+        finally:
+            _fork_scenarios = _fork_extractors = _fork_columns = None
+            _worker_setup = _worker_ctx = _worker_template = None
+            _restore_change_dir(DSS)
+
+
+def _run_fork_workers(scenarios, extractors, workers: int, results: ScenarioResults):
+    global _fork_scenarios, _fork_extractors, _fork_columns
+    from multiprocessing import shared_memory # Python 3.8+
+
+    # The first scenarios run in the parent, until one succeeds, to find the shapes of the results
+    first = 0
+    while first < len(scenarios):
+        values, converged, elapsed, error = _process_run(scenarios[first], extractors)
+        first += 1
+        if error is not None:
+            results.errors[first - 1] = error
+            continue
+
+        results._store(first - 1, values)
+        results.converged[first - 1] = converged
+        results.timings[first - 1] = elapsed
+        break
+
+    if first == len(scenarios):
+        return
+
+    layout = []
+    size = 0
+    for name, column in results.results.items():
+        if column.dtype != object:
+            size = -(-size // 16) * 16
+            layout.append((name, column, size))
+            size += column.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    view = None
+    try:
+        columns = {
+            name: np.ndarray(column.shape, dtype=column.dtype, buffer=shm.buf, offset=offset)
+            for name, column, offset in layout
+        }
+        shm_rows = {name: [] for name in columns}
+        leftovers = []
+
+        _fork_scenarios = scenarios
+        _fork_extractors = extractors
+        _fork_columns = columns
+        num_workers = min(workers, len(scenarios) - first)
+        with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            for future in [executor.submit(_fork_run, index) for index in range(first, len(scenarios))]:
+                index, values, in_shm, converged, elapsed, error = future.result()
+                if error is not None:
+                    results.errors[index] = error
+                    continue
+
+                results.converged[index] = converged
+                results.timings[index] = elapsed
+                for name, value, value_in_shm in zip(results.names, values, in_shm):
+                    if value_in_shm:
+                        shm_rows[name].append(index)
+                    else:
+                        leftovers.append((index, name, value))
+
+        # Values that did not fit the shared columns may change them to objects, so they go first
+        for index, name, value in leftovers:
+            results._store_value(index, name, value)
+
+        # Copy the results out of the shared memory
+        for name, rows in shm_rows.items():
+            column = results.results[name]
+            view = columns[name]
+            if column.dtype != object:
+                column[rows] = view[rows]
+            else:
+                for index in rows:
+                    column[index] = view[index].copy()
+    finally:
+        # The views must be released before closing the shared memory
+        _fork_columns = columns = view = None
+        shm.close()
+        shm.unlink()
+
+
+class TimeSlicedResults:
+    '''
+    Results from `run_time_sliced`.
+
+    - `monitors`: dict of the monitor samples, stitched in time order, as returned by `Monitors.AsMatrix()`
+      (hour, seconds and the channels), keyed by the monitor name.
+    - `monitor_headers`: dict of the column names for each monitor.
+    - `meters`: dict of the energy meter registers for the whole period, keyed by the meter name. The
+      registers of the slices are summed, except for the registers with "Max" in the name (e.g. "Max kW"),
+      for which the maximum is used.
+    - `register_names`: the names of the energy meter registers.
+    - `slices`: the first and last (exclusive) step of each time slice.
+    - `timings`: time, in seconds, to run each slice, including the warm-up.
+    '''
+
+    def __init__(self, slices: List[Tuple[int, int]]):
+        self.slices = slices
+        self.monitors: Dict[str, np.ndarray] = {}
+        self.monitor_headers: Dict[str, List[str]] = {}
+        self.meters: Dict[str, np.ndarray] = {}
+        self.register_names: List[str] = []
+        self.timings = np.zeros(len(slices))
+
+
+def _set_time(sol: ISolution, time_s: float):
+    hour = int(time_s // 3600)
+    sol.Hour = hour
+    sol.Seconds = time_s - hour * 3600
+
+
+def _run_slice(ctx: IDSS, mode, control_mode, step_size: float, start_time: float, first_step: int, stop_step: int, warmup_steps: int):
+    t0 = perf_counter()
+    circ = ctx.ActiveCircuit
+    sol = circ.Solution
+    sol.Mode = mode
+    if control_mode is not None:
+        sol.ControlMode = control_mode
+
+    sol.StepSize = step_size
+    warmup_steps = min(warmup_steps, first_step)
+    _set_time(sol, start_time + (first_step - warmup_steps) * step_size)
+    if warmup_steps:
+        sol.Number = warmup_steps
+        sol.Solve()
+
+    circ.Monitors.ResetAll()
+    circ.Meters.ResetAll()
+    sol.Number = stop_step - first_step
+    sol.Solve()
+
+    monitors = circ.Monitors
+    monitor_data = {}
+    for _ in monitors:
+        data = monitors.AsMatrix()
+        monitor_data[monitors.Name] = (['hour', 't(sec)'] + list(monitors.Header), data)
+
+    meters = circ.Meters
+    meter_data = {meters.Name: np.array(meters.RegisterValues) for _ in meters}
+    register_names = list(meters.RegisterNames) if meters.Count else []
+    return monitor_data, meter_data, register_names, perf_counter() - t0
+
+
+def run_time_sliced(
+    circuit: Union[str, os.PathLike, Callable[[IDSS], Any], ContextPool],
+    num_steps: int,
+    step_size: float = 3600.0,
+    slices: Optional[int] = None,
+    warmup_steps: int = 24,
+    mode: Union[int, SolveModes] = SolveModes.Yearly,
+    control_mode: Optional[int] = None,
+    start_time: float = 0.0,
+) -> TimeSlicedResults:
+    '''
+    Runs a time-series simulation of `num_steps` steps of `step_size` seconds (e.g. 8760 hourly steps
+    for a yearly simulation) split in `slices` contiguous time slices, each one solved in a separate
+    DSS Context, in parallel threads.
+
+    Since the state of the controls (e.g. regulator taps, capacitor steps) depends on the previous
+    steps, each slice except the first starts with `warmup_steps` steps before its first step, 
+    so that the state of the controls settles. The monitors and energy meters are reset after 
+    the warm-up, and their results from all slices are stitched into one result set 
+    (see `TimeSlicedResults`).
+
+    `circuit` is the path of the DSS script to compile, a setup callable (which receives a DSS Context),
+    or an existing `dss.pool.ContextPool` to reuse. The monitors and energy meters must be defined by
+    the setup. `slices` defaults to the size of the pool, or the number of CPUs. `start_time`, in seconds,
+    is the time before the first step (as in the "hour" and "sec" options); `mode` and `control_mode`
+    are applied to all contexts before the simulation (`control_mode` defaults to the circuit setting).
+
+    Note that the results are not necessarily identical to a sequential run, since the warm-up
+    does not reproduce the full history of the controls and the energy integration restarts at
+    each slice.
+
+    **(API Extension)**
+    '''
+    if num_steps < 1:
+        raise ValueError('The number of steps must be at least 1.')
+
+    if warmup_steps < 0:
+        raise ValueError('The number of warm-up steps cannot be negative.')
+
+    if slices is None:
+        slices = circuit.size if isinstance(circuit, ContextPool) else (os.cpu_count() or 1)
+
+    slices = max(1, min(slices, num_steps))
+    bounds = np.linspace(0, num_steps, slices + 1).round().astype(int).tolist()
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    result = TimeSlicedResults(ranges)
+
+    pool = circuit if isinstance(circuit, ContextPool) else ContextPool(slices, setup=circuit)
+    try:
+        slice_results = pool.map(
+            lambda ctx, steps: _run_slice(ctx, mode, control_mode, step_size, start_time, steps[0], steps[1], warmup_steps),
+            ranges
+        )
+    finally:
+        if pool is not circuit:
+            pool.close()
+
+    for index, (monitor_data, meter_data, register_names, elapsed) in enumerate(slice_results):
+        result.timings[index] = elapsed
+        for name, (header, data) in monitor_data.items():
+            result.monitor_headers[name] = header
+            if data is None:
+                continue
+
+            previous = result.monitors.get(name)
+            result.monitors[name] = data if previous is None else np.concatenate((previous, data))
+
+        if register_names:
+            result.register_names = register_names
+
+        is_max = np.array(['max' in name.lower() for name in register_names], dtype=bool)
+        for name, values in meter_data.items():
+            previous = result.meters.get(name)
+            if previous is None:
+                result.meters[name] = values
+            else:
+                result.meters[name] = np.where(is_max, np.maximum(previous, values), previous + values)
+
+    return result
@@ -641,7 +641,7 @@ def dss_profile_plot(DSS, params):
         LenScale = 1.0
         # RangeScale = 1.0
 
-    busnode_to_index = {(bn.rsplit('.', 1)[0], int(bn.rsplit('.', 1)[1])): num for (num, bn) in enumerate(DSS.ActiveCircuit.AllNodeNames)}
+    node_to_index = DSS.ActiveCircuit.NodeNameToIndex
     bus_to_kvbase = {b.Name: b.kVBase for b in DSS.ActiveCircuit.Buses}
     puV = DSS.ActiveCircuit.AllBusVmagPu / DenomLN
     distances = {name: d for (name, d) in zip(DSS.ActiveCircuit.AllBusNames, DSS.ActiveCircuit.AllBusDistances * LenScale)}
@@ -681,8 +681,8 @@ def dss_profile_plot(DSS, params):
              # Plot all phases present (between 1 and 3)
             for iphs in phases:
                 try:
-                    b1n_idx = busnode_to_index[(bus1, iphs)]
-                    b2n_idx = busnode_to_index[(bus2, iphs)]
+                    b1n_idx = node_to_index[f'{bus1}.{iphs}']
+                    b2n_idx = node_to_index[f'{bus2}.{iphs}']
                 except:
                     continue
 
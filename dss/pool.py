@@ -0,0 +1,345 @@
+"""
+This module provides `ContextPool`, a pool of DSS Contexts with a circuit already loaded,
+to run many short tasks (e.g. power flows of different scenarios) from multiple threads
+without compiling the circuit for each task.
+
+Example:
+
+    from dss.pool import ContextPool
+
+    def run(ctx, loadmult):
+        ctx.ActiveCircuit.Solution.LoadMult = loadmult
+        ctx.ActiveCircuit.Solution.Solve()
+        return ctx.ActiveCircuit.AllBusVmagPu
+
+    with ContextPool(4, setup='path/to/master.dss') as pool:
+        results = pool.map(run, [0.9, 1.0, 1.1])
+
+**(API Extension)**
+"""
+import os
+from queue import Queue, Empty
+from threading import Lock
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from .IDSS import IDSS
+
+# Solution settings restored between tasks. The mode comes first since
+# changing it also changes some of the other settings.
+_solution_props = (
+    'Mode',
+    'ControlMode',
+    'LoadModel',
+    'LoadMult',
+    'GenMult',
+    'Number',
+    'StepSize',
+    'Year',
+    'Hour',
+    'Seconds',
+    'MaxIterations',
+    'MaxControlIterations',
+    'Tolerance',
+)
+
+# AllowChangeDir is process-wide, so the value is saved when the first pool is
+# opened and restored only when the last one is closed, in any order.
+_change_dir_lock = Lock()
+_change_dir_holders = 0
+_saved_allow_change_dir = None
+
+
+def _disable_change_dir(ctx: IDSS):
+    global _change_dir_holders, _saved_allow_change_dir
+    with _change_dir_lock:
+        if _change_dir_holders == 0:
+            _saved_allow_change_dir = ctx.AllowChangeDir
+            ctx.AllowChangeDir = False
+
+        _change_dir_holders += 1
+
+
+def _restore_change_dir(ctx: IDSS):
+    global _change_dir_holders
+    with _change_dir_lock:
+        _change_dir_holders -= 1
+        if _change_dir_holders == 0:
+            ctx.AllowChangeDir = _saved_allow_change_dir
+
+
+class ContextPool:
+    '''
+    A pool of DSS Contexts (see `IDSS.NewContext`), each prepared once by `setup`, which
+    can be either a callable that receives the new context or the path of a DSS script
+    to compile.
+
+    The contexts are handed out to the threads with `checkout` (or `acquire`/`release`).
+    When a context is returned to the pool, its template state is restored:
+
+    - the solution settings, such as the mode, load multiplier, number of steps, time and control mode;
+    - the state of the switches (lines marked as switches and the elements of `SwtControl`s),
+      the capacitor steps and the tap positions of the regulators;
+    - the energy meters and monitors are reset.
+
+    Changes to other properties of the circuit elements are not tracked. Use the `reset` callable
+    to restore those, or pass `rebuild=True` to `release` to discard the circuit and run `setup`
+    again. A context is also rebuilt if the task raised an exception.
+
+    Since the contexts share the process, the working folder is not changed when compiling
+    scripts: `AllowChangeDir`, a process-wide setting, is disabled while the pool is open and
+    restored when the last open pool is closed. Use absolute paths or paths relative to the scripts.
+
+    This is not supported for the official OpenDSS engine.
+
+    **(API Extension)**
+    '''
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        setup: Union[Callable[[IDSS], Any], str, os.PathLike, None] = None,
+        reset: Optional[Callable[[IDSS], Any]] = None,
+        parent: Optional[IDSS] = None
+    ):
+        if size is None:
+            size = os.cpu_count() or 1
+
+        if size < 1:
+            raise ValueError('The pool size must be at least 1.')
+
+        if parent is None:
+            from . import DSS as parent
+
+        if isinstance(setup, (str, os.PathLike)):
+            setup = _compile_script(os.path.abspath(os.fspath(setup)))
+
+        self.size = size
+        self._setup = setup
+        self._reset = reset
+        self._parent = parent
+        self._idle = Queue()
+        self._templates: Dict[int, Dict[str, Any]] = {}
+        self._contexts: List[IDSS] = []
+        self._acquired = set()
+        self._lock = Lock()
+        self._closed = False
+
+        _disable_change_dir(parent)
+        try:
+            contexts = [parent.NewContext() for _ in range(size)]
+            if size == 1:
+                self._prepare(contexts[0])
+            else:
+                with ThreadPoolExecutor(size) as executor:
+                    list(executor.map(self._prepare, contexts))
+        except:
+            _restore_change_dir(parent)
+            raise
+
+        self._contexts.extend(contexts)
+        for ctx in contexts:
+            self._idle.put(ctx)
+
+    def _prepare(self, ctx: IDSS):
+        ctx.ClearAll()
+        if self._setup is not None:
+            self._setup(ctx)
+
+        self._templates[id(ctx)] = _capture_state(ctx)
+
+    def _restore(self, ctx: IDSS):
+        _restore_state(ctx, self._templates[id(ctx)])
+        if self._reset is not None:
+            self._reset(ctx)
+
+    def acquire(self, timeout: Optional[float] = None) -> IDSS:
+        '''
+        Takes a context from the pool, waiting for one to be released if none is available.
+        Raises `TimeoutError` if none is available after `timeout` seconds.
+        '''
+        if self._closed:
+            raise RuntimeError('The pool is closed.')
+
+        try:
+            ctx = self._idle.get(timeout=timeout)
+        except Empty:
+            raise TimeoutError('No DSS context available in the pool.') from None
+
+        with self._lock:
+            self._acquired.add(id(ctx))
+
+        return ctx
+
+    def release(self, ctx: IDSS, rebuild: bool = False):
+        '''
+        Returns a context to the pool, restoring its template state. If `rebuild` is true,
+        the circuit is cleared and prepared again with `setup` instead. Contexts released
+        after the pool is closed are just cleared.
+        '''
+        with self._lock:
+            if id(ctx) not in self._acquired:
+                raise ValueError('The DSS context was not acquired from this pool, or was already released.')
+
+            self._acquired.discard(id(ctx))
+            if self._closed:
+                ctx.ClearAll()
+                return
+
+        try:
+            if rebuild:
+                self._prepare(ctx)
+            else:
+                try:
+                    self._restore(ctx)
+                except Exception:
+                    self._prepare(ctx)
+        finally:
+            self._idle.put(ctx)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[IDSS]:
+        '''
+        Context manager for `acquire`/`release`. If the block raises an exception, the context
+        is rebuilt before returning to the pool.
+
+            with pool.checkout() as ctx:
+                ctx.ActiveCircuit.Solution.Solve()
+        '''
+        ctx = self.acquire(timeout)
+        failed = True
+        try:
+            yield ctx
+            failed = False
+        finally:
+            self.release(ctx, rebuild=failed)
+
+    def map(self, func: Callable[[IDSS, Any], Any], items: Iterable[Any]) -> List[Any]:
+        '''
+        Runs `func(ctx, item)` for each item, using one thread per context in the pool.
+        Returns the list of results, in the order of the items. The first exception
+        from `func`, if any, is raised after all items are processed.
+        '''
+        def run(item):
+            with self.checkout() as ctx:
+                return func(ctx, item)
+
+        with ThreadPoolExecutor(self.size) as executor:
+            futures = [executor.submit(run, item) for item in items]
+
+        return [future.result() for future in futures]
+
+    def close(self):
+        '''
+        Closes the pool, clearing the circuits of all idle contexts (the others are cleared when
+        released) and restoring `AllowChangeDir` if no other pool is open. The contexts are released when there are no
+        references left to them. Closing the pool again has no effect.
+        '''
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+
+        while True:
+            try:
+                self._idle.get_nowait().ClearAll()
+            except Empty:
+                break
+
+        self._contexts.clear()
+        self._templates.clear()
+        _restore_change_dir(self._parent)
+
+    def __enter__(self) -> 'ContextPool':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def _compile_script(path: str) -> Callable[[IDSS], None]:
+    def setup(ctx: IDSS):
+        ctx.Text.Command = f'compile "{path}"'
+
+    return setup
+
+
+def _capture_state(ctx: IDSS) -> Dict[str, Any]:
+    if ctx.NumCircuits == 0:
+        return {}
+
+    circ = ctx.ActiveCircuit
+    sol = circ.Solution
+    state = {
+        'solution': [(name, getattr(sol, name)) for name in _solution_props],
+    }
+
+    swt_controls = circ.SwtControls
+    state['swtcontrols'] = [(swt_controls.Name, swt_controls.State) for _ in swt_controls]
+
+    # Lines marked as switches, and the elements controlled by SwtControls
+    elem = circ.ActiveCktElement
+    lines = circ.Lines
+    switches = ['Line.' + lines.Name for _ in lines if lines.IsSwitch]
+    switches.extend(swt_controls.SwitchedObj for _ in swt_controls)
+    open_conductors = []
+    for name in dict.fromkeys(switches):
+        circ.SetActiveElement(name)
+        num_terminals, num_conductors = elem.NumTerminals, elem.NumConductors
+        open_conductors.append((name, num_terminals, [
+            (term, phs)
+            for term in range(1, num_terminals + 1)
+            for phs in range(1, num_conductors + 1)
+            if elem.IsOpen(term, phs)
+        ]))
+
+    state['switches'] = open_conductors
+
+    capacitors = circ.Capacitors
+    state['capacitors'] = [(capacitors.Name, capacitors.States) for _ in capacitors]
+
+    reg_controls = circ.RegControls
+    state['regcontrols'] = [(reg_controls.Name, reg_controls.TapNumber) for _ in reg_controls]
+    return state
+
+
+def _restore_state(ctx: IDSS, state: Dict[str, Any]):
+    if not state:
+        return
+
+    circ = ctx.ActiveCircuit
+    sol = circ.Solution
+    for name, value in state['solution']:
+        setattr(sol, name, value)
+
+    swt_controls = circ.SwtControls
+    for name, value in state['swtcontrols']:
+        swt_controls.Name = name
+        if swt_controls.State != value:
+            swt_controls.State = value
+
+    elem = circ.ActiveCktElement
+    for name, num_terminals, open_conductors in state['switches']:
+        circ.SetActiveElement(name)
+        for term in range(1, num_terminals + 1):
+            elem.Close(term, 0)
+
+        for term, phs in open_conductors:
+            elem.Open(term, phs)
+
+    capacitors = circ.Capacitors
+    for name, value in state['capacitors']:
+        capacitors.Name = name
+        capacitors.States = value
+
+    reg_controls = circ.RegControls
+    for name, value in state['regcontrols']:
+        reg_controls.Name = name
+        reg_controls.TapNumber = value
+
+    circ.Meters.ResetAll()
+    circ.Monitors.ResetAll()
@@ -0,0 +1,344 @@
+"""
+This module provides `Recorder`, an in-memory alternative to the DSS Monitors for Python users.
+The recorder samples a set of quantities (e.g. node voltages, element powers, meter registers)
+at each solution step, through the step event of the DSS engine, storing the values in NumPy
+buffers. This avoids the files/streams of the monitors and the conversion of their data.
+
+Example:
+
+    from dss.recorder import Recorder, element, meter
+
+    circ = DSS.ActiveCircuit
+    with Recorder(DSS, ['AllBusVmagPu', element('Line.650632', 'Powers'), meter('feeder')]) as rec:
+        circ.Solution.Solve() # e.g. a yearly simulation
+
+    rec.times           # hour of each sample
+    rec['AllBusVmagPu'] # 2D array, one row per sample
+
+**(API Extension)**
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import numpy as np
+from dss_python_backend.events import get_manager_for_ctx
+from .IDSS import IDSS
+from .enums import AltDSSEvent
+from .sink import NpySink, column_names
+
+
+class Quantity:
+    '''
+    A quantity sampled by a `Recorder`: the attribute `attr` of the object returned by `target(ctx)`
+    or, if `attr` is None, the value returned by `target(ctx)`. Usually created with `element` or
+    `meter`, or from a string.
+    '''
+    __slots__ = ('name', 'target', 'attr')
+
+    def __init__(self, name: str, target: Callable[[IDSS], Any], attr: Optional[str] = None):
+        self.name = name
+        self.target = target
+        self.attr = attr
+
+    def read(self, ctx: IDSS) -> Any:
+        obj = self.target(ctx)
+        if self.attr is None:
+            return obj
+
+        value = getattr(obj, self.attr)
+        return value() if callable(value) else value
+
+    def read_into(self, ctx: IDSS, out: np.ndarray):
+        '''Copies the value directly into `out`; only for array getters based on the GR buffers.'''
+        self.target(ctx).read_into(self.attr, out)
+
+    @staticmethod
+    def from_spec(spec: Union[str, Callable[[IDSS], Any], 'Quantity', tuple]) -> 'Quantity':
+        if isinstance(spec, Quantity):
+            return spec
+
+        if isinstance(spec, tuple):
+            name, spec = spec
+            quantity = Quantity.from_spec(spec)
+            return Quantity(name, quantity.target, quantity.attr)
+
+        if isinstance(spec, str):
+            path = spec.split('.')
+            def target(ctx: IDSS, path=path[:-1]):
+                obj = ctx.ActiveCircuit
+                for name in path:
+                    obj = getattr(obj, name)
+
+                return obj
+
+            return Quantity(spec, target, path[-1])
+
+        if callable(spec):
+            return Quantity(getattr(spec, '__name__', repr(spec)), spec)
+
+        raise TypeError(f'Invalid quantity: {spec!r}')
+
+
+def element(name: str, prop: str = 'Powers') -> Quantity:
+    '''
+    Quantity for the property `prop` (e.g. `Powers`, `Currents`, `Voltages`, `SeqPowers`) of
+    the circuit element `name` (full name, e.g. `Line.650632`), from `ActiveCktElement`.
+    '''
+    def target(ctx: IDSS):
+        circ = ctx.ActiveCircuit
+        circ.SetActiveElement(name)
+        return circ.ActiveCktElement
+
+    return Quantity(f'{name}.{prop}', target, prop)
+
+
+def meter(name: str, prop: str = 'RegisterValues') -> Quantity:
+    '''
+    Quantity for the property `prop` (defaults to the register values) of the energy meter `name`.
+
+    Note that, in time-series simulations, the energy meters integrate each step after the step 
+    event, so the registers sampled by a `Recorder` attached to the event do not include the 
+    current step yet.
+    '''
+    def target(ctx: IDSS):
+        meters = ctx.ActiveCircuit.Meters
+        meters.Name = name
+        return meters
+
+    return Quantity(f'EnergyMeter.{name}.{prop}', target, prop)
+
+
+class Recorder:
+    '''
+    Records a set of quantities at each solution step of a DSS Context, into NumPy buffers.
+
+    `quantities` lists what to sample. Each quantity can be the name of an `ActiveCircuit`
+    property or method without arguments, including dotted names (e.g. `'AllBusVmagPu'`,
+    `'Solution.Iterations'`), a `Quantity` (see `element` and `meter`), a callable that
+    receives the DSS Context, or a tuple of `(name, quantity)`.
+
+    When attached (`attach()` or a `with` block), the recorder samples the quantities from the
+    step event of the engine, which happens after each step of the solution (one sample per
+    step in time-series modes, or per `Solve()` call in snapshot mode). For Python-driven
+    stepping loops, `sample()` can be called directly instead.
+
+    The size of each quantity is fixed on the first sample. By default, the buffers start with
+    `capacity` rows and grow as needed. With `ring=True`, only the latest `capacity` samples are
+    kept. `dtype` can be `np.float32` to halve the memory use (complex results are stored as
+    `np.complex64`/`np.complex128`). With `decimation=n`, only one every `n` steps is sampled.
+
+    The array getters based on the GR buffers (most of the bulk getters, e.g. `AllBusVmagPu`,
+    `Powers`, `RegisterValues`) are copied directly into the buffers.
+
+    With a `sink` (`dss.sink.NpySink`), the buffers are memory-mapped `.npy` files instead,
+    flushed incrementally, for results that do not fit in memory. The times are stored as the
+    quantity `hour`, and the columns of the bulk getters are named after `AllNodeNames` or
+    `PDElements.AllNames` when possible. Ring buffers are not supported with a sink.
+
+    This is not supported for the official OpenDSS engine.
+
+    **(API Extension)**
+    '''
+
+    def __init__(
+        self,
+        dss: IDSS,
+        quantities: Sequence[Union[str, Callable[[IDSS], Any], Quantity, tuple]],
+        capacity: int = 1024,
+        ring: bool = False,
+        dtype=np.float64,
+        decimation: int = 1,
+        sink: Optional[NpySink] = None,
+    ):
+        if capacity < 1:
+            raise ValueError('The capacity must be at least 1.')
+
+        if decimation < 1:
+            raise ValueError('The decimation must be at least 1.')
+
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError('The dtype must be float32 or float64.')
+
+        if sink is not None and ring:
+            raise ValueError('Ring buffers are not supported with a sink.')
+
+        self._dss = dss
+        self._quantities = [Quantity.from_spec(q) for q in quantities]
+        names = [q.name for q in self._quantities]
+        if len(set(names)) != len(names):
+            raise ValueError('The quantities must have unique names.')
+
+        self.capacity = capacity
+        self.ring = ring
+        self.dtype = dtype
+        self.decimation = decimation
+        self.sink = sink
+        self._sink_names = names + ['hour']
+        self._buffers: Optional[List[np.ndarray]] = None
+        self._use_gr: List[bool] = []
+        self._times = None
+        self._count = 0
+        self._num_events = 0
+        self._handler = self._on_step # keep the same bound method to unregister
+        self._attached = False
+
+    def attach(self) -> 'Recorder':
+        '''Starts sampling at each step of the solution.'''
+        if self._attached:
+            return self
+
+        api_util = self._dss._api_util
+        if api_util._is_odd:
+            raise NotImplementedError('Recorder is not supported for the official OpenDSS engine.')
+
+        get_manager_for_ctx(api_util.ctx).register_func(AltDSSEvent.Legacy_StepControls, self._handler)
+        self._attached = True
+        return self
+
+    def detach(self):
+        '''Stops sampling at each step of the solution. The recorded data is kept.'''
+        if not self._attached:
+            return
+
+        get_manager_for_ctx(self._dss._api_util.ctx).unregister_func(AltDSSEvent.Legacy_StepControls, self._handler)
+        self._attached = False
+
+    def __enter__(self) -> 'Recorder':
+        return self.attach()
+
+    def __exit__(self, *args):
+        self.detach()
+
+    def _on_step(self):
+        self._num_events += 1
+        if (self._num_events - 1) % self.decimation == 0:
+            self.sample()
+
+    def _allocate(self, values: List[Any]):
+        self._buffers = []
+        self._use_gr = []
+        for quantity, value in zip(self._quantities, values):
+            value = np.asarray(value)
+            if value.dtype.kind not in 'biufc':
+                raise TypeError(f'Quantity "{quantity.name}" is not numeric.')
+
+            dtype = self.dtype
+            if value.dtype.kind == 'c':
+                dtype = np.complex64 if dtype == np.float32 else np.complex128
+
+            if self.sink is None:
+                buffer = np.empty((self.capacity, value.size), dtype=dtype)
+            else:
+                columns = column_names(self._dss, quantity.name, value.size) or value.size
+                buffer = self.sink.add(quantity.name, columns, self.capacity, dtype)
+
+            self._buffers.append(buffer)
+
+            # Check if the fast path works for this quantity
+            use_gr = False
+            if quantity.attr is not None:
+                try:
+                    quantity.read_into(self._dss, buffer[0])
+                    use_gr = True
+                except (TypeError, ValueError, AttributeError):
+                    pass
+
+            self._use_gr.append(use_gr)
+
+        if self.sink is None:
+            self._times = np.empty(self.capacity)
+        else:
+            self._times = self.sink.add('hour', ['hour'], self.capacity)[:, 0]
+
+    def _grow(self):
+        self.capacity *= 2
+        if self.sink is not None:
+            self._buffers = self._times = None
+            self._buffers = [self.sink.reserve(quantity.name, self.capacity) for quantity in self._quantities]
+            self._times = self.sink.reserve('hour', self.capacity)[:, 0]
+            return
+
+        self._buffers = [np.resize(buffer, (self.capacity, buffer.shape[1])) for buffer in self._buffers]
+        self._times = np.resize(self._times, self.capacity)
+
+    def sample(self):
+        '''Samples all quantities now, e.g. after solving a step in a Python loop.'''
+        ctx = self._dss
+        if self._buffers is None:
+            values = [quantity.read(ctx) for quantity in self._quantities]
+            self._allocate(values)
+        else:
+            values = None
+
+        if self._count >= self.capacity and not self.ring:
+            self._grow()
+
+        row = self._count % self.capacity
+        sol = ctx.ActiveCircuit.Solution
+        self._times[row] = sol.Hour + sol.Seconds / 3600
+        for index, (quantity, buffer) in enumerate(zip(self._quantities, self._buffers)):
+            if values is not None:
+                value = np.asarray(values[index]).reshape(-1)
+            elif self._use_gr[index]:
+                quantity.read_into(ctx, buffer[row])
+                continue
+            else:
+                value = np.asarray(quantity.read(ctx)).reshape(-1)
+
+            if value.size != buffer.shape[1]:
+                raise ValueError(f'Quantity "{quantity.name}" changed size from {buffer.shape[1]} to {value.size}.')
+
+            buffer[row] = value
+
+        self._count += 1
+        if self.sink is not None:
+            self.sink.set_lengths(dict.fromkeys(self._sink_names, self._count))
+
+    def clear(self):
+        '''Discards the recorded samples, keeping the buffers.'''
+        self._count = 0
+        self._num_events = 0
+        if self.sink is not None and self._buffers is not None:
+            self.sink.set_lengths(dict.fromkeys(self._sink_names, 0))
+            self.sink.flush()
+
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        if self._count <= self.capacity:
+            return buffer[:self._count]
+
+        # Ring buffer, oldest sample first
+        start = self._count % self.capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def names(self) -> List[str]:
+        return [quantity.name for quantity in self._quantities]
+
+    @property
+    def times(self) -> np.ndarray:
+        '''Time of each sample, in hours.'''
+        if self._times is None:
+            return np.empty(0)
+
+        return self._ordered(self._times)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        '''
+        Samples of the quantity `name`, one row per sample, oldest first. Except for ring buffers
+        that wrapped around, this is a view of the internal buffer.
+        '''
+        for quantity, buffer in zip(self._quantities, self._buffers or ()):
+            if quantity.name == name:
+                return self._ordered(buffer)
+
+        if name in self.names:
+            return np.empty((0, 0), dtype=self.dtype)
+
+        raise KeyError(name)
+
+    @property
+    def data(self) -> Dict[str, np.ndarray]:
+        '''Dict of the samples of all quantities, see `__getitem__`.'''
+        return {name: self[name] for name in self.names}
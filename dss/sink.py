@@ -0,0 +1,300 @@
+"""
+This module provides `NpySink`, a result sink for long time-series simulations that
+stores each quantity in its own `.npy` file (`[steps x columns]`), mapped in memory
+with `numpy.lib.format.open_memmap`. A sidecar JSON file (`sink.json`) keeps the
+column names, data types and the number of rows written of each quantity.
+
+The rows are flushed to disk incrementally, updating the sidecar afterwards, so the
+data written up to the last flush can be read with `load_sink` even if the run crashes.
+
+Example:
+
+    from dss.sink import NpySink, load_sink
+    from dss.recorder import Recorder
+
+    with NpySink('results/') as sink, Recorder(DSS, ['AllBusVmagPu'], sink=sink):
+        DSS.ActiveCircuit.Solution.Solve() # e.g. a yearly simulation
+
+    data, columns = load_sink('results/')
+    data['AllBusVmagPu'] # memory-mapped, one row per step
+
+**(API Extension)**
+"""
+import os
+import re
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .IDSS import IDSS
+
+SIDECAR_FN = 'sink.json'
+
+
+class NpySink:
+    '''
+    A set of quantities, each one stored in a `.npy` file in `directory`, mapped in memory.
+
+    Quantities are created with `add`, with their column names (or number of columns), an
+    initial capacity of rows, and the data type. Rows can be written with `append` or directly
+    into the buffers (see `reserve` and `set_length`). When a file is full, its capacity is
+    doubled (copying the file), so the files can have more rows than written; use `load_sink`
+    to read them. Every `flush_every` rows of a quantity, the files are flushed and the sidecar
+    is updated.
+
+    The time-series `Recorder` (`dss.recorder`) and `add_monitors` write into a sink; the
+    buffers returned by `reserve` can also be filled with the bulk getters, e.g.
+    `ActiveCircuit.read_into('AllBusVmagPu', sink.reserve(name, row + 1)[row])`.
+
+    Existing files of the same quantities in the directory are overwritten.
+
+    **(API Extension)**
+    '''
+
+    def __init__(self, directory: Union[str, os.PathLike], flush_every: int = 1000):
+        if flush_every < 1:
+            raise ValueError('flush_every must be at least 1.')
+
+        self.directory = os.path.abspath(os.fspath(directory))
+        self.flush_every = flush_every
+        self._buffers: Dict[str, np.memmap] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._flushed: Dict[str, int] = {}
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_sidecar()
+
+    def _file_name(self, name: str) -> str:
+        base = re.sub(r'[^\w.-]', '_', name)
+        fn = base + '.npy'
+        used = {meta['file'] for meta in self._meta.values()}
+        index = 1
+        while fn in used:
+            index += 1
+            fn = f'{base}-{index}.npy'
+
+        return fn
+
+    def add(
+        self,
+        name: str,
+        columns: Union[int, Sequence[str]],
+        capacity: int = 1024,
+        dtype=np.float64
+    ) -> np.memmap:
+        '''
+        Creates the file for the quantity `name`, with `capacity` rows. `columns` is either the
+        list of column names or the number of columns (named by index). Returns the buffer.
+        '''
+        if name in self._meta:
+            raise ValueError(f'Quantity "{name}" already exists in the sink.')
+
+        if isinstance(columns, int):
+            columns = [str(index) for index in range(columns)]
+
+        columns = [str(column) for column in columns]
+        meta = {
+            'file': self._file_name(name),
+            'columns': columns,
+            'dtype': np.dtype(dtype).str,
+            'rows': 0,
+        }
+        self._buffers[name] = np.lib.format.open_memmap(
+            os.path.join(self.directory, meta['file']),
+            mode='w+',
+            dtype=dtype,
+            shape=(max(capacity, 1), len(columns))
+        )
+        self._meta[name] = meta
+        self._write_sidecar()
+        return self._buffers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._meta
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        '''Rows written of the quantity `name` (a view of the memory-mapped file).'''
+        return self._buffers[name][:self._meta[name]['rows']]
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._meta.keys())
+
+    def columns(self, name: str) -> List[str]:
+        return self._meta[name]['columns']
+
+    def length(self, name: str) -> int:
+        '''Number of rows written of the quantity `name`.'''
+        return self._meta[name]['rows']
+
+    def reserve(self, name: str, rows: int) -> np.memmap:
+        '''
+        Returns the buffer of the quantity `name`, growing the file to at least `rows` rows
+        if needed. The buffer returned before a resize is not valid anymore.
+        '''
+        buffer = self._buffers[name]
+        if rows <= buffer.shape[0]:
+            return buffer
+
+        capacity = buffer.shape[0]
+        while capacity < rows:
+            capacity *= 2
+
+        meta = self._meta[name]
+        fn = os.path.join(self.directory, meta['file'])
+        tmp_fn = fn + '.tmp'
+        new_buffer = np.lib.format.open_memmap(tmp_fn, mode='w+', dtype=buffer.dtype, shape=(capacity, buffer.shape[1]))
+        new_buffer[:meta['rows']] = buffer[:meta['rows']]
+        new_buffer.flush()
+
+        # The old map must be released before replacing the file on Windows
+        del buffer
+        self._buffers[name] = None
+        os.replace(tmp_fn, fn)
+        self._buffers[name] = new_buffer
+        return new_buffer
+
+    def set_length(self, name: str, rows: int):
+        '''
+        Marks the first `rows` rows of the quantity `name` as written, e.g. after filling the
+        buffer directly. Flushes the sink every `flush_every` new rows. Use `set_lengths` to
+        update quantities written together, so that they are flushed with the same lengths.
+        '''
+        self.set_lengths({name: rows})
+
+    def set_lengths(self, lengths: Dict[str, int]):
+        '''
+        Same as `set_length`, for several quantities at once (a dict of name to the number of rows).
+        All lengths are updated before checking if the sink must be flushed, so the sidecar is
+        consistent for rows written to all quantities together, e.g. by the `Recorder`.
+        '''
+        for name, rows in lengths.items():
+            if rows > self._buffers[name].shape[0]:
+                raise ValueError(f'Quantity "{name}" has only {self._buffers[name].shape[0]} rows.')
+
+        flush = False
+        for name, rows in lengths.items():
+            self._meta[name]['rows'] = rows
+            flush = flush or rows - self._flushed.get(name, 0) >= self.flush_every
+
+        if flush:
+            self.flush()
+
+    def append(self, name: str, values):
+        '''Appends a row (or a 2D block of rows) of values to the quantity `name`.'''
+        values = np.asarray(values)
+        rows = self._meta[name]['rows']
+        if values.ndim < 2:
+            self.reserve(name, rows + 1)[rows] = values
+            self.set_length(name, rows + 1)
+        else:
+            self.reserve(name, rows + len(values))[rows:rows + len(values)] = values
+            self.set_length(name, rows + len(values))
+
+    def add_monitors(self, dss: IDSS, prefix: str = 'Monitor.') -> List[str]:
+        '''
+        Copies the data of all monitors of the active circuit into the sink, as float32 quantities
+        named `prefix` + the monitor name, with the columns as in `Monitors.export_all`.
+        Returns the names of the quantities.
+        '''
+        monitors = dss.ActiveCircuit.Monitors
+        names = []
+        for _ in monitors:
+            name = prefix + monitors.Name
+            matrix = monitors.AsMatrix()
+            columns = ['hour', 't(sec)'] + monitors.Header
+            self.add(name, columns, capacity=0 if matrix is None else len(matrix), dtype=np.float32)
+            if matrix is not None:
+                self.append(name, matrix)
+
+            names.append(name)
+
+        self.flush()
+        return names
+
+    def flush(self):
+        '''Flushes the files to disk, then updates the sidecar with the number of rows written.'''
+        for buffer in self._buffers.values():
+            buffer.flush()
+
+        self._write_sidecar()
+        self._flushed = {name: meta['rows'] for name, meta in self._meta.items()}
+
+    def _write_sidecar(self):
+        fn = os.path.join(self.directory, SIDECAR_FN)
+        tmp_fn = f'{fn}.{os.getpid()}.tmp'
+        with open(tmp_fn, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'quantities': self._meta}, f, indent=1)
+
+        os.replace(tmp_fn, fn)
+
+    def close(self):
+        '''Flushes the data and releases the memory maps.'''
+        if self._buffers:
+            self.flush()
+
+        self._buffers.clear()
+
+    def __enter__(self) -> 'NpySink':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def load_sink(directory: Union[str, os.PathLike], mmap_mode: Optional[str] = 'r') -> Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]:
+    '''
+    Reads the quantities of a `NpySink` from `directory`, up to the rows recorded in the sidecar.
+    Returns a tuple `(data, columns)` of dicts keyed by the quantity name. By default, the
+    arrays are memory-mapped (read-only); use `mmap_mode=None` to load them in memory.
+
+    **(API Extension)**
+    '''
+    directory = os.fspath(directory)
+    with open(os.path.join(directory, SIDECAR_FN), 'r', encoding='utf-8') as f:
+        meta = json.load(f)['quantities']
+
+    data = {}
+    columns = {}
+    for name, info in meta.items():
+        array = np.load(os.path.join(directory, info['file']), mmap_mode=mmap_mode)
+        data[name] = array[:info['rows']]
+        columns[name] = info['columns']
+
+    return data, columns
+
+
+def column_names(dss: IDSS, name: str, size: int) -> Optional[List[str]]:
+    '''
+    Column names for the values of the `ActiveCircuit` bulk getter `name` (e.g. `AllBusVmagPu`,
+    `PDElements.AllCurrents`), from `AllNodeNames` or `PDElements.AllNames`, if the number of
+    values (`size`) matches. Interleaved real/imaginary values are named with `.re`/`.im`.
+    Returns None if the size does not match.
+    '''
+    circ = dss.ActiveCircuit
+    if name.startswith('PDElements.'):
+        pd_elements = circ.PDElements
+        elements = pd_elements.AllNames
+        candidates = [
+            [
+                f'{element}.{terminal}.{conductor}'
+                for element, num_terminals, num_conductors in zip(elements, pd_elements.AllNumTerminals, pd_elements.AllNumConductors)
+                for terminal in range(1, num_terminals + 1)
+                for conductor in range(1, num_conductors + 1)
+            ],
+            elements,
+        ]
+    elif '.' not in name:
+        candidates = [circ.AllNodeNames, circ.AllBusNames]
+    else:
+        return None
+
+    for labels in candidates:
+        if size == len(labels):
+            return list(labels)
+
+        if size == 2 * len(labels):
+            return [f'{label}.{part}' for label in labels for part in ('re', 'im')]
+
+    return None
@@ -0,0 +1,349 @@
+# NOTE: Micro-benchmarks for some of the performance-related features of DSS-Python.
+#       These are not collected by pytest; run this file directly, optionally passing
+#       the names of the benchmarks to run:
+#
+#           python tests/benchmark.py [scratch_pointers deferred_errors new_context interface_access import_time bulk_new set_all map_scenarios recorder monitors_export ...]
+#
+import sys, os, gc, subprocess
+from time import perf_counter
+from timeit import Timer
+import numpy as np
+from dss import DSS, IDSS, SolveModes
+
+ZIP_FN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', '13Bus.zip')
+
+
+def _load_13bus(DSS: IDSS = DSS):
+    DSS.ClearAll()
+    DSS.ZIP.Open(ZIP_FN)
+    DSS.ZIP.Redirect('13Bus/IEEE13Nodeckt.dss')
+    DSS.ZIP.Close()
+    DSS.ActiveCircuit.Solution.Solve()
+
+
+def _report(name: str, timings):
+    '''Prints the best time per call (in µs) for each labeled statement, relative to the first one.'''
+    base = None
+    for label, dt in timings:
+        if base is None:
+            base = dt
+
+        print(f'{name:>20s} | {label:<40s} {dt * 1e6:9.3f} µs/call  ({base / dt:5.2f}x)')
+
+
+def _best_time(func, number: int = 20000, repeat: int = 5) -> float:
+    return min(Timer(func).repeat(repeat=repeat, number=number)) / number
+
+
+def bench_scratch_pointers():
+    '''
+    Per-call overhead of the non-GR array getters, using the persistent scratch cells from
+    CffiApiUtil versus allocating new pointer/count cells (and disposing the data) on every call.
+    The target is `CktElement.Powers` for a 3-phase line (12 values).
+    '''
+    _load_13bus()
+    api_util = DSS._api_util
+    ffi, lib = api_util.ffi, api_util.lib
+    DSS.ActiveCircuit.SetActiveElement('Line.650632')
+
+    def per_call_new(func=lib.CktElement_Get_Powers):
+        ptr = ffi.new('double**')
+        cnt = ffi.new('int32_t[4]')
+        func(ptr, cnt)
+        res = np.frombuffer(ffi.buffer(ptr[0], cnt[0] * 8), dtype=np.float64).copy()
+        lib.DSS_Dispose_PDouble(ptr)
+        return res
+
+    def scratch(func=lib.CktElement_Get_Powers, get_float64_array=api_util.get_float64_array):
+        return get_float64_array(func)
+
+    np.testing.assert_equal(per_call_new(), scratch())
+    _report('scratch_pointers', [
+        ('ffi.new per call', _best_time(per_call_new)),
+        ('CffiApiUtil.get_float64_array', _best_time(scratch)),
+    ])
+
+
+def bench_deferred_errors():
+    '''
+    Tight loop reading scalar properties of all circuit elements through `ICktElement` (10 passes 
+    over the circuit), with the default error checks versus a single `DSS.deferred_errors()` block.
+    '''
+    _load_13bus()
+    circ = DSS.ActiveCircuit
+    elem = circ.ActiveCktElement
+    names = circ.AllElementNames * 10
+
+    def read_all():
+        res = []
+        for name in names:
+            circ.SetActiveElement(name)
+            res.append((elem.Name, elem.NumPhases, elem.NumConductors, elem.NumTerminals, elem.Enabled, elem.HasSwitchControl))
+
+        return res
+
+    def read_all_deferred():
+        with DSS.deferred_errors():
+            return read_all()
+
+    assert read_all() == read_all_deferred()
+    _report('deferred_errors', [
+        ('default error checks', _best_time(read_all, number=50, repeat=10)),
+        ('DSS.deferred_errors()', _best_time(read_all_deferred, number=50, repeat=10)),
+    ])
+
+
+def _rss_kib() -> int:
+    '''Current resident set size, in KiB (Linux only).'''
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def bench_new_context(num_contexts: int = 1000):
+    '''
+    Time and memory (RSS) to create new DSS Contexts with `DSS.NewContext()`, then to access
+    a few common interfaces of each one. Most of the memory is allocated by the DSS engine itself.
+    '''
+    gc.collect()
+    rss_start = _rss_kib()
+    t0 = perf_counter()
+    contexts = [DSS.NewContext() for _ in range(num_contexts)]
+    t1 = perf_counter()
+    rss_created = _rss_kib()
+    for ctx in contexts:
+        ctx.ActiveCircuit.Loads
+        ctx.ActiveCircuit.Solution
+        ctx.Text
+
+    t2 = perf_counter()
+    rss_accessed = _rss_kib()
+    print(f'{"new_context":>20s} | {num_contexts} contexts: {(t1 - t0) * 1e3 / num_contexts:7.3f} ms/context, {(rss_created - rss_start) / num_contexts:8.1f} KiB/context')
+    print(f'{"new_context":>20s} | first access to 3 interfaces: {(t2 - t1) * 1e6 / num_contexts:7.3f} µs/context, {(rss_accessed - rss_created) / num_contexts:8.1f} KiB/context')
+
+
+def bench_interface_access():
+    '''
+    Warm access to the sub-interfaces, created on first access by `LazyInterface` and then read
+    from the instance `__dict__`, compared to a plain slot read (as used when all the interfaces
+    were created with the context).
+    '''
+    _load_13bus()
+    circ = DSS.ActiveCircuit
+    loads = circ.Loads
+    loads.First
+
+    class Slotted:
+        __slots__ = ('ActiveCircuit', 'Loads')
+
+    slotted = Slotted()
+    slotted.ActiveCircuit = circ
+    slotted.Loads = loads
+    _report('interface_access', [
+        ('slot read (reference)', _best_time(lambda: slotted.ActiveCircuit, number=1000000)),
+        ('DSS.ActiveCircuit', _best_time(lambda: DSS.ActiveCircuit, number=1000000)),
+        ('ActiveCircuit.Loads', _best_time(lambda: circ.Loads, number=1000000)),
+        ('slot reads + Loads.kW (reference)', _best_time(lambda: slotted.ActiveCircuit and slotted.Loads.kW, number=200000)),
+        ('DSS.ActiveCircuit.Loads.kW', _best_time(lambda: DSS.ActiveCircuit.Loads.kW, number=200000)),
+    ])
+
+
+def bench_import_time(repeat: int = 5):
+    '''
+    Time to import DSS-Python in a new process (best of `repeat` runs), from `python -X importtime`,
+    and the time to create the prime instance (`dss.DSS`) on first access.
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get('PYTHONPATH', '')])
+    code = 'import dss; from time import perf_counter; t = perf_counter(); dss.DSS; print(perf_counter() - t)'
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, capture_output=True, text=True, check=True)
+        line = [line for line in proc.stderr.splitlines() if line.endswith('| dss')][-1]
+        self_us, cumulative_us = (int(v) for v in line[len('import time:'):].split('|')[:2])
+        run = (cumulative_us, self_us, float(proc.stdout) * 1e6)
+        if best is None or run < best:
+            best = run
+
+    cumulative_us, self_us, prime_us = best
+    print(f'{"import_time":>20s} | import dss: {self_us / 1e3:8.3f} ms (self), {cumulative_us / 1e3:8.3f} ms (cumulative); first access to dss.DSS: {prime_us / 1e3:8.3f} ms')
+
+
+def bench_bulk_new(num_loads: int = 10000, repeat: int = 3):
+    '''
+    Creation of loads from columnar data, using `ActiveCircuit.bulk_new` versus formatting
+    and running one `Text.Command` per load.
+    '''
+    names = [f'load{i}' for i in range(num_loads)]
+    buses = [f'bus{i % 1000}.{i % 3 + 1}' for i in range(num_loads)]
+    kw = np.random.default_rng(0).uniform(1, 10, num_loads)
+    kvar = kw * 0.3
+
+    def naive():
+        text = DSS.Text
+        for name, bus, p, q in zip(names, buses, kw, kvar):
+            text.Command = f'new Load.{name} bus1={bus} phases=1 kV=0.24 kW={p} kvar={q}'
+
+    def bulk():
+        DSS.ActiveCircuit.bulk_new('Load', names, bus1=buses, phases=1, kV=0.24, kW=kw, kvar=kvar)
+
+    timings = []
+    for label, func in (('Text.Command per load', naive), ('ActiveCircuit.bulk_new', bulk)):
+        best = None
+        for _ in range(repeat):
+            DSS.ClearAll()
+            DSS.Text.Command = 'new circuit.bulk_new'
+            t0 = perf_counter()
+            func()
+            dt = (perf_counter() - t0) / num_loads
+            best = dt if best is None else min(best, dt)
+
+        assert DSS.ActiveCircuit.Loads.Count == num_loads
+        timings.append((label, best))
+
+    _report('bulk_new', timings)
+
+
+def bench_set_all(num_loads: int = 10000, number: int = 20, repeat: int = 5):
+    '''
+    Setting a property for all the loads with `Loads.set_all`, which collects the indices of
+    the iterated elements in a single pass, compared to the plain loop over `First`/`Next`.
+    '''
+    DSS.ClearAll()
+    DSS.Text.Command = 'new circuit.set_all'
+    names = [f'load{i}' for i in range(num_loads)]
+    DSS.ActiveCircuit.bulk_new('Load', names, bus1=[f'bus{i % 1000}' for i in range(num_loads)], kV=0.24, kW=1.0)
+    loads = DSS.ActiveCircuit.Loads
+    kw = np.random.default_rng(0).uniform(1, 10, num_loads)
+    kw_list = kw.tolist()
+
+    def plain():
+        idx = loads.First
+        i = 0
+        while idx != 0:
+            loads.kW = kw_list[i]
+            i += 1
+            idx = loads.Next
+
+    timings = [
+        ('plain loop (First/Next + kW)', _best_time(plain, number, repeat) / num_loads),
+        ('Loads.set_all', _best_time(lambda: loads.set_all('kW', kw), number, repeat) / num_loads),
+        ('Loads.set_all (by index)', _best_time(lambda: loads.set_all('kW', kw, range(1, num_loads + 1)), number, repeat) / num_loads),
+    ]
+    DSS.ActiveCircuit.Settings.IterateDisabled = True
+    try:
+        timings.append(('Loads.set_all (IterateDisabled)', _best_time(lambda: loads.set_all('kW', kw), number, repeat) / num_loads))
+    finally:
+        DSS.ActiveCircuit.Settings.IterateDisabled = False
+
+    assert np.array_equal(loads.to_columns(['kW'])['kW'], kw)
+    _report('set_all', timings)
+
+
+def _python_postprocessing(ctx: IDSS):
+    # Deliberately GIL-bound post-processing
+    volts = ctx.ActiveCircuit.AllBusVmagPu.tolist()
+    return [sum(v * v for v in volts[:i]) for i in range(len(volts))]
+
+
+def bench_map_scenarios(num_scenarios: int = 400, workers: int = None):
+    '''
+    Scenario sweep (load multipliers) on the IEEE 13 bus circuit with `dss.parallel.map_scenarios`, 
+    collecting the bus voltages and a GIL-bound Python post-processing result, for each backend.
+    The process backends include the cost of starting the processes.
+    '''
+    from dss.parallel import map_scenarios
+
+    scenarios = [{'LoadMult': m} for m in np.linspace(0.5, 1.5, num_scenarios)]
+    extractors = ['AllBusVmagPu', _python_postprocessing]
+    timings = []
+    for backend in ('threads', 'processes', 'fork'):
+        t0 = perf_counter()
+        res = map_scenarios(_load_13bus, scenarios, extractors, workers=workers, backend=backend)
+        timings.append((f'backend={backend}', (perf_counter() - t0) / num_scenarios))
+        assert res.converged.all()
+
+    _report(f'map_scenarios (workers={workers or os.cpu_count()})', timings)
+
+
+def bench_recorder(num_steps: int = 2000, repeat: int = 3):
+    '''
+    Yearly simulation of the IEEE 13 bus circuit recording voltages and currents, using one Monitor
+    per line (reading the results with `AsMatrix`) versus a `dss.recorder.Recorder` of the bulk getters
+    for all node voltages and the currents of all PD elements. Includes the time to solve the circuit,
+    reported without any recording as the first row.
+    '''
+    from dss.recorder import Recorder
+
+    def setup(monitors: bool):
+        _load_13bus()
+        circ = DSS.ActiveCircuit
+        lines = list(circ.Lines.AllNames)
+        if monitors:
+            DSS.Text.Commands([f'new Monitor.{name} element=Line.{name} terminal=1 mode=0' for name in lines])
+
+        circ.Solution.Mode = SolveModes.Yearly
+        circ.Solution.Number = num_steps
+        return circ, lines
+
+    def plain():
+        circ, _ = setup(False)
+        t0 = perf_counter()
+        circ.Solution.Solve()
+        return perf_counter() - t0
+
+    def monitors():
+        circ, lines = setup(True)
+        t0 = perf_counter()
+        circ.Solution.Solve()
+        mons = circ.Monitors
+        data = [mons.AsMatrix() for _ in mons]
+        return perf_counter() - t0
+
+    def recorder():
+        circ, lines = setup(False)
+        t0 = perf_counter()
+        with Recorder(DSS, ['AllBusVolts', 'PDElements.AllCurrents'], capacity=num_steps) as rec:
+            circ.Solution.Solve()
+
+        data = rec.data
+        return perf_counter() - t0
+
+    timings = []
+    for label, func in (('no recording', plain), ('Monitors + AsMatrix', monitors), ('Recorder', recorder)):
+        timings.append((label, min(func() for _ in range(repeat)) / num_steps))
+
+    _report('recorder', timings)
+
+
+def bench_monitors_export(num_steps: int = 8760, repeat: int = 5):
+    '''
+    Reading the results of 90 monitors (3 per line of the IEEE 13 bus circuit) after a yearly simulation,
+    looping with `AsMatrix` and `Header` versus `Monitors.export_all`.
+    '''
+    _load_13bus()
+    circ = DSS.ActiveCircuit
+    lines = ['650632', '632670', '670671']
+    DSS.Text.Commands([f'new Monitor.m{i}_{name} element=Line.{name} terminal=1 mode=0' for i in range(30) for name in lines])
+    circ.Solution.Mode = SolveModes.Yearly
+    circ.Solution.Number = num_steps
+    circ.Solution.Solve()
+    mons = circ.Monitors
+
+    def loop():
+        return {mons.Name: (mons.AsMatrix(), mons.Header) for _ in mons}
+
+    _report('monitors_export', [
+        ('AsMatrix + Header loop', _best_time(loop, number=1, repeat=repeat)),
+        ('export_all', _best_time(mons.export_all, number=1, repeat=repeat)),
+    ])
+
+
+if __name__ == '__main__':
+    DSS.AllowForms = False
+    benchmarks = {
+        name[6:]: func
+        for name, func in list(globals().items())
+        if name.startswith('bench_') and callable(func)
+    }
+    for name in (sys.argv[1:] or benchmarks.keys()):
+        benchmarks[name]()
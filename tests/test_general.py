@@ -1,7 +1,7 @@
 # NOTE: This file is used to test some of the extensions or more complex behaviors of 
 #       the DSS engine and API state. The validation through compare_outputs.py
 #       covers detailed check of API states, etc.
-import sys, os, itertools, threading
+import sys, os, itertools, threading, subprocess, multiprocessing
 from time import perf_counter
 from math import sqrt, pi
 import numpy as np
@@ -937,6 +937,1041 @@ def test_path_sideeffects():
     test_loadshape_save()
 
 
+def _load_13bus_zip(DSS: IDSS = DSS):
+    DSS.ZIP.Open(ZIP_FN)
+    DSS.ZIP.Redirect('13Bus/IEEE13Nodeckt.dss')
+    DSS.ZIP.Close()
+    DSS.ActiveCircuit.Solution.Solve()
+
+
+def test_borrowed_gr_arrays():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    expected_vmag = circ.AllBusVmagPu
+    expected_volts = circ.AllBusVolts
+    assert not isinstance(expected_vmag, dss.GRView)
+
+    with DSS.borrowed_gr_arrays():
+        assert DSS.BorrowedGRArrays
+        vmag = circ.AllBusVmagPu
+        assert isinstance(vmag, dss.GRView)
+        assert vmag.valid
+        assert not vmag.flags.writeable
+        npt.assert_equal(vmag, expected_vmag)
+        with pytest.raises(ValueError):
+            vmag[0] = 1.0
+
+        # Slices share the buffer, results from ufuncs and copies don't
+        assert vmag[1:].valid
+        assert type(vmag * 2) is np.ndarray
+        vmag_copy = vmag.copy()
+        assert type(vmag_copy) is np.ndarray
+
+        # The next GR call invalidates the previous view
+        volts = circ.AllBusVolts
+        assert not vmag.valid
+        assert volts.valid
+        npt.assert_equal(volts, expected_volts)
+        npt.assert_equal(vmag_copy, expected_vmag)
+
+    assert not DSS.BorrowedGRArrays
+    assert not isinstance(circ.AllBusVmagPu, dss.GRView)
+
+
+def test_read_into():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    num_steps = 3
+    vmag = np.zeros((num_steps, circ.NumNodes))
+    for step in range(num_steps):
+        circ.Solution.LoadMult = 0.9 + 0.1 * step
+        circ.Solution.Solve()
+        row = vmag[step]
+        assert circ.read_into('AllBusVmagPu', row) is row
+        npt.assert_equal(row, circ.AllBusVmagPu)
+
+    assert max(abs(vmag[0] - vmag[-1])) > 1e-3
+
+    volts = np.empty(circ.NumNodes, dtype=complex)
+    circ.read_into('AllBusVolts', volts)
+    npt.assert_equal(volts, circ.AllBusVolts.view(dtype=complex))
+
+    pd = circ.PDElements
+    max_currents = np.empty(pd.Count)
+    pd.read_into('AllMaxCurrents', max_currents, True)
+    npt.assert_equal(max_currents, pd.AllMaxCurrents(True))
+
+    with pytest.raises(ValueError):
+        circ.read_into('AllBusVmagPu', np.empty(circ.NumNodes + 1))
+
+    with pytest.raises(TypeError):
+        circ.read_into('AllNodeNames', np.empty(circ.NumNodes))
+
+    # Make sure the destination was not left pending
+    assert type(circ.AllBusVmagPu) is np.ndarray
+
+
+def test_cached_name_lists():
+    DSS('''
+        clear
+        new circuit.test_names
+        new line.line1 bus1=sourcebus bus2=b2
+        new load.load1 bus1=b2 kw=10
+    ''')
+    circ = DSS.ActiveCircuit
+    circ.Solution.Solve()
+    expected = circ.AllNodeNames, circ.AllBusNames, circ.YNodeOrder, circ.Loads.AllNames
+    assert type(expected[0]) is list
+
+    DSS.CachedNameLists = True
+    try:
+        node_names = circ.AllNodeNames
+        assert type(node_names) is tuple
+        assert node_names is circ.AllNodeNames
+        assert (list(node_names), list(circ.AllBusNames), list(circ.YNodeOrder), list(circ.Loads.AllNames)) == expected
+
+        # New elements are visible even before the bus list is rebuilt
+        DSS('new load.load2 bus1=b3 kw=10')
+        assert circ.Loads.AllNames == ('load1', 'load2')
+
+        # Rebuilding the bus list invalidates the cache
+        circ.Solution.Solve()
+        assert circ.AllBusNames == ('sourcebus', 'b2', 'b3')
+        assert circ.AllNodeNames is not node_names
+        assert circ.AllNodeNames[-3:] == ('b3.1', 'b3.2', 'b3.3')
+        assert circ.YNodeOrder[-3:] == ('B3.1', 'B3.2', 'B3.3')
+
+        # Commands may change the names without changing the count, so they invalidate the cache
+        load_names = circ.Loads.AllNames
+        assert circ.Loads.AllNames is load_names
+        circ.Solution.Solve()
+        assert circ.Loads.AllNames is load_names
+        DSS.Text.Command = 'load.load2.kw=20'
+        assert circ.Loads.AllNames is not load_names
+        assert circ.Loads.AllNames == load_names
+
+        DSS('''
+            clear
+            new circuit.test_names2
+        ''')
+        assert circ.AllBusNames == ()
+        assert circ.Loads.AllNames == ('NONE',)
+    finally:
+        DSS.CachedNameLists = False
+
+    assert type(circ.AllNodeNames) is list
+
+
+def test_name_lookups():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    bus_to_index = circ.BusNameToIndex
+    assert bus_to_index is circ.BusNameToIndex
+    assert bus_to_index == {name: idx for idx, name in enumerate(circ.AllBusNames)}
+    assert circ.NodeNameToIndex == {name: idx for idx, name in enumerate(circ.AllNodeNames)}
+    assert circ.YNodeNameToIndex == {name.lower(): idx for idx, name in enumerate(circ.YNodeOrder)}
+    with pytest.raises(TypeError):
+        bus_to_index['new_bus'] = 0
+
+    element_to_index = circ.ElementNameToIndex
+    assert len(element_to_index) == circ.NumCktElements
+    for name in circ.Loads.AllNames:
+        cls_name, idx = element_to_index[f'load.{name}']
+        assert cls_name == 'Load'
+        circ.Loads.idx = idx
+        assert circ.Loads.Name == name
+
+    # New elements are picked up by the element map, new buses after the bus list is rebuilt
+    DSS('new load.new_load bus1=new_bus kw=1')
+    assert element_to_index is not circ.ElementNameToIndex
+    assert circ.ElementNameToIndex['load.new_load'] == ('Load', circ.Loads.Count)
+    circ.Solution.Solve()
+    assert circ.BusNameToIndex['new_bus'] == circ.NumBuses - 1
+    assert circ.NodeNameToIndex['new_bus.1'] == circ.AllNodeNames.index('new_bus.1')
+
+
+def test_to_columns():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    loads = circ.Loads
+    cols = loads.to_columns(['Name', 'kW', 'Phases', 'IsDelta', 'Model', 'ZIPV'])
+    assert list(cols.keys()) == ['Name', 'kW', 'Phases', 'IsDelta', 'Model', 'ZIPV']
+    assert cols['Name'] == list(loads.AllNames)
+    np.testing.assert_equal(cols['kW'], [l.kW for l in loads])
+    assert cols['kW'].dtype == np.float64
+    np.testing.assert_equal(cols['Phases'], [l.Phases for l in loads])
+    assert cols['IsDelta'].dtype == np.bool_
+    np.testing.assert_equal(cols['IsDelta'], [l.IsDelta for l in loads])
+    assert cols['Model'] == [l.Model for l in loads]
+    np.testing.assert_equal(cols['ZIPV'], [l.ZIPV for l in loads])
+
+    # Default columns, skipping methods with arguments
+    cols = circ.LineCodes.to_columns()
+    assert list(cols.keys()) == circ.LineCodes._columns
+    assert 'Rmatrix' not in circ.LineGeometries.to_columns()
+    assert len(cols['Name']) == circ.LineCodes.Count
+
+    cols = circ.PDElements.to_columns(['Name', 'IsShunt'])
+    assert cols['Name'] == list(circ.PDElements.AllNames)
+    assert cols['IsShunt'].sum() == circ.Capacitors.Count
+
+    # Disabled elements are skipped, as in the iteration
+    DSS('disable load.671')
+    cols = loads.to_columns(['Name', 'kW'])
+    assert len(cols['kW']) == len(cols['Name']) == loads.Count - 1
+    assert '671' not in cols['Name']
+
+    with pytest.raises(AttributeError):
+        loads.to_columns(['NotAProperty'])
+
+    # The plans are cached per property, not per combination of properties
+    from dss._cffi_api_util import _column_plans
+    num_plans = len(_column_plans)
+    loads.to_columns(['kW', 'Name'])
+    loads.to_columns(['Phases', 'kW', 'Name', 'kW'])
+    assert len(_column_plans) == num_plans
+
+
+def test_column_tables():
+    # The direct DSS C-API functions in the `_column_getters`/`_column_setters` tables must
+    # match the Python properties, including any conversion they do
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    lib = DSS._api_util.lib
+    interfaces = {}
+    for name in dir(type(circ)):
+        obj = getattr(circ, name) if not name.startswith('_') else None
+        if hasattr(obj, 'to_columns'):
+            interfaces.setdefault(type(obj), obj)
+
+    def read(obj, prop):
+        values = []
+        idx = obj.First
+        while idx != 0:
+            values.append(getattr(obj, prop))
+            idx = obj.Next
+
+        return values
+
+    assert len(interfaces) >= 29
+    for cls, obj in interfaces.items():
+        cols = obj.to_columns(list(cls._column_getters))
+        for prop, func_name in cls._column_getters.items():
+            assert hasattr(lib, func_name)
+            expected = read(obj, prop)
+            if isinstance(cols[prop], list):
+                assert cols[prop] == expected, (cls.__name__, prop)
+            else:
+                npt.assert_equal(cols[prop], np.array(expected, dtype=cols[prop].dtype), err_msg=f'{cls.__name__}.{prop}')
+
+        for prop, func_name in cls._column_setters.items():
+            assert hasattr(lib, func_name)
+            before = read(obj, prop)
+            obj.set_all(prop, np.array(before, dtype=float))
+            npt.assert_allclose(np.array(read(obj, prop), dtype=float), np.array(before, dtype=float), rtol=1e-12, err_msg=f'{cls.__name__}.{prop}')
+
+
+def test_set_all():
+    _load_13bus_zip()
+    loads = DSS.ActiveCircuit.Loads
+    kw = loads.to_columns(['kW'])['kW']
+    loads.set_all('kW', kw * 2)
+    np.testing.assert_equal([l.kW for l in loads], kw * 2)
+
+    loads.set_all('kvar', [1.5, 2.5], ['671', '634A'])
+    loads.Name = '634a'
+    assert loads.kvar == 2.5
+    loads.set_all('kvar', 7.0, [1, 3])
+    loads.idx = 3
+    assert loads.kvar == 7.0
+
+    # Setters that are not simple are also supported
+    loads.set_all('daily', 'default')
+    assert all(l.daily == 'default' for l in loads)
+
+    with pytest.raises(KeyError):
+        loads.set_all('kW', [1.0, 2.0], ['671', 'not_a_load'])
+    with pytest.raises(IndexError):
+        loads.set_all('kW', [1.0], [loads.Count + 1])
+    kw = loads.to_columns(['kW'])['kW']
+    with pytest.raises(ValueError):
+        loads.set_all('kW', [1.0, 2.0])
+    with pytest.raises(AttributeError):
+        loads.set_all('NotAProperty', 1.0)
+
+    # Nothing is changed if the number of values is wrong
+    npt.assert_equal(loads.to_columns(['kW'])['kW'], kw)
+
+    # Disabled elements are skipped, unless IterateDisabled is set
+    DSS('disable load.671')
+    count = loads.Count
+    loads.set_all('kW', np.arange(count - 1))
+    with pytest.raises(ValueError):
+        loads.set_all('kW', np.arange(count))
+
+    DSS.ActiveCircuit.Settings.IterateDisabled = 1
+    try:
+        loads.set_all('kW', np.arange(count))
+        npt.assert_equal(loads.to_columns(['kW'])['kW'], np.arange(count))
+        with pytest.raises(ValueError):
+            loads.set_all('kW', np.arange(count - 1))
+    finally:
+        DSS.ActiveCircuit.Settings.IterateDisabled = 0
+
+    # The values are validated as usual, with a single error check
+    with pytest.raises(DSSException):
+        loads.set_all('Phases', [1, 0], [1, 2])
+
+
+def test_deferred_errors():
+    _load_13bus_zip()
+    loads = DSS.ActiveCircuit.Loads
+    loads.First
+    with pytest.raises(DSSException):
+        with DSS.deferred_errors():
+            loads.Phases = 0
+            # No exception inside the block
+            assert loads.Phases > 0
+            with DSS.deferred_errors():
+                pass
+            
+            loads.Next
+
+    # Back to normal
+    with pytest.raises(DSSException):
+        loads.Phases = 0
+
+    with DSS.deferred_errors():
+        values = [l.kW for l in loads]
+
+    assert values == [l.kW for l in loads]
+
+    # Interfaces created inside the block are deferred too
+    ctx = DSS.NewContext()
+    ctx.Text.Command = 'new circuit.deferred'
+    with pytest.raises(DSSException):
+        with ctx.deferred_errors():
+            ctx.ActiveCircuit.Loads.Name = 'nonexistent'
+            ctx.ActiveCircuit.Loads.Phases = 0
+
+    # ...and so are the checks from the name list cache
+    with pytest.raises(DSSException):
+        with ctx.deferred_errors():
+            ctx.ActiveCircuit.Loads.Name = 'nonexistent'
+            ctx.ActiveCircuit.Loads.AllNames
+
+
+def test_case_aliases():
+    _load_13bus_zip()
+    loads = DSS.ActiveCircuit.Loads
+    loads.First
+    try:
+        set_case_insensitive_attributes(True, False)
+        assert DSS.activecircuit.LOADS.name == loads.Name
+        loads.kw = 1.5
+        assert loads.kW == 1.5
+        loads.KW = 2.5
+        assert loads.kW == 2.5
+        # Other capitalizations are resolved on first read
+        assert loads.nAME == loads.Name
+        assert 'nAME' in type(loads).__dict__
+        # Assignments only go through the aliases, without a __setattr__ hook
+        assert '__setattr__' not in vars(dss._cffi_api_util.Base)
+        with pytest.raises(AttributeError):
+            loads.KvAr = 3.5
+        with pytest.raises(AttributeError):
+            DSS.ALLOWforms = False
+
+        loads.KvAr
+        loads.KvAr = 3.5
+        assert loads.kvar == 3.5
+        DSS.ALLOWforms
+        DSS.ALLOWforms = False
+        assert DSS.AllowForms == False
+
+        set_case_insensitive_attributes(True, False, fallback=False)
+        assert loads.name == loads.Name
+        with pytest.raises(AttributeError):
+            loads.nAmE
+        with pytest.raises(AttributeError):
+            loads.KvAR = 1.5
+    finally:
+        set_case_insensitive_attributes(False, False)
+
+    with pytest.raises(AttributeError):
+        loads.name
+    assert 'name' not in type(loads).__dict__
+
+
+def test_lazy_interfaces():
+    ctx = DSS.NewContext()
+    circ = ctx.ActiveCircuit
+    assert ctx.Circuits is circ
+    assert 'Loads' not in vars(circ)
+    loads = circ.Loads
+    assert vars(circ)['Loads'] is loads
+    assert circ.Loads is loads
+    assert circ.ISources is circ.Isources
+    assert vars(circ)['ISources'] is vars(circ)['Isources']
+
+    # Only existing attributes can be assigned, so typos are not silently accepted
+    with pytest.raises(AttributeError):
+        ctx.AllowFormz = True
+    with pytest.raises(AttributeError):
+        circ.Foo = 1
+    with pytest.raises(AttributeError):
+        circ.Loads = None
+
+    ctx.AllowForms = False
+    assert not ctx.AllowForms and 'AllowForms' not in vars(ctx)
+
+    ctx.Text.Command = 'new circuit.test_lazy'
+    ctx.Text.Command = 'new load.load1 bus1=bus1 kw=1'
+    assert loads.AllNames == ['load1']
+    assert DSS.ActiveCircuit.Loads is not loads
+
+
+def _run_python(code: str):
+    '''Runs `code` in a new Python process, with this copy of DSS-Python in the path.'''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(dss.__file__)), env.get('PYTHONPATH', '')])
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
+
+
+def test_import_time():
+    # The prime instance is only created on first use, and its sub-interfaces on first access
+    _run_python('''if True:
+        import gc, dss
+        from dss._cffi_api_util import CffiApiUtil, Base
+
+        def created():
+            return [type(obj).__name__ for obj in gc.get_objects() if isinstance(obj, (CffiApiUtil, Base))]
+
+        assert not {"DSS", "DSS_GR", "api_util"} & set(vars(dss))
+        assert created() == [] and len(CffiApiUtil._ctx_to_util) == 0
+
+        assert dss.DSS is dss.DSS_GR is dss.dss and dss.api_util is dss.DSS._api_util
+        assert sorted(created()) == ['CffiApiUtil', 'IDSS']
+        assert list(dss.api_util._interfaces) == [dss.DSS]
+    ''')
+
+
+def test_packed_string_array():
+    api_util = DSS._api_util
+    ffi = api_util.ffi
+
+    def unpack(value):
+        _, ptrs, count = api_util.prepare_string_array(value)
+        return [ffi.string(ptrs[i]).decode() if ptrs[i] != ffi.NULL else None for i in range(count)]
+
+    assert unpack(['a', 'bé', '', 'xyz']) == ['a', 'bé', '', 'xyz']
+    assert unpack([b'a', None, 'c', '']) == ['a', None, 'c', '']
+    assert unpack(s for s in ('a', 'b')) == ['a', 'b']
+    assert unpack([]) == []
+    # Same as before for strings with NUL characters: truncated in C
+    assert unpack(['a\0b', 'c']) == ['a', 'c']
+
+    DSS.Text.Commands(['new circuit.test_packed'] + [f'new load.load{i} bus1=bus{i} kw=1' for i in range(100)])
+    assert DSS.ActiveCircuit.Loads.Count == 100
+    DSS.ActiveCircuit.SetActiveElement('load.load5')
+    DSS.ActiveCircuit.ActiveCktElement.BusNames = ['other_bus.1.2']
+    assert DSS.ActiveCircuit.ActiveCktElement.BusNames == ['other_bus.1.2']
+
+
+def test_command_stream():
+    def commands(n, bad=None):
+        yield 'new circuit.test_stream'
+        for i in range(n):
+            yield 'new foo.bar' if i == bad else f'new load.load{i} bus1=bus{i} kw=1'
+
+    assert DSS.Text.CommandStream(commands(250), chunk_size=100) == 251
+    assert DSS.ActiveCircuit.Loads.Count == 250
+
+    DSS.ClearAll()
+    with pytest.raises(DSSException, match=r'command stream: item 152 \(chunk 4, item 2\)'):
+        DSS.Text.CommandStream(commands(250, bad=150), chunk_size=50)
+
+    # Execution stops at the error
+    assert DSS.ActiveCircuit.Loads.Count == 150
+
+    # Items with multiple lines
+    DSS.ClearAll()
+    with pytest.raises(DSSException, match=r'command stream: item 2 \(chunk 1, item 2\)'):
+        DSS.Text.CommandStream(['new circuit.test_stream\nnew load.load1 bus1=bus1', 'new load.load2 bus1=bus1\nnew foo.bar'])
+
+    with pytest.raises(ValueError):
+        DSS.Text.CommandStream([], chunk_size=0)
+
+
+def test_bulk_new():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    num_loads = circ.Loads.Count
+    kw = np.arange(1, 101, dtype=float)
+    names = [f'bulk{i}' for i in range(100)]
+    assert circ.bulk_new('Load', names, bus1='671', kV=4.16, kW=kw, kvar=kw / 2, Vminpu=np.float64(0.85), daily=[''] * 100) == 100
+    assert circ.Loads.Count == num_loads + 100
+
+    cols = circ.Loads.to_columns(['Name', 'kW', 'kvar', 'kV'])
+    idx = cols['Name'].index('bulk41')
+    assert cols['kW'][idx] == 42
+    assert cols['kvar'][idx] == 21
+    assert cols['kV'][idx] == 4.16
+
+    circ.SetActiveElement('Load.bulk41')
+    assert circ.ActiveCktElement.BusNames[0] == '671'
+
+    # 0-d arrays are scalars
+    assert circ.bulk_new('Load', ['bulk_0d'], bus1='671', kV=np.array(4.16), kW=np.array(5.0), model=np.array(1)) == 1
+    circ.Loads.Name = 'bulk_0d'
+    assert circ.Loads.kW == 5 and circ.Loads.kV == 4.16
+
+    with pytest.raises(ValueError):
+        circ.bulk_new('Load', ['a', 'b'], kW=[1, 2, 3])
+
+    with pytest.raises(TypeError):
+        circ.bulk_new('Load', 'abc')
+
+    num_loads = circ.Loads.Count
+    for bad_name in ('x y', 'x\ty', 'x.y', 'x"y', "x'y", ''):
+        with pytest.raises(ValueError):
+            circ.bulk_new('Load', ['fine', bad_name], bus1='671', kW=1)
+
+    assert circ.Loads.Count == num_loads
+
+    with pytest.raises(DSSException):
+        circ.bulk_new('Load', ['bad'], foo=1)
+
+
+def test_compile_cached(tmp_path):
+    from zipfile import ZipFile
+    with ZipFile(ZIP_FN) as zf:
+        zf.extractall(tmp_path / 'src')
+
+    src_dir = tmp_path / 'src' / '13Bus'
+    master_fn = src_dir / 'IEEE13Nodeckt.dss'
+    (src_dir / 'shape.csv').write_text('0.5\n1.0\n0.75\n')
+    with open(master_fn, 'a') as f:
+        f.write('\nNew LoadShape.cached npts=3 interval=1 mult=(file=shape.csv)\n')
+
+    cache_dir = tmp_path / 'cache'
+    cwd, data_path = os.getcwd(), DSS.DataPath
+    try:
+        DSS.ClearAll()
+        assert not DSS.compile_cached(master_fn, cache_dir)
+        circ = DSS.ActiveCircuit
+        circ.Solution.Solve()
+        names, volts = circ.AllElementNames, circ.AllBusVolts
+        assert len(os.listdir(cache_dir)) == 1
+
+        DSS.ClearAll()
+        assert DSS.compile_cached(master_fn, cache_dir)
+        circ.Solution.Solve()
+        assert circ.AllElementNames == names
+        npt.assert_allclose(circ.AllBusVolts, volts, rtol=1e-4, atol=1e-3)
+        circ.LoadShapes.Name = 'cached'
+        npt.assert_equal(circ.LoadShapes.Pmult, [0.5, 1.0, 0.75])
+        assert os.path.samefile(DSS.DataPath, src_dir)
+
+        # Changing any of the dependencies invalidates the entry
+        (src_dir / 'shape.csv').write_text('0.5\n1.0\n0.8\n')
+        assert not DSS.compile_cached(master_fn, cache_dir)
+        assert DSS.compile_cached(master_fn, cache_dir)
+        circ.LoadShapes.Name = 'cached'
+        npt.assert_equal(circ.LoadShapes.Pmult, [0.5, 1.0, 0.8])
+        assert len(os.listdir(cache_dir)) == 1
+    finally:
+        os.chdir(cwd)
+        DSS.DataPath = data_path
+        DSS.ClearAll()
+
+
+def test_context_pool():
+    from dss.pool import ContextPool
+
+    def setup(ctx):
+        ctx.ZIP.Open(ZIP_FN)
+        ctx.ZIP.Redirect('13Bus/IEEE13Nodeckt.dss')
+        ctx.ZIP.Close()
+
+    def run(ctx, loadmult):
+        circ = ctx.ActiveCircuit
+        # The state from previous tasks must not leak
+        circ.SetActiveElement('Line.671692')
+        assert not circ.ActiveCktElement.IsOpen(1, 0)
+        assert circ.Solution.LoadMult == 1 and circ.Solution.Mode == SolveModes.SnapShot
+
+        circ.Solution.LoadMult = loadmult
+        circ.Solution.Mode = SolveModes.Daily
+        circ.Solution.Number = 1
+        circ.ActiveCktElement.Open(1, 0)
+        circ.Solution.Solve()
+        return circ.AllBusVolts
+
+    loadmults = [0.8, 0.9, 1.0, 1.1, 1.2] * 4
+    allow_change_dir = DSS.AllowChangeDir
+    with ContextPool(2, setup=setup) as pool:
+        assert len(pool) == 2
+        assert not DSS.AllowChangeDir
+        results = pool.map(run, loadmults)
+
+        with pool.checkout() as ctx:
+            ctx2 = pool.acquire()
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.01)
+
+            pool.release(ctx2)
+            with pytest.raises(ValueError):
+                pool.release(ctx2)
+
+        with pytest.raises(ValueError):
+            pool.release(DSS)
+
+        # Contexts are rebuilt after errors
+        with pytest.raises(ZeroDivisionError):
+            with pool.checkout() as ctx:
+                ctx.ActiveCircuit.Loads.First
+                ctx.ActiveCircuit.Loads.kW = 0
+                1 / 0
+
+        ctx = pool.acquire()
+        ctx2 = pool.acquire()
+        assert all(kW != 0 for kW in ctx.ActiveCircuit.Loads.to_columns(['kW'])['kW'])
+        assert all(kW != 0 for kW in ctx2.ActiveCircuit.Loads.to_columns(['kW'])['kW'])
+        pool.release(ctx)
+        pool.release(ctx2)
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    # Restored when the pool is closed; closing again is a no-op
+    assert DSS.AllowChangeDir == allow_change_dir
+    pool.close()
+
+    # Contexts returned after closing are just cleared
+    pool = ContextPool(1, setup=setup)
+    ctx = pool.acquire()
+    pool.close()
+    pool.release(ctx)
+    assert ctx.NumCircuits == 0
+    assert DSS.AllowChangeDir == allow_change_dir
+
+    # Overlapping pools, closed out of order: restored only after the last one
+    DSS.AllowChangeDir = True
+    pool_a = ContextPool(1)
+    pool_b = ContextPool(1)
+    pool_a.close()
+    assert not DSS.AllowChangeDir
+    pool_b.close()
+    assert DSS.AllowChangeDir
+    DSS.AllowChangeDir = allow_change_dir
+
+    # Compare to fresh circuits
+    for loadmult, volts in zip(loadmults, results):
+        setup(DSS)
+        assert run(DSS, loadmult) == pytest.approx(volts)
+
+
+def test_map_scenarios(tmp_path):
+    from zipfile import ZipFile
+    from dss.parallel import map_scenarios
+
+    with ZipFile(ZIP_FN) as zf:
+        zf.extractall(tmp_path)
+
+    master_fn = str(tmp_path / '13Bus' / 'IEEE13Nodeckt.dss')
+    allow_change_dir = DSS.AllowChangeDir
+
+    def num_loads(ctx):
+        return ctx.ActiveCircuit.Loads.Count
+
+    loadmults = [0.8, 0.9, 1.0, 1.1, 1.2] * 3
+    scenarios = [{'LoadMult': m} for m in loadmults]
+    scenarios.append({'LoadMult': 1.0, 'commands': 'new load.extra bus1=671 kw=100'})
+    scenarios.append({'Mode': SolveModes.Daily, 'Number': 2})
+    extractors = ['AllBusVolts', 'Losses', 'Solution.Iterations', num_loads, ('names', 'AllBusNames')]
+    res = map_scenarios(master_fn, scenarios, extractors, workers=3)
+    res_proc = map_scenarios(master_fn, scenarios[:3], ['AllBusVolts', 'Losses'], workers=2, backend='processes')
+    assert DSS.AllowChangeDir == allow_change_dir
+
+    assert len(res) == len(scenarios)
+    assert res['AllBusVolts'].shape == (len(scenarios), len(res['AllBusVolts'][0]))
+    assert res['Solution.Iterations'].dtype.kind == 'i'
+    assert res['names'].dtype == object
+    assert res.converged.all() and (res.timings > 0).all()
+    assert all(error is None for error in res.errors)
+
+    # Edits do not leak to the next scenarios
+    assert res['num_loads'][-2] == res['num_loads'][0] + 1
+    assert res['num_loads'][-1] == res['num_loads'][0]
+
+    for i, loadmult in enumerate(loadmults):
+        _load_13bus_zip()
+        DSS.ActiveCircuit.Solution.LoadMult = loadmult
+        DSS.ActiveCircuit.Solution.Solve()
+        npt.assert_allclose(res['AllBusVolts'][i], DSS.ActiveCircuit.AllBusVolts, rtol=1e-4, atol=1e-3)
+        if i < 3:
+            npt.assert_allclose(res_proc['AllBusVolts'][i], DSS.ActiveCircuit.AllBusVolts, rtol=1e-4, atol=1e-3)
+
+    with pytest.raises(ValueError):
+        map_scenarios(master_fn, [{'NotAProperty': 1}], extractors)
+
+    res_err = map_scenarios(master_fn, [{}, {'commands': 'foo bar'}], ['Losses'], workers=2, raise_errors=False)
+    assert res_err.errors[0] is None and isinstance(res_err.errors[1], DSSException)
+    assert np.isnan(res_err['Losses'][1]).all()
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # Lambdas are fine since the workers are forked; the ragged results are returned
+        # through pickling, the others are written to the shared memory
+        extractors = extractors + [('ragged', lambda ctx: np.ones(1 + (ctx.ActiveCircuit.Solution.LoadMult > 1)))]
+        res_fork = map_scenarios(master_fn, scenarios + [{'commands': 'foo bar'}], extractors, workers=2, backend='fork', raise_errors=False)
+        assert DSS.AllowChangeDir == allow_change_dir
+        assert all(error is None for error in res_fork.errors[:-1])
+        assert isinstance(res_fork.errors[-1], DSSException)
+        assert res_fork.converged[:-1].all() and not res_fork.converged[-1]
+        npt.assert_allclose(res_fork['AllBusVolts'][:-1], res['AllBusVolts'], rtol=1e-4, atol=1e-3)
+        assert np.isnan(res_fork['AllBusVolts'][-1]).all()
+        assert list(res_fork['num_loads'][:-1]) == list(res['num_loads'])
+        assert res_fork['ragged'].dtype == object
+        assert [len(r) for r in res_fork['ragged'][:len(loadmults)]] == [1 + (m > 1) for m in loadmults]
+
+
+def test_time_sliced():
+    from dss.parallel import run_time_sliced
+
+    def setup(ctx):
+        ctx.ZIP.Open(ZIP_FN)
+        ctx.ZIP.Redirect('13Bus/IEEE13Nodeckt.dss')
+        ctx.ZIP.Close()
+        mult = ' '.join(f'{0.6 + 0.4 * np.sin(i * pi / 24) ** 2:.4f}' for i in range(240))
+        ctx.Text.Commands([
+            'set controlmode=static',
+            f'new LoadShape.yearly npts=240 interval=1 mult=({mult})',
+            'batchedit Load..* yearly=yearly',
+            'new Monitor.vi element=Line.650632 terminal=1 mode=0',
+            'new Monitor.tap element=Transformer.Reg1 terminal=2 mode=2',
+            'new EnergyMeter.feeder element=Line.650632 terminal=1',
+        ])
+
+    allow_change_dir = DSS.AllowChangeDir
+    res = run_time_sliced(setup, 200, slices=3, warmup_steps=12)
+    assert DSS.AllowChangeDir == allow_change_dir
+
+    assert res.slices == [(0, 67), (67, 133), (133, 200)]
+    assert (res.timings > 0).all()
+
+    # Sequential run for comparison
+    setup(DSS)
+    circ = DSS.ActiveCircuit
+    circ.Solution.Mode = SolveModes.Yearly
+    circ.Solution.Number = 200
+    circ.Solution.Solve()
+    for name in ('vi', 'tap'):
+        circ.Monitors.Name = name
+        assert res.monitor_headers[name] == ['hour', 't(sec)'] + circ.Monitors.Header
+        npt.assert_allclose(res.monitors[name], circ.Monitors.AsMatrix(), rtol=1e-5)
+
+    circ.Meters.Name = 'feeder'
+    assert res.register_names == circ.Meters.RegisterNames
+    npt.assert_allclose(res.meters['feeder'], circ.Meters.RegisterValues, rtol=1e-6)
+
+    # With time-based controls, the state after the warm-up must match the sequential
+    # run at the first step of each slice
+    def setup_time(ctx):
+        setup(ctx)
+        ctx.Text.Command = 'set controlmode=time'
+
+    res = run_time_sliced(setup_time, 200, slices=3, warmup_steps=12)
+    setup_time(DSS)
+    circ.Solution.Mode = SolveModes.Yearly
+    circ.Solution.Number = 200
+    circ.Solution.Solve()
+    first_steps = [first for first, _ in res.slices]
+    circ.Monitors.Name = 'tap'
+    taps = circ.Monitors.AsMatrix()
+    assert len(np.unique(taps[:, 2])) > 1
+    npt.assert_equal(res.monitors['tap'][first_steps], taps[first_steps])
+    circ.Monitors.Name = 'vi'
+    npt.assert_allclose(res.monitors['vi'][first_steps], circ.Monitors.AsMatrix()[first_steps], rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        run_time_sliced(setup, 0)
+
+
+def test_recorder():
+    from dss.recorder import Recorder, element, meter
+
+    def setup():
+        _load_13bus_zip()
+        mult = ' '.join(f'{0.6 + 0.4 * np.sin(i * pi / 24) ** 2:.4f}' for i in range(240))
+        DSS.Text.Commands([
+            'set controlmode=static',
+            f'new LoadShape.yearly npts=240 interval=1 mult=({mult})',
+            'batchedit Load..* yearly=yearly',
+            'new Monitor.pq element=Line.650632 terminal=1 mode=1 ppolar=no',
+            'new EnergyMeter.feeder element=Line.650632 terminal=1',
+        ])
+        DSS.ActiveCircuit.Solution.Mode = SolveModes.Yearly
+
+    setup()
+    circ = DSS.ActiveCircuit
+    sol = circ.Solution
+    quantities = ['AllBusVmagPu', element('Line.650632', 'Powers'), meter('feeder'), 'Solution.Iterations', ('custom', lambda ctx: ctx.ActiveCircuit.TotalPower)]
+    rec = Recorder(DSS, quantities, capacity=16)
+    with rec:
+        sol.Number = 100
+        sol.Solve()
+
+    assert len(rec) == 100
+    npt.assert_equal(rec.times, np.arange(1, 101))
+    assert rec['AllBusVmagPu'].shape == (100, circ.NumNodes)
+    assert rec['Solution.Iterations'].shape == (100, 1)
+    assert set(rec.data.keys()) == {'AllBusVmagPu', 'Line.650632.Powers', 'EnergyMeter.feeder.RegisterValues', 'Solution.Iterations', 'custom'}
+
+    circ.Monitors.Name = 'pq'
+    npt.assert_allclose(rec['Line.650632.Powers'][:, :6], circ.Monitors.AsMatrix()[:, 2:], rtol=1e-5, atol=1e-3)
+    npt.assert_allclose(rec['AllBusVmagPu'][-1], circ.AllBusVmagPu)
+    npt.assert_allclose(rec['custom'][-1], circ.TotalPower)
+
+    # Detached, the solution is not sampled
+    sol.Number = 10
+    sol.Solve()
+    assert len(rec) == 100
+
+    # Python-driven loop, ring buffer, float32 and decimation
+    setup()
+    ring = Recorder(DSS, ['AllBusVmagPu'], capacity=5, ring=True, dtype=np.float32, decimation=3)
+    manual = Recorder(DSS, ['AllBusVmagPu'])
+    with ring:
+        sol.Number = 1
+        for _ in range(30):
+            sol.Solve()
+            manual.sample()
+
+    assert len(manual) == 30 and len(ring) == 5
+    assert ring['AllBusVmagPu'].dtype == np.float32
+    npt.assert_equal(ring.times, [16, 19, 22, 25, 28])
+    npt.assert_allclose(ring['AllBusVmagPu'], manual['AllBusVmagPu'][15::3], rtol=1e-6)
+
+    ring.clear()
+    assert len(ring) == 0
+
+    with pytest.raises(ValueError):
+        Recorder(DSS, ['AllBusVmagPu', 'AllBusVmagPu'])
+
+    with pytest.raises(TypeError):
+        Recorder(DSS, ['AllBusNames']).sample()
+
+
+def test_monitors_export_all(tmp_path):
+    _load_13bus_zip()
+    lines = ['650632', '632670', '670671']
+    DSS.Text.Commands([f'new Monitor.{name} element=Line.{name} terminal=1 mode=0' for name in lines])
+    circ = DSS.ActiveCircuit
+    sol = circ.Solution
+    sol.Mode = SolveModes.Daily
+    sol.Number = 24
+    sol.Solve()
+
+    mons = circ.Monitors
+    expected = {mons.Name: (mons.AsMatrix(), mons.Header) for _ in mons}
+    data, headers = mons.export_all()
+    assert data.shape == (3, 24, expected['650632'][0].shape[1])
+    assert data.dtype == np.float32
+    assert list(headers.keys()) == list(mons.AllNames)
+    for index, (name, (matrix, header)) in enumerate(expected.items()):
+        npt.assert_equal(data[index], matrix)
+        assert headers[name] == ['hour', 't(sec)'] + header
+
+    # The GR buffer is reused, so borrowed views are invalidated
+    with DSS.borrowed_gr_arrays():
+        vmag = circ.AllBusVmagPu
+        mons.export_all()
+        assert not vmag.valid
+
+    # Straight into a .npy file
+    fn = str(tmp_path / 'monitors.npy')
+    mm, _ = mons.export_all(fn)
+    npt.assert_equal(np.load(fn), data)
+    del mm
+
+    # Different shapes, returns a dict
+    DSS.Text.Command = 'new Monitor.pq element=Line.650632 terminal=1 mode=1'
+    sol.Number = 2
+    sol.Solve()
+    data, headers = mons.export_all()
+    assert set(data.keys()) == set(headers.keys()) == set(mons.AllNames)
+    mons.Name = 'pq'
+    npt.assert_equal(data['pq'], mons.AsMatrix())
+    assert headers['pq'][2:] == mons.Header
+    with pytest.raises(ValueError):
+        mons.export_all(fn)
+
+
+def test_npy_sink(tmp_path):
+    import json
+    from dss.sink import NpySink, load_sink
+    from dss.recorder import Recorder, element
+
+    _load_13bus_zip()
+    DSS.Text.Command = 'new Monitor.m1 element=Line.650632 terminal=1 mode=0'
+    circ = DSS.ActiveCircuit
+    sol = circ.Solution
+    sol.Mode = SolveModes.Yearly
+    sol.Number = 50
+    with NpySink(tmp_path, flush_every=10) as sink:
+        with Recorder(DSS, ['AllBusVmagPu', 'PDElements.AllCurrents', element('Line.650632')], capacity=8, sink=sink) as rec:
+            sol.Solve()
+
+        expected = {name: np.array(rec[name]) for name in rec.names}
+        npt.assert_equal(sink['hour'][:, 0], rec.times)
+        sink.add_monitors(DSS)
+
+    data, columns = load_sink(tmp_path)
+    assert set(data.keys()) == {'AllBusVmagPu', 'PDElements.AllCurrents', 'Line.650632.Powers', 'hour', 'Monitor.m1'}
+    for name, values in expected.items():
+        npt.assert_equal(data[name], values)
+
+    assert data['AllBusVmagPu'].shape == (50, circ.NumNodes)
+    assert columns['AllBusVmagPu'] == list(circ.AllNodeNames)
+    assert columns['PDElements.AllCurrents'][:2] == ['Transformer.sub.1.1.re', 'Transformer.sub.1.1.im']
+    assert columns['Line.650632.Powers'][:2] == ['0', '1']
+    circ.Monitors.Name = 'm1'
+    npt.assert_equal(data['Monitor.m1'], circ.Monitors.AsMatrix())
+    assert columns['Monitor.m1'] == ['hour', 't(sec)'] + circ.Monitors.Header
+
+    # Without closing the sink, only the flushed rows are listed
+    sink = NpySink(tmp_path / 'partial', flush_every=10)
+    sink.add('values', ['a', 'b'], capacity=4)
+    for i in range(25):
+        sink.append('values', [i, -i])
+
+    data, columns = load_sink(tmp_path / 'partial')
+    assert columns['values'] == ['a', 'b']
+    npt.assert_equal(data['values'][:, 0], np.arange(20))
+    sink.close()
+    npt.assert_equal(load_sink(tmp_path / 'partial')[0]['values'][:, 0], np.arange(25))
+
+    with pytest.raises(ValueError):
+        Recorder(DSS, ['AllBusVmagPu'], ring=True, sink=sink)
+
+    # The Recorder updates all quantities together, so the sidecar read mid-run lists
+    # the same number of rows for all of them, flushed every `flush_every` samples
+    sink = NpySink(tmp_path / 'mid_run', flush_every=3)
+    rec = Recorder(DSS, ['AllBusVmagPu', 'Solution.Iterations', ('custom', lambda ctx: [1.0, 2.0])], sink=sink)
+    for step in range(1, 11):
+        rec.sample()
+        with open(tmp_path / 'mid_run' / 'sink.json', 'r', encoding='utf-8') as f:
+            rows = {name: meta['rows'] for name, meta in json.load(f)['quantities'].items()}
+
+        assert set(rows.values()) == {step - step % 3}
+        data, _ = load_sink(tmp_path / 'mid_run')
+        assert len(set(len(values) for values in data.values())) == 1
+
+    sink.close()
+
+
+def test_ymatrix_vi_views():
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    ymatrix = DSS.YMatrix
+    circ.Solution.Solve()
+
+    V = ymatrix.V
+    assert V.dtype == np.complex128 and V.shape == (circ.NumNodes + 1,)
+    npt.assert_allclose(V[1:], circ.YNodeVarray.view(complex))
+    npt.assert_allclose(V, np.array(ymatrix.getV()).view(complex))
+    npt.assert_allclose(ymatrix.I, np.array(ymatrix.getI()).view(complex))
+
+    # Same view while the vector is not reallocated, and it follows the solution
+    assert ymatrix.V is V
+    circ.Solution.LoadMult = 0.5
+    circ.Solution.Solve()
+    npt.assert_allclose(V[1:], circ.YNodeVarray.view(complex))
+
+    # New nodes reallocate the vectors
+    DSS.Text.Command = 'new Load.extra bus1=extra.1.2.3 kw=100 kv=4.16'
+    DSS.Text.Command = 'new Line.extra bus1=680 bus2=extra length=0.1 units=km'
+    # The bus list is updated before the vectors, no views while the Y matrix is pending a rebuild
+    DSS.Text.Command = 'makebuslist'
+    assert ymatrix.SystemYChanged
+    assert ymatrix.V is None and ymatrix.I is None
+    circ.Solution.Solve()
+    V2 = ymatrix.V
+    assert V2 is not V and V2.shape == (circ.NumNodes + 1,)
+    npt.assert_allclose(V2[1:], circ.YNodeVarray.view(complex))
+
+
+def test_ymatrix_as_csc():
+    import scipy.sparse as sp
+
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    ymatrix = DSS.YMatrix
+    circ.Solution.Solve()
+
+    generation = ymatrix.generation
+    Y = ymatrix.as_csc()
+    assert isinstance(Y, sp.csc_matrix)
+    assert Y.shape == (circ.NumNodes, circ.NumNodes)
+    npt.assert_allclose(Y.toarray(), circ.SystemY.view(complex).reshape(Y.shape))
+
+    # Reused while the Y matrix is not rebuilt
+    circ.Solution.Solve()
+    assert ymatrix.generation == generation
+    assert ymatrix.as_csc() is Y
+    Y_copy = ymatrix.as_csc(copy=True)
+    assert Y_copy is not Y and (Y_copy != Y).nnz == 0
+
+    circ.Lines.Name = '650632'
+    circ.Lines.Length = 3000
+    circ.Solution.Solve()
+    assert ymatrix.generation > generation
+    Y2 = ymatrix.as_csc()
+    assert Y2 is not Y
+    npt.assert_allclose(Y2.toarray(), circ.SystemY.view(complex).reshape(Y.shape))
+    assert (Y2 != Y).nnz > 0
+
+
+def test_topology_matrices():
+    import scipy.sparse as sp
+
+    _load_13bus_zip()
+    circ = DSS.ActiveCircuit
+    sol = circ.Solution
+    sol.Solve()
+
+    inc = sol.incidence_matrix()
+    assert isinstance(inc.matrix, sp.csr_matrix)
+    DSS.Text.Command = 'CalcIncMatrix_O'
+    assert inc.rows == sol.IncMatrixRows and inc.cols == sol.IncMatrixCols
+    assert inc.matrix.shape == (len(inc.rows), len(inc.cols))
+    assert len(inc.cols) == circ.NumBuses
+    npt.assert_equal(inc.bus_levels, sol.BusLevels)
+    triplets = sol.IncMatrix[:-1].reshape((-1, 3))
+    npt.assert_equal(inc.matrix[triplets[:, 0], triplets[:, 1]].A1, triplets[:, 2])
+    assert inc.matrix.nnz == len(triplets)
+
+    lap = sol.laplacian()
+    assert lap.rows == lap.cols == inc.cols
+    assert (lap.matrix != inc.matrix.T @ inc.matrix).nnz == 0
+
+    unordered = sol.incidence_matrix(ordered=False)
+    assert unordered.bus_levels is None
+    assert sorted(unordered.cols) == sorted(inc.cols)
+
+    # Cached until the topology changes
+    sol.Solve()
+    assert sol.incidence_matrix() is inc
+    assert sol.laplacian() is lap
+    DSS.Text.Command = 'new Line.extra bus1=680 bus2=extra length=0.1 units=km'
+    sol.Solve()
+    inc2 = sol.incidence_matrix()
+    assert inc2 is not inc
+    assert inc2.matrix.shape == (inc.matrix.shape[0] + 1, inc.matrix.shape[1] + 1)
+    assert 'Line.extra' in inc2.rows and 'extra' in inc2.cols
+
+
 if __name__ == '__main__':
     DSS.AllowForms = False
     print(DSS.Version)